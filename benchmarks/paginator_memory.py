@@ -0,0 +1,87 @@
+""" Measures how much memory an open paginator keeps alive for each kind of payload.
+
+Usage:
+    python -m benchmarks.paginator_memory   # uses the pages saved by benchmarks.parse_benchmark --download
+"""
+
+import gc
+import os
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Tuple
+
+from others import scrapers
+from benchmarks.parse_benchmark import FIXTURES
+from cogs.Conjugation import Conjugation
+from cogs.Dictionaries import Dictionaries
+from cogs.Songs import Songs
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """ Gets how many bytes the built payload keeps allocated.
+    :param build: Builds the payload a paginator would hold. """
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    payload = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    del payload
+    return size
+
+
+def live_tags(markup: bytes, selector: Callable) -> Any:
+    """ Selects the tags the views used to hold, which keep the whole tree alive. """
+
+    return selector(scrapers.make_soup(markup))
+
+
+def pages(markup: bytes, parser: Callable, make_pages: Callable) -> Any:
+    """ Parses a page and keeps only its prebuilt paginator pages. """
+
+    return make_pages(parser(markup))
+
+
+# Fixture name -> (Tag selector, parser, page builder)
+PAGINATORS: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    'mijnwoordenboek.html': (
+        lambda html: scrapers.MIJNWOORDENBOEK['rows'].select(scrapers.MIJNWOORDENBOEK['content_box'].select_one(html))[1:],
+        scrapers.parse_mijnwoordenboek,
+        lambda rows: Conjugation.make_dutch_pages(None, "", "lopen", rows)),
+    'cambridge.html': (
+        lambda html: scrapers.CAMBRIDGE['entries'].select(scrapers.CAMBRIDGE['page'].select_one(html)),
+        scrapers.parse_cambridge,
+        lambda examples: Dictionaries.make_pages(None, "", "hello", examples)),
+    'lyrics.html': (
+        lambda html: scrapers.LYRICS['songs'].select(html),
+        scrapers.parse_lyrics,
+        lambda songs: Songs.make_pages(SimpleNamespace(lyrics="https://www.lyrics.com"), "", "hello", songs)),
+}
+
+
+def main() -> None:
+    """ Prints the retained memory of each payload kind per paginator. """
+
+    found = [name for name in PAGINATORS if os.path.isfile(os.path.join(FIXTURES, name))]
+    if not found:
+        print(f"No fixtures in {FIXTURES}, run benchmarks.parse_benchmark --download first.")
+        return
+
+    tracemalloc.start()
+    print(f"{'page':<24}{'live tags':>14}{'parsed data':>14}{'page records':>14}")
+    for name in found:
+        with open(os.path.join(FIXTURES, name), 'rb') as f:
+            markup = f.read()
+
+        selector, parser, make_pages = PAGINATORS[name]
+        sizes = (
+            retained(lambda: live_tags(markup, selector)),
+            retained(lambda: parser(markup)),
+            retained(lambda: pages(markup, parser, make_pages)),
+        )
+        print(f"{name:<24}" + ''.join(f"{size / 1024:>12.1f}KB" for size in sizes))
+    tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+""" Compares how long each HTML backend takes to parse and extract the scraped pages.
+
+Usage:
+    python -m benchmarks.parse_benchmark --download   # saves the sample pages into benchmarks/fixtures
+    python -m benchmarks.parse_benchmark              # times every saved page with every backend
+
+The pages aren't committed yet: no measurement has been made with real
+pages, so run --download first. Once saved, they can be committed for the
+timings to be compared between machines and changes.
+
+Pages whose parser only needs a section of them also report how much of the
+page is downloaded and whether the truncated page parses the same.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+from others import scrapers
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# Fixture name -> (sample URL, parser and its extra arguments)
+PAGES: Dict[str, Tuple[str, Callable, tuple]] = {
+    'reverso_conjugation.html': (
+        "https://conjugator.reverso.net/conjugation-portuguese-verb-falar.html",
+        scrapers.parse_reverso_conjugation, ('', False)),
+    'cooljugator.html': (
+        "https://cooljugator.com/sv/äta", scrapers.parse_cooljugator, ()),
+    'mijnwoordenboek.html': (
+        "https://www.mijnwoordenboek.nl/werkwoord/lopen", scrapers.parse_mijnwoordenboek, ()),
+    'cambridge.html': (
+        "https://dictionary.cambridge.org/us/dictionary/english/hello", scrapers.parse_cambridge, ()),
+    'verbformen.html': (
+        "https://www.verbformen.com/declension/nouns/?w=essen", scrapers.parse_verbformen, ()),
+    'openrussian.html': (
+        "https://en.openrussian.org/ru/работать", scrapers.parse_openrussian, ()),
+    'reverso_context.html': (
+        "https://context.reverso.net/translation/english-portuguese/hello", scrapers.parse_reverso_context, ()),
+    'lyrics.html': (
+        "https://www.lyrics.com/lyrics/hello", scrapers.parse_lyrics, ()),
+}
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/125.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+async def download() -> None:
+    """ Saves the sample pages into the fixtures folder. """
+
+    from others.http_client import HTTPClient
+
+    os.makedirs(FIXTURES, exist_ok=True)
+    client = HTTPClient()
+    try:
+        for name, (url, _, _) in PAGES.items():
+            async with client.get(url, headers=HEADERS) as response:
+                if response.status != 200:
+                    print(f"{name}: HTTP {response.status}, skipped")
+                    continue
+                with open(os.path.join(FIXTURES, name), 'wb') as f:
+                    f.write(await response.read())
+                print(f"{name}: saved")
+    finally:
+        await client.close()
+
+
+def available_backends() -> List[str]:
+    """ Gets the tree builders BeautifulSoup can use here. """
+
+    # The scrapers import lxml's etree when it's installed
+    return ['html.parser'] + (['lxml'] if scrapers.etree is not None else [])
+
+
+def benchmark(rounds: int) -> None:
+    """ Times every saved page with every backend.
+    :param rounds: How many times each page is parsed. """
+
+    backends = available_backends()
+    pages = [(name, *PAGES[name][1:]) for name in PAGES if os.path.isfile(os.path.join(FIXTURES, name))]
+    if not pages:
+        print(f"No fixtures in {FIXTURES}, run with --download first.")
+        return
+
+    print(f"{'page':<26}" + ''.join(f"{backend:>14}" for backend in backends))
+    for name, parser, args in pages:
+        with open(os.path.join(FIXTURES, name), 'rb') as f:
+            markup = f.read()
+
+        timings = []
+        for backend in backends:
+            scrapers.PARSER_BACKEND = backend
+            start = time.perf_counter()
+            for _ in range(rounds):
+                parser(markup, *args)
+            timings.append((time.perf_counter() - start) / rounds * 1000)
+
+        print(f"{name:<26}" + ''.join(f"{timing:>12.2f}ms" for timing in timings))
+
+
+def truncated_reads(chunk_size: int = 64 * 1024) -> None:
+    """ Checks how much of each saved page is read before its parser's section is over, and how long scanning for it takes.
+    :param chunk_size: The size of the downloaded chunks. """
+
+    print(f"\n{'page':<26}{'read':>14}{'scan':>14}{'same result':>14}")
+    for name, (_, parser, args) in PAGES.items():
+        path = os.path.join(FIXTURES, name)
+        if not hasattr(parser, 'section') or not os.path.isfile(path):
+            continue
+
+        with open(path, 'rb') as f:
+            markup = f.read()
+
+        # The scan runs on the event loop, so it has to stay far below the parsing times
+        start = time.perf_counter()
+        watcher = scrapers.SectionWatcher(parser.section)
+        read = 0
+        while read < len(markup) and not watcher.feed(markup[read:read + chunk_size]):
+            read += chunk_size
+        scan = (time.perf_counter() - start) * 1000
+        read = min(read + chunk_size, len(markup))
+
+        same = parser(markup[:read], *args) == parser(markup, *args)
+        print(f"{name:<26}{read / len(markup):>14.0%}{scan:>12.2f}ms{str(same):>14}")
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument('--download', action='store_true', help="Saves the sample pages first.")
+    argparser.add_argument('--rounds', type=int, default=20, help="How many times each page is parsed.")
+    options = argparser.parse_args()
+
+    if options.download:
+        asyncio.run(download())
+    benchmark(options.rounds)
+    truncated_reads()
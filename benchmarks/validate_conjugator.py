@@ -0,0 +1,157 @@
+""" Compares the local conjugation engine against the Reverso tables in the result cache, or fetched from Reverso.
+
+Usage:
+    python -m benchmarks.validate_conjugator                # summary per language
+    python -m benchmarks.validate_conjugator --diff         # also prints the differing forms
+    python -m benchmarks.validate_conjugator --candidates   # lists the matching verbs missing from the regular lists
+    python -m benchmarks.validate_conjugator --fetch        # fetches every verb of the regular lists from Reverso first
+
+Verbs the bot conjugates locally are never requested from Reverso, so they
+are never in the cache: run this with --fetch before turning the local
+conjugation on (LOCAL_CONJUGATION=1), and again whenever a regular list
+changes. A verb is only worth adding to its language's regular list once
+the engine matches Reverso for all of it.
+"""
+
+import argparse
+import asyncio
+import difflib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import quote
+
+from others import conjugator, scrapers
+from others.languages import LANGUAGES_BY_NAME, PROVIDER_URLS
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/125.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+def tenses(result: Dict[str, Any]) -> Dict[Tuple[str, str], List[str]]:
+    """ Gets the forms of each tense of a conjugation, by its mode and name.
+    :param result: A conjugation, as parse_reverso_conjugation returns it. """
+
+    found = {}
+    for page in result['conjugations'].values():
+        for entry in page:
+            text, name, _ = entry['tense']
+            # Without str.removeprefix and removesuffix, which need Python 3.9
+            if text.startswith("```apache\n"):
+                text = text[len("```apache\n"):]
+            if text.endswith("\n```"):
+                text = text[:-len("\n```")]
+            body, _, mode = text.rpartition('\nmode=')
+            found[(mode.strip('"'), name)] = [line for line in body.splitlines() if line]
+    return found
+
+
+def cached_conjugations(path: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """ Gets the cached Reverso conjugations of the languages the engine knows.
+    :param path: The path of the result cache's SQLite file. """
+
+    db = sqlite3.connect(path)
+    try:
+        for key, value in db.execute("SELECT key, value FROM Results WHERE key LIKE '[\"reverso\", %'"):
+            _, language, verb = json.loads(key)
+            result = json.loads(value)
+            if language in conjugator.LANGUAGES and isinstance(result, dict) and result.get('conjugations'):
+                yield language, verb, result
+    finally:
+        db.close()
+
+
+async def fetched_conjugations(delay: float) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """ Fetches the Reverso conjugation of every verb in the regular lists.
+    :param delay: How many seconds to wait between requests, not to be rate limited. """
+
+    from others.http_client import HTTPClient
+
+    found = []
+    client = HTTPClient()
+    try:
+        for language, (rules, _) in sorted(conjugator.LANGUAGES.items()):
+            registered = LANGUAGES_BY_NAME[language]
+            for verb in sorted(rules.regular):
+                url = PROVIDER_URLS['reverso'].format(code=registered.code, term=quote(verb, safe=''))
+                async with client.get(url, headers=HEADERS) as response:
+                    markup = await response.read() if response.status == 200 else None
+                if markup is None or not (result := scrapers.parse_reverso_conjugation(markup, registered.space, True)):
+                    print(f"{language} {verb}: not found on Reverso, skipped")
+                else:
+                    found.append((language, verb, result))
+                await asyncio.sleep(delay)
+    finally:
+        await client.close()
+
+    return found
+
+
+def validate(conjugations: Iterable[Tuple[str, str, Dict[str, Any]]], show_diff: bool, show_candidates: bool) -> None:
+    """ Diffs the engine's output of every verb against Reverso's.
+    :param conjugations: The languages, verbs and Reverso conjugations to check.
+    :param show_diff: Whether to print the differing forms.
+    :param show_candidates: Whether to list the matching verbs missing from the regular lists. """
+
+    # Language -> [checked, matching, known regular verbs that differ]
+    summary: Dict[str, List[int]] = {}
+    candidates: Dict[str, List[str]] = {}
+    for language, verb, scraped in conjugations:
+        counts = summary.setdefault(language, [0, 0, 0])
+        counts[0] += 1
+        built = conjugator.build(language, verb)
+        if built is None:
+            continue
+
+        expected, actual = tenses(scraped), tenses(built)
+        differences = [
+            (tense, list(difflib.unified_diff(expected.get(tense, []), actual.get(tense, []), lineterm='', n=0))[2:])
+            for tense in sorted(set(expected) | set(actual)) if expected.get(tense) != actual.get(tense)
+        ]
+        known = verb in conjugator.LANGUAGES[language][0].regular
+        if not differences:
+            counts[1] += 1
+            if not known:
+                candidates.setdefault(language, []).append(verb)
+            continue
+
+        counts[2] += known
+        if show_diff:
+            print(f"{language} {verb}{' (listed as regular)' if known else ''}:")
+            for (mode, name), lines in differences:
+                print(f"  {mode} / {name}")
+                for line in lines:
+                    print(f"    {line}")
+
+    if not summary:
+        print("No Reverso conjugations to check.")
+        return
+
+    print(f"{'language':<14}{'checked':>10}{'matching':>10}{'regular but differing':>24}")
+    for language, (checked, matching, wrong) in sorted(summary.items()):
+        print(f"{language:<14}{checked:>10}{matching:>10}{wrong:>24}")
+
+    if show_candidates:
+        for language, verbs in sorted(candidates.items()):
+            print(f"\n{language}: {', '.join(sorted(verbs))}")
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument('--db', default=os.getenv("RESULT_CACHE_DB", "files/results_cache.db"), help="The result cache's file.")
+    argparser.add_argument('--diff', action='store_true', help="Prints the differing forms.")
+    argparser.add_argument('--candidates', action='store_true', help="Lists the matching verbs missing from the regular lists.")
+    argparser.add_argument('--fetch', action='store_true', help="Checks every verb of the regular lists against Reverso, instead of the cache.")
+    argparser.add_argument('--delay', type=float, default=1.0, help="How many seconds to wait between fetches.")
+    options = argparser.parse_args()
+
+    if options.fetch:
+        validate(asyncio.run(fetched_conjugations(options.delay)), options.diff, options.candidates)
+    else:
+        validate(cached_conjugations(options.db), options.diff, options.candidates)
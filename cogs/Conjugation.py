@@ -3,28 +3,30 @@ from discord.ext import commands
 from discord import SlashCommandGroup, Option, ApplicationContext
 
 import asyncio
-import aiohttp
 import json
-from bs4 import BeautifulSoup
-from itertools import zip_longest, cycle
 
-from others.views import PaginatorView
-from others import utils
-from typing import Union, Any, Dict
+from others.views import PaginatorView, Page, SuggestionView
+from others import utils, scrapers, normalization, conjugator
+from others.languages import Language, LANGUAGES, LANGUAGES_BY_NAME, PROVIDER_URLS
+from others.lookup import UpstreamError
+from typing import Union, Any, Dict, List
 from pprint import pprint
 import os
 
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
+# Regular verbs of the languages the local engine knows are conjugated without requesting Reverso.
+# Off until the regular lists are checked with `python -m benchmarks.validate_conjugator --fetch`
+LOCAL_CONJUGATION = os.getenv("LOCAL_CONJUGATION", "0") == "1"
 
 
 class Conjugation(commands.Cog):
 	""" A category for conjugation commands. """
 
+
 	def __init__(self, client) -> None:
 		""" Init method of the conjugation class. """
 		self.client = client
-		self.session = aiohttp.ClientSession(loop=client.loop)
 		self.headers = {
 			"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
 						"AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -47,103 +49,41 @@ class Conjugation(commands.Cog):
 	async def on_ready(self):
 		print('Conjugations cog is online!')
 
-	@_germanic.command(name="dutch", guild_ids=TEST_GUILDS)
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def _conjugate_germanic_dutch(self, interaction, 
-		verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Dutch. """
-		
-		await interaction.defer(ephemeral=True)
+	_groups = {
+		'germanic': _germanic, 'slavic': _slavic, 'asian': _asian, 'romance': _romance,
+		'turkic': _turkic, 'uralic': _uralic, 'other': _other
+	}
 
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
+	def _complete_verb(self, ctx: discord.AutocompleteContext) -> List[str]:
+		""" Suggests the known verbs starting with what was typed so far. """
 
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
+		language = ctx.command.name
+		return self.client.lemmas.complete(f"{language}_verbs", normalization.normalize(ctx.value or '', language))
 
-		temp_verb = '%20'.join(verb.split())
+	async def _conjugate_verb(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True,
+		autocomplete=_complete_verb)) -> None:
+		""" Conjugates a verb in the language of the invoked command. """
 
-		root = f'https://www.mijnwoordenboek.nl/werkwoord/{temp_verb.lower()}'
-		async with self.session.get(root) as response:
-			if response.status != 200:
-				return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
-
-		
-			# Gets the html, the conjugation table div and table
-			html = BeautifulSoup(await response.read(), 'html.parser')
-			content_box = html.select_one('.content_box')
-			table_rows = [row for row in content_box.select('table tr')[1:]]
-			lenro = len(table_rows)
-			if lenro == 0:
-				return await interaction.respond("**Nothing found for the informed value!**", ephemeral=True)
+		await self.conjugate(interaction, LANGUAGES_BY_NAME[interaction.command.name], verb)
 
-			# Additional data:
-			additional = {
-				'client': self.client,
-				'req': root,
-				'search': verb,
-				'result': verb,
-				'title': 'Dutch',
-				'change_embed': self.make_specific_embed
-			}
-			view = PaginatorView(table_rows, increment=12, **additional)
-			embed = await view.make_embed(interaction.author)
-			await interaction.respond(embed=embed, view=view)
-
-	async def make_specific_embed(self, req: str, member: Union[discord.Member, discord.User], search: str, example: Any, 
-		offset: int, lentries: int, entries: Dict[str, Any], title: str = None, result: str = None) -> discord.Embed:
-		""" Makes an embed for the current search example.
-		:param req: The request URL link.
-		:param member: The member who triggered the command.
-		:param search: The search that was performed.
-		:param example: The current search example.
-		:param offset: The current page of the total entries.
-		:param lentries: The length of entries for the given search.
-		:param title: The title of the search.
-		:param result: The result of the search. """
-
-		current_time = await utils.get_time_now()
+	# Every language's command shares the callback above, each with its own cooldown
+	for _language in LANGUAGES:
+		_groups[_language.group].command(
+			name=_language.name, description=f"Conjugates a verb in {_language.title}.",
+			cooldown=commands.CooldownMapping(commands.Cooldown(1, 10), commands.BucketType.user),
+			checks=[utils.check_command_limit().predicate]
+		)(_conjugate_verb)
+	del _language
 
-		# Makes the embed's header
-		embed = discord.Embed(
-			title=f"Search for __{search}__",
-			description=f"Dutch Conjugation",
-			color=member.color,
-			timestamp=current_time,
-			url=req
-			)
-
-		embed.clear_fields()
-		for i in range(0, 12, 2):
-			if offset + i + 1< lentries:
-				tense_name = entries[offset+i].get_text().strip()
-				conjugation = entries[offset+i+1].get_text().strip().split('  ')
-				conjugation = '\n'.join(conjugation)
-			else:
-				break
-
-			# Adds a field for each table
-			embed.add_field(
-				name=tense_name,
-				value=f"```apache\n{conjugation}```",
-				inline=True
-			)
-
-		# Sets the author of the search
-		embed.set_author(name=member, icon_url=member.display_avatar)
-		# Makes a footer with the a current page and total page counter
-		embed.set_footer(text=f"{offset}/{lentries}", icon_url=member.guild.icon.url)
-		return embed
-	
-	# Conjugators based on Reverso's website
-	@_asian.command(name="japanese")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def japanese(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Japanese. """
+	async def conjugate(self, interaction, language: Language, verb: str, checked: bool = False) -> None:
+		""" Conjugates a verb with the language's provider.
+		:param language: The language to conjugate in.
+		:param verb: The verb that is being conjugated.
+		:param checked: Whether to skip checking the verb for typos, e.g. when it comes from a suggestion. """
 
-		await interaction.defer(ephemeral=True)
+		# Searches made from a suggestion's button follow up on the command's response
+		if not interaction.response.is_done():
+			await interaction.defer(ephemeral=True)
 
 		if not verb:
 			return await interaction.respond("**Please, type a word**", ephemeral=True)
@@ -151,200 +91,113 @@ class Conjugation(commands.Cog):
 		if len(verb) > 50:
 			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
 
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-japanese-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇯🇵'
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Japanese', space=True, aligned=False)
-
-	@_other.command(name="arabic")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def arabic(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Arabic. """ 
-		await interaction.defer(ephemeral=True)
-		
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-arabic-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇸🇦-🇪🇬'
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Arabic', space=True, aligned=False)
-
-	@_romance.command(name="portuguese")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def portuguese(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Portuguese. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-portuguese-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇧🇷-🇵🇹'
-		language_title = 'Portuguese'
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title=language_title, space=True)
-
-	@_romance.command(name="italian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def italian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Italian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-italian-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇮🇹-🇨🇭'
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Italian')
-
-	@_romance.command(name="french")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def french(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in French. """ 
-
-		await interaction.defer(ephemeral=True)
-
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-french-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇫🇷-🇧🇪'
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='French')
-	
-	@_romance.command(name="spanish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def spanish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Spanish. """
-
-		await interaction.defer(ephemeral=True)
-
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-spanish-verb-{temp_verb.lower()}.html'
-
-		emoji_title = '🇪🇸-🇲🇽'
-		return await self.__conjugate(interaction=interaction, root=root, 
-	verb=verb, emoji_title=emoji_title, language_title='Spanish')
-
-	@_germanic.command(name="english")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def english(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in English. """
+		query = normalization.make_query(language.provider, language.name, verb)
+		root = query.url(PROVIDER_URLS[language.provider], code=language.code)
+
+		# A verb one letter away from a known one is likely a typo, unless the language's list is too small to tell
+		if not checked and (suggestions := self.client.lemmas.check(f"{language.name}_verbs", query.term)):
+			return await self.suggest(interaction, language, suggestions, f"**I don't know `{query.term}`, did you mean:**", original=query.term)
+
+		if language.provider == 'reverso':
+			embed = await self.__conjugate(interaction=interaction, root=root, key=query.key, verb=verb, emoji_title=language.emoji,
+				language_title=language.title, space=language.space, aligned=language.aligned, language=language.name, term=query.term)
+		elif language.provider == 'cooljugator':
+			embed = await self.__cooljugator(interaction=interaction, root=root, key=query.key, verb=verb, emoji_title=language.emoji,
+				language_title=language.title, space=language.space, aligned=language.aligned, language=language.name, term=query.term)
+		else:
+			embed = await self.__mijnwoordenboek(interaction=interaction, root=root, key=query.key, verb=verb)
+
+		# Verbs that were found are suggested to the next searches. The other providers only have pages for
+		# exact verbs, but Reverso corrects typos, so it learns the verb Reverso answered with instead
+		if isinstance(embed, discord.Embed) and language.provider != 'reverso':
+			self.client.lemmas.add(f"{language.name}_verbs", query.term)
+
+	async def suggest(self, interaction, language: Language, suggestions: List[str], message: str, original: str = None) -> None:
+		""" Offers the known verbs closest to a searched one, as buttons that conjugate them.
+		:param language: The language of the verbs.
+		:param suggestions: The suggested verbs.
+		:param message: The message shown above the buttons.
+		:param original: The searched verb, to offer conjugating it anyway. """
+
+		view = SuggestionView(suggestions, lambda word: self.conjugate(interaction, language, word, checked=True), client=self.client, original=original)
+		await interaction.respond(message, view=view, ephemeral=True)
+
+	async def __mijnwoordenboek(self, interaction, root: str, key: str, verb: str) -> None:
+		""" Conjugates a Dutch verb using the Mijnwoordenboek website.
+		:param root: The url to make the GET request from.
+		:param key: The normalized cache key of the search.
+		:param verb: The verb that is being conjugated. """
 
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
+		try:
+			# Fetches and parses the conjugation table rows
+			table_rows = await self.client.lookup.fetch(root, scrapers.parse_mijnwoordenboek, key=key, cache=True)
+		except UpstreamError:
+			return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
 
-		temp_verb = '%20'.join(verb.split())
+		if not table_rows:
+			return await interaction.respond("**Nothing found for the informed value!**", ephemeral=True)
 
-		root = f'https://conjugator.reverso.net/conjugation-english-verb-{temp_verb.lower()}.html'
-		emoji_title = "🇺🇸-🇬🇧"
-		return await self.__conjugate(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='English')
+		# Builds the pages up front, so the view only keeps their text
+		pages = self.make_dutch_pages(root, verb, table_rows)
+		view = PaginatorView(pages, client=self.client)
+		embed = await view.make_embed(interaction.author)
+		await interaction.respond(embed=embed, view=view)
+		return embed
 
-	async def __conjugate(self, interaction, root: str, verb: str, emoji_title: str, language_title: str, space: bool = False, aligned: bool = True) -> None:
+	def make_dutch_pages(self, req: str, search: str, table_rows: List[str]) -> List[Page]:
+		""" Makes the pages of a Dutch conjugation, with six tenses each.
+		:param req: The request URL link.
+		:param search: The search that was performed.
+		:param table_rows: The tense names followed by their conjugations. """
+
+		pages = []
+		lentries = len(table_rows)
+		for index in range(0, lentries, 12):
+			offset = index + 1
+			fields = []
+			for i in range(0, 12, 2):
+				if offset + i + 1 >= lentries:
+					break
+
+				tense_name = table_rows[offset+i]
+				conjugation = '\n'.join(table_rows[offset+i+1].split('  '))
+				fields.append((tense_name, f"```apache\n{conjugation}```", True))
+
+			if fields:
+				pages.append(Page(
+					title=f"Search for __{search}__", description="Dutch Conjugation", url=req, fields=tuple(fields)
+				))
+
+		return pages
+
+	async def __conjugate(self, interaction, root: str, key: str, verb: str, emoji_title: str, language_title: str, space: bool = False, aligned: bool = True,
+		language: str = None, term: str = None) -> None:
 		""" Conjugates a verb.
 		:param root: The language endpoint from which to do the HTTP request.
-		:param verb: The verb that is being conjugated. """
-
-		async with self.session.get(root, headers=self.headers) as response:
-			if response.status != 200:
+		:param key: The normalized cache key of the search.
+		:param verb: The verb that is being conjugated.
+		:param language: The name of the verb's language.
+		:param term: The normalized verb. """
+
+		# Known regular verbs are conjugated locally, any other verb falls back to Reverso
+		result = conjugator.conjugate(language, term, aligned) if LOCAL_CONJUGATION and term else None
+		if result is None:
+			# Conjugation tables never change, so the parsed ones are reused
+			try:
+				result = await self.client.lookup.fetch(
+					root, scrapers.parse_reverso_conjugation, space, aligned, key=key, cache=True, headers=self.headers
+				)
+			except UpstreamError:
 				return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
-		
-			# Gets the html and the table div
-			html = BeautifulSoup(await response.read(), 'html.parser')
-			subhead = html.select_one('.subHead.subHead-res.clearfix')
-			if not subhead:
-				return await interaction.respond("**Invalid request!**", ephemeral=True)
-
-		# Translation options
-		#-> Word translation
-		tr_div = subhead.select_one('.word-transl-options')
-		found_verb = tr_div.select_one('.targetted-word-wrap').get_text().strip()
-		# Conjugation table divs
-		verb_div = html.select_one('.word-wrap')
-		word_wraps = verb_div.select_one('.result-block-api')
-		word_wrap_rows = word_wraps.select('.word-wrap-row')
-		
-		verbal_mode = ''
-
-		conjugations = {}
-		for i, current_row in enumerate(word_wrap_rows):
-			conjugations[f'page{i}'] = []
-			# Loops through the rows
-			for table in current_row.select('.wrap-three-col'):
-				# Specifies the verbal tense if there is one
-				if temp_tense_name := table.select_one('p'):
-					tense_name = temp_tense_name.get_text()
-
-					# Changes verbal mode if it's time to change it
-					if (temp_title := table.select_one('.word-wrap-title')):
-						title = temp_title.get_text().strip()
-						verbal_mode = title
-					elif (temp_title := current_row.select_one('.word-wrap-title')):
-						title = temp_title.get_text().strip()
-						verbal_mode = title
-
-					verbal_mode = title
 
-				# If there isn't, it shows '...' instead
-				else:
-					tense_name = '...'
-					verbal_mode = table.select_one('.word-wrap-title').get_text().strip()
+		if not result:
+			if suggestions := self.client.lemmas.suggest(f"{language}_verbs", term):
+				return await self.suggest(interaction, LANGUAGES_BY_NAME[language], suggestions, "**Couldn't find anything for it, did you mean:**")
+			return await interaction.respond("**Invalid request!**", ephemeral=True)
 
-				temp_text = ""
-
-				# Loops through each tense row
-				for li in table.select('.wrap-verbs-listing li'):
-					# Makes a temp text with all conjugations
-					if space:
-						temp_text += f"{li.get_text(separator=' ')}\n"
-					else:
-						temp_text += f"{li.get_text()}\n"
-				# Specifies the verbal mode
-				temp_text += f"""\nmode="{verbal_mode}"\n"""
-				temp_text = f"```apache\n{temp_text}```"
-				conjugations[f'page{i}'].append({'tense': [temp_text, tense_name, aligned]})
+		found_verb = result['found_verb']
+		conjugations = result['conjugations']
+		self.client.lemmas.add(f"{language}_verbs", normalization.normalize(found_verb, language))
 
 		# Additional data:
 		additional = {
@@ -436,98 +289,29 @@ class Conjugation(commands.Cog):
 
 		return embed
 
-	@_germanic.command(name="german")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def german(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in German """
-
-		await interaction.defer(ephemeral=True)
-		
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://conjugator.reverso.net/conjugation-german-verb-{temp_verb.lower()}.html'
-		emoji_title = '🇩🇪|🇦🇹'
-		return await self.__conjugate(interaction=interaction, root=root, 
-			verb=verb, emoji_title=emoji_title, language_title='German')
-
-	async def __cooljugator(self, interaction, root: str, verb: str, emoji_title: str, language_title: str, space: bool = False, aligned: bool = True) -> None:
+	async def __cooljugator(self, interaction, root: str, key: str, verb: str, emoji_title: str, language_title: str, space: bool = False, aligned: bool = True,
+		language: str = None, term: str = None) -> None:
 		""" Conjugates a verb using the Cooljugator website. 
 		:param root: The url to make the GET request from.
+		:param key: The normalized cache key of the search.
 		:param verb: The verb to cog_ext.
 		:param emoji_title: The emoji to show in the embeds.
 		:param language_title: The language that is being conjugated.
 		:param space: If you want a space separator into a specific section. 
-		:param aligned: If the fields will be inline."""
-
-		# Performs the GET request to the endpoint
-		async with self.session.get(root) as response:
-			if response.status != 200:
-				return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
-
-			# Gets the html and the container div
-			html = BeautifulSoup(await response.read(), 'html.parser')
-			container = html.select_one('#conjugationDivs.fourteen.wide.column')
-			if not container:
-				return await interaction.respond("**Couldn't find anything for it!**", ephemeral=True)
-
-			conjugations = []
-			conj_divs = container.select('.conjugation-table.collapsable')
-
-			# Gets all useful information
-			for i, conj_div in enumerate(conj_divs):
-				# Gets all pronouns
-				pronouns = [
-				pronoun.get_text(separator=' ').strip()
-				for pronoun in conj_div.select(
-					'.conjugation-cell.conjugation-cell-four.conjugation-cell-pronouns.pronounColumn'
-				) if pronoun.get_text()
-				]
-				# Gets all tenses
-				tenses = [
-					tense.get_text().strip() 
-					for tense in conj_div.select(
-						'.conjugation-cell.conjugation-cell-four.tense-title'
-					) if tense.get_text()
-				]
-				# Gets all conjugations
-				conjs = [
-					conj.get_text(separator='  ').strip() if conj.get_text() else '' 
-					for conj in conj_div.select(
-						'.conjugation-cell.conjugation-cell-four'
-				)
-				][1:]
-				# Filters the conjugations a bit
-				new_conjs = []
-				for conj in conjs:
-					if conj.strip() not in pronouns and conj.strip() not in tenses:
-						conj = conj.strip().split('  ')[0]
-						new_conjs.append(conj)
+		:param aligned: If the fields will be inline.
+		:param language: The name of the verb's language.
+		:param term: The normalized verb."""
 
-				# Unify the pronouns with the conjugations
-				rows = []
-				pronouns = cycle(pronouns)
-				for conj in new_conjs:
-					if conj:
-						try:
-							temp = f"{next(pronouns)} {conj}"
-						except Exception as e:
-							temp = f"- {conj}"
-
-						rows.append(temp)
-					
-				# Unify the tenses with the rows
-				n = round(len(rows)/len(tenses))
-				rows = [rows[i:i + n] for i in range(0, len(rows), n)]
-				pairs = list(zip_longest(tenses, rows, fillvalue='_'))
-				conjugations.append(pairs)
+		try:
+			# Fetches and parses the conjugation tables
+			conjugations = await self.client.lookup.fetch(root, scrapers.parse_cooljugator, key=key, cache=True)
+		except UpstreamError:
+			return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
 
+		if not conjugations:
+			if suggestions := self.client.lemmas.suggest(f"{language}_verbs", term):
+				return await self.suggest(interaction, LANGUAGES_BY_NAME[language], suggestions, "**Couldn't find anything for it, did you mean:**")
+			return await interaction.respond("**Couldn't find anything for it!**", ephemeral=True)
 
 		# Additional data:
 		additional = {
@@ -543,488 +327,6 @@ class Conjugation(commands.Cog):
 		await interaction.respond(embed=embed, view=view)
 		return embed
 
-	@_slavic.command(name="polish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def polish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Polish """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://cooljugator.com/pl/{temp_verb.lower()}'
-		emoji_title = '🇵🇱'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-			verb=verb, emoji_title=emoji_title, language_title='Polish', space=True)
-
-	@_slavic.command(name="russian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def russian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Russian """
-
-		await interaction.defer(ephemeral=True)
-
-		if not verb:
-			return await interaction.respond("**Please, type a word**", ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root = f'https://cooljugator.com/ru/{temp_verb}'
-		emoji_title = '🇷🇺|🇧🇾'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Russian', space=True)
-
-	@_romance.command(name="esperanto")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def esperanto(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Esperanto """
-
-		await interaction.defer(ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		# root = f'https://conjugator.reverso.net/conjugation-portuguese-verb-{temp_verb}.html'
-		root =f'https://cooljugator.com/eo/{temp_verb.lower()}'
-
-		emoji_title = '🟩'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Esperanto', space=True)
-
-	@_uralic.command(name="estonian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def estonian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Estonian """
-
-		await interaction.defer(ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		# root = f'https://conjugator.reverso.net/conjugation-portuguese-verb-{temp_verb}.html'
-		root =f'https://cooljugator.com/ee/{temp_verb.lower()}'
-
-		emoji_title = '🇪🇪'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Estonian', space=True)
-
-	@_turkic.command(name="turkish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def turkish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Turkish """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value,I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		# root = f'https://conjugator.reverso.net/conjugation-portuguese-verb-{temp_verb}.html'
-		root =f'https://cooljugator.com/tr/{temp_verb.lower()}'
-
-		emoji_title = '🇹🇷'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Turkish', space=True)
-
-	# North Germanic languages - Scandinavian languages
-	@_germanic.command(name="danish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def danish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Danish" """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-
-		root =f'https://cooljugator.com/da/{temp_verb.lower()}'
-
-		emoji_title = '🇩🇰'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Danish', space=True)
-
-	@_germanic.command(name="swedish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def swedish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Swedish" """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/sv/{temp_verb.lower()}'
-
-		emoji_title = '🇸🇪'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Swedish', space=True)
-
-	@_germanic.command(name="norwegian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def norwegian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Norwegian """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/no/{temp_verb.lower()}'
-
-		emoji_title = '🇳🇴'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Norwegian', space=True)
-
-
-	@_germanic.command(name="faroese")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def faroese(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Faroese" """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/fo/{temp_verb.lower()}'
-
-		emoji_title = '🇫🇴'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Faroese', space=True)
-
-	@_germanic.command(name="icelandic")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def icelandic(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Icelandic """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/is/{temp_verb.lower()}'
-
-		emoji_title = '🇮🇸'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Icelandic', space=True)
-
-	@_uralic.command(name="finnish")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def finnish(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Finnish """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/fi/{temp_verb.lower()}'
-
-		emoji_title = '🇫🇮'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Finnish', space=True)
-
-	# Asian languages
-	@_asian.command(name="indonesian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def indonesian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Indonesian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/id/{temp_verb.lower()}'
-
-		emoji_title = '🇮🇩'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Indonesian', space=True)
-
-	@_asian.command(name="maltese")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def maltese(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Maltese. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/mt/{temp_verb.lower()}'
-
-		emoji_title = '🇲🇹'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Maltese', space=True)
-
-	@_asian.command(name="thai")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def thai(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Thai. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/th/{temp_verb.lower()}'
-
-		emoji_title = '🇹🇭'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Thai', space=True)
-
-	@_asian.command(name="vietnamese")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def vietnamese(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Vietnamese. """
-
-		await interaction.defer(ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/vi/{temp_verb.lower()}'
-
-		emoji_title = '🇻🇳'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Vietnamese', space=True)
-
-	@_asian.command(name="malay")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def malay(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Malay. """
-
-		await interaction.defer(ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/ms/{temp_verb.lower()}'
-
-		emoji_title = '🇲🇾'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Malay', space=True)
-
-	@_romance.command(name="catalan")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def catalan(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Catalan. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/ca/{temp_verb.lower()}'
-
-		emoji_title = '🟨'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Catalan', space=True)
-
-	@_romance.command(name="romanian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def romanian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Romanian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/ro/{temp_verb.lower()}'
-
-		emoji_title = '🇷🇴'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Romanian', space=True)
-
-	@_other.command(name="greek")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def greek(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Greek. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/gr/{temp_verb.lower()}'
-
-		emoji_title = '🇬🇷'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Greek', space=True)
-
-	@_germanic.command(name="afrikaans")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def afrikaans(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Afrikaans. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/af/{temp_verb.lower()}'
-
-		emoji_title = '🇿🇦'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Afrikaans', space=True)
-
-	@_uralic.command(name="lithuanian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def lithuanian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Lithuanian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/lt/{temp_verb.lower()}'
-
-		emoji_title = '🇱🇹'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Lithuanian', space=True)
-
-	@_uralic.command(name="latvian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def latvian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Latvian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/lv/{temp_verb.lower()}'
-
-		emoji_title = '🇱🇻'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Latvian', space=True)
-
-	@_slavic.command(name="macedonian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def macedonian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Macedonian. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/mk/{temp_verb.lower()}'
-
-		emoji_title = '🇲🇰'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Macedonian', space=True)
-
-	@_other.command(name="persian")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def persian(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Persian. """
-
-		await interaction.defer(ephemeral=True)
-
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/fa/{temp_verb.lower()}'
-
-		emoji_title = '🇮🇷'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Persian', space=True)
-
-	@_other.command(name="hebrew")
-	@commands.cooldown(1, 10, commands.BucketType.user)
-	@utils.check_command_limit()
-	async def hebrew(self, interaction, verb: Option(str, name='verb', description='The word to conjugate', required=True)) -> None:
-		""" Conjugates a verb in Hebrew. """
-
-		await interaction.defer(ephemeral=True)
-		
-		if len(verb) > 50:
-			return await interaction.respond("**Wow, you informed a very long value, I'm not using it!**", ephemeral=True)
-
-		temp_verb = '%20'.join(verb.split())
-		
-		root =f'https://cooljugator.com/he/{temp_verb.lower()}'
-
-		emoji_title = '🇮🇱'
-		return await self.__cooljugator(interaction=interaction, root=root, 
-		verb=verb, emoji_title=emoji_title, language_title='Hebrew', space=True)
-
 
 def setup(client) -> None:
-	client.add_cog(Conjugation(client))
\ No newline at end of file
+	client.add_cog(Conjugation(client))
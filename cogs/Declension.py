@@ -2,27 +2,37 @@ import discord
 from discord.ext import commands
 from discord import slash_command, option, Option, OptionChoice, SlashCommandGroup
 
-import aiohttp
 import os
+import json
 from os import getenv
 from datetime import datetime
 
 import convertapi
 from PIL import Image
 import time
-from bs4 import BeautifulSoup
-import copy
 from itertools import zip_longest
 
-from others import utils
-from others.views import PaginatorView
-from typing import Dict, Union, Any
+from others import utils, scrapers, normalization
+from others.lookup import UpstreamError
+from others.views import PaginatorView, SuggestionView
+from typing import Dict, List, Tuple, Union, Any
 from pprint import pprint
 
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
 
 
+def word_index(command: str, word_type: str = None) -> Tuple[str, str]:
+  """ Gets the autocomplete index of a declension command and the normalization rule of its words.
+  :param command: The command's name, i.e. the language.
+  :param word_type: The Finnish word type. """
+
+  if command == 'finnish':
+    return f'finnish_{word_type}s', f'finnish_{word_type}'
+
+  return f'{command}_nouns', {'polish': 'polish_declension', 'german': 'german_nouns'}.get(command, command)
+
+
 class Declension(commands.Cog):
   '''
   A category for word declensions.
@@ -30,7 +40,7 @@ class Declension(commands.Cog):
 
   def __init__(self, client):
     self.client = client
-    self.session = aiohttp.ClientSession(loop=client.loop)
+    self.session = client.session
     self.pdf_token = getenv('PDF_API_TOKEN')
 
   _decline = SlashCommandGroup("decline", "Declines a word in a given language", guild_ids=TEST_GUILDS)
@@ -39,65 +49,78 @@ class Declension(commands.Cog):
   async def on_ready(self):
     print('Declension cog is online!')
 
+  def _complete_word(self, ctx: discord.AutocompleteContext) -> List[str]:
+    """ Suggests the known words starting with what was typed so far. """
+
+    word_type = ctx.options.get('word_type')
+    if ctx.command.name == 'finnish' and not word_type:
+      return []
+
+    index, rule = word_index(ctx.command.name, word_type)
+    return self.client.lemmas.complete(index, normalization.normalize(ctx.value or '', rule))
+
   @_decline.command(name='polish')
   @commands.cooldown(1, 15, commands.BucketType.user)
   @utils.check_command_limit()
-  async def _decline_polish(self, ctx, word: Option(str, name='word', description='The word to decline', required=True)):
+  async def _decline_polish(self, ctx, word: Option(str, name='word', description='The word to decline', required=True,
+    autocomplete=_complete_word)):
 
     await ctx.defer(ephemeral=True)
-    word = word.replace(" ", "")
+    query = normalization.make_query('declinator', word_index('polish')[1], word)
+    word = query.term
     current_time = await utils.get_time_now()
 
     root = "https://www.api.declinator.com/api/v2/declinator"
-    req = f"{root}/pl?unit={word}"
+    req = query.url("{root}/pl?unit={term}", root=root)
     headers = {"Authorization": os.getenv("DECLINATOR_API_TOKEN")}
 
-    async with self.session.get(req, headers=headers) as response:
-      if response.status != 200:
-        return await ctx.respond("**For some reason I couldn't process it!**", ephemeral=True)
+    try:
+      data = (await self.client.lookup.fetch(req, json.loads, key=query.key, headers=headers))[0]
+    except UpstreamError:
+      return await ctx.respond("**For some reason I couldn't process it!**", ephemeral=True)
 
-      data = (await response.json())[0]
+    # The nominative is learned rather than the search, which may be any of the word's forms
+    self.client.lemmas.add(word_index('polish')[0], normalization.normalize(data['singular']['n'], word_index('polish')[1]))
+    gender_text = "" if not (gender := data.get("gender", "")) else f"| **Gender:** {gender}"
 
-      gender_text = "" if not (gender := data.get("gender", "")) else f"| **Gender:** {gender}"
+    # Creates the embed
+    embed = discord.Embed(
+      title="Polish Declension",
+      description=f"**Search:** {word.lower()} | **Word**: {data['singular']['n'].lower()} {gender_text}".strip(),
+      color=ctx.author.color,
+      url=req,
+      timestamp=current_time
+    )
+
+    case_names_mapping = {
+      "n": "nominative",
+      "g": "genitive",
+      "d": "dative",
+      "a": "accusative",
+      "i": "instrumental",
+      "l": "locative",
+      "v": "vocative"
+    }
 
-      # Creates the embed
-      embed = discord.Embed(
-        title="Polish Declension",
-        description=f"**Search:** {word.lower()} | **Word**: {data['singular']['n'].lower()} {gender_text}".strip(),
-        color=ctx.author.color,
-        url=req,
-        timestamp=current_time
-      )
+    # Loops through the word modes and get equivalent cases and values
+    for grammatical_number, cases in data.items():
+      # Skips the gender, the result is shared with concurrent searches so it isn't removed from it
+      if grammatical_number == "gender":
+        continue
 
-      # Removes the gender key from the data
-      if "gender" in data:
-        del data["gender"]
-
-      case_names_mapping = {
-        "n": "nominative",
-        "g": "genitive",
-        "d": "dative",
-        "a": "accusative",
-        "i": "instrumental",
-        "l": "locative",
-        "v": "vocative"
-      }
-
-      # Loops through the word modes and get equivalent cases and values
-      for grammatical_number, cases in data.items():
-        temp_text = ""
-        for case, declension in cases.items():
-          case_name = case_names_mapping.get(case.lower(), case)
-          line = f"{case_name.title():<12}| {declension.title()}\n"
-          temp_text += line
-
-        # Appends a field for each grammatical number, containing also the cases and their respective declined words
-        embed.add_field(
-          name=grammatical_number.title(),
-          value=f"```apache\n{temp_text}```",
-          inline=True)
+      temp_text = ""
+      for case, declension in cases.items():
+        case_name = case_names_mapping.get(case.lower(), case)
+        line = f"{case_name.title():<12}| {declension.title()}\n"
+        temp_text += line
 
-      await ctx.respond(embed=embed, ephemeral=True)
+      # Appends a field for each grammatical number, containing also the cases and their respective declined words
+      embed.add_field(
+        name=grammatical_number.title(),
+        value=f"```apache\n{temp_text}```",
+        inline=True)
+
+    await ctx.respond(embed=embed, ephemeral=True)
 
 
   async def _outdated_decline_polish(self, ctx, word: str = None):
@@ -162,7 +185,7 @@ class Declension(commands.Cog):
     os.remove(f"files/{me.id}.png")
   
   @_decline.command(name='russian', options=[
-      Option(str, name='word', description='The word to decline', required=True)
+      Option(str, name='word', description='The word to decline', required=True, autocomplete=_complete_word)
     ]
   )
   @commands.cooldown(1, 10, commands.BucketType.user)
@@ -174,74 +197,70 @@ class Declension(commands.Cog):
     if not word:
       return await ctx.send("**Please, type a word**", ephemeral=True)
 
+    await self.decline_russian(ctx, word)
+
+  async def decline_russian(self, ctx, word: str, checked: bool = False) -> None:
+    """ Declines a Russian word, or offers the known words closest to it when it seems misspelled.
+    :param word: The word to decline.
+    :param checked: Whether to skip checking the word for typos, e.g. when it comes from a suggestion. """
+
     current_time = await utils.get_time_now()
     root = 'https://en.openrussian.org/ru'
 
-    req = f"{root}/{word.lower()}"
-    async with self.session.get(req) as response:
-      if response.status != 200:
-        return await ctx.respond("**Something went wrong with that search!**", ephemeral=True)
-    
-      # Gets the html and the table div
-      html = BeautifulSoup(await response.read(), 'html.parser')
-      div = html.select_one('.table-container')
-
-      if not div:
-        return await ctx.respond("**I couldn't find anything for this!**", ephemeral=True)
-
-      # Gets the word modes (singular, plura, m., f., etc)
-      word_modes = []
-      for mode in div.select('.table-audio'):
-        # Checks whether the row has a long version of the mode
-        if value := mode.select_one('.long'):
-          if value.text:
-            word_modes.append(value.text.strip())
-        # If not just tries to get its content
-        else:
-          if mode.text:
-            word_modes.append(mode.text.strip())
-
-      if not word_modes:
-        return await ctx.respond("**I can't decline this word, maybe this is a verb!**", ephemeral=True)
-      # Gets all case names
-      case_names = [case.text.strip() for case in div.select('tbody tr th .short') if case.text]
-      if not case_names:
-        return await ctx.respond("**No cases found for this word, maybe this is a verb!**", ephemeral=True)
-
-      # Gets all values
-      case_values = []
-      for case in div.select('tbody tr'):
-        row_values = []
-        for row in case.select('td'):
-          if value := row.get_text(" | ", strip=True):
-            row_values.append(value.strip())
-
-        case_values.append(row_values)
-
-      tds = [td for td in div.select('tbody tr')]
-      # Makes the embedded message
-      embed = discord.Embed(
-        title="Russian Declension",
-        description=f"**Word:** {word.lower()}",
-        color=ctx.author.color,
-        url=req,
-        timestamp=current_time
-      )
-      # Loops through the word modes and get equivalent cases and values
-      for i, word_mode in enumerate(word_modes):
-        temp_text = ''
-        for ii, case_value in enumerate(case_values):
-          line = f"{case_names[ii]} {case_values[ii][i]}\n"
-          temp_text += line
-
-        embed.add_field(
-          name=word_mode,
-          value=f"```apache\n{temp_text}```",
-          inline=True)
-      await ctx.respond(embed=embed, ephemeral=True)
+    index, rule = word_index('russian')
+    query = normalization.make_query('openrussian', rule, word)
+    req = query.url("{root}/{term}", root=root)
+
+    # A word one letter away from a known one is likely a typo, unless the list is too small to tell
+    if not checked and (suggestions := self.client.lemmas.check(index, query.term)):
+      view = SuggestionView(suggestions, lambda suggestion: self.decline_russian(ctx, suggestion, checked=True), client=self.client, original=query.term)
+      return await ctx.respond(f"**I don't know `{query.term}`, did you mean:**", view=view, ephemeral=True)
+
+    try:
+      # Fetches and parses the declension table
+      table = await self.client.lookup.fetch(req, scrapers.parse_openrussian, key=query.key)
+    except UpstreamError:
+      return await ctx.respond("**Something went wrong with that search!**", ephemeral=True)
+
+    if not table:
+      if suggestions := self.client.lemmas.suggest(index, query.term):
+        view = SuggestionView(suggestions, lambda suggestion: self.decline_russian(ctx, suggestion, checked=True), client=self.client)
+        return await ctx.respond("**I couldn't find anything for this, did you mean:**", view=view, ephemeral=True)
+      return await ctx.respond("**I couldn't find anything for this!**", ephemeral=True)
+
+    word_modes = table['word_modes']
+    if not word_modes:
+      return await ctx.respond("**I can't decline this word, maybe this is a verb!**", ephemeral=True)
+
+    case_names = table['case_names']
+    if not case_names:
+      return await ctx.respond("**No cases found for this word, maybe this is a verb!**", ephemeral=True)
+
+    self.client.lemmas.add(index, query.term)
+    case_values = table['case_values']
+    # Makes the embedded message
+    embed = discord.Embed(
+      title="Russian Declension",
+      description=f"**Word:** {word.lower()}",
+      color=ctx.author.color,
+      url=req,
+      timestamp=current_time
+    )
+    # Loops through the word modes and get equivalent cases and values
+    for i, word_mode in enumerate(word_modes):
+      temp_text = ''
+      for ii, case_value in enumerate(case_values):
+        line = f"{case_names[ii]} {case_values[ii][i]}\n"
+        temp_text += line
+
+      embed.add_field(
+        name=word_mode,
+        value=f"```apache\n{temp_text}```",
+        inline=True)
+    await ctx.respond(embed=embed, ephemeral=True)
 
   @_decline.command(name='finnish', options=[
-      Option(str, name='word', description='The word to decline', required=True),
+      Option(str, name='word', description='The word to decline', required=True, autocomplete=_complete_word),
       Option(str, name='word_type', description='The word type', required=True,
         choices=[
             OptionChoice(name="Adjective", value="adjetctive"), OptionChoice(name="Noun", value="noun"),
@@ -269,130 +288,72 @@ class Declension(commands.Cog):
       return await ctx.respond("**Invalid word type!**", ephemeral=True)
 
     # Request part
-    req = f"{root}/{word.lower()}"
-    async with self.session.get(req) as response:
-      if response.status == 200:
-
-        try:
-          # Scraping part
-          html = BeautifulSoup(await response.read(), 'html.parser')
-          main_div = html.select('#conjugationDivs')
-          div = html.select('.conjugation-table.collapsable')
-          case_titles = {}
-          for d in div:
-            case_titles.update({title.text: [] for title in d.select('.conjugation-cell.conjugation-cell-four.tense-title') if title.text})
-            
-          # Get case names
-          case_names = []
-          for dd in div:
-            case_names.append([case.text for case in dd.select('.conjugation-cell.conjugation-cell-four.conjugation-cell-pronouns.pronounColumn') if case.text])
-
-          indexes = list(case_titles)
-          index = indexes[0]
-          for dd in div:
-            for decl in dd.select('.conjugation-cell.conjugation-cell-four'):
-              if decl.text:
-                try:
-                  if new_i := indexes.index(decl.text):
-                    index = indexes[new_i]
-                except ValueError:
-                  pass
-              
-                try:
-                  case_titles[index].append(decl['data-default'])
-                except Exception:
-                  pass
-
-        except AttributeError:
-          return await ctx.respond("**Nothing found! Make sure to type correct parameters!**", ephemeral=True)
+    query = normalization.make_query('cooljugator', word_index('finnish', word_type)[1], word)
+    req = query.url("{root}/{term}", root=root)
+    try:
+      # Fetches and parses the declension tables
+      tables = await self.client.lookup.fetch(req, scrapers.parse_cooljugator_declension, key=query.key)
+    except UpstreamError:
+      return await ctx.respond("**Something went wrong with that search!**", ephemeral=True)
+
+    if not tables:
+      return await ctx.respond("**Nothing found! Make sure to type correct parameters!**", ephemeral=True)
+
+    self.client.lemmas.add(word_index('finnish', word_type)[0], query.term)
+    case_titles = tables['case_titles']
+    case_names = tables['case_names']
+
+    try:
+      current_time = await utils.get_time_now()
+      # Embed part
+      embed = discord.Embed(
+        title=f"Finnish Declension",
+        description=f"**Word:** {word}\n**Type:** {word_type}",
+        color=ctx.author.color,
+        timestamp=current_time,
+        url=req
+      )
+      count = 0
+      for key, values in case_titles.items():
+        #print(key)
+        temp_list = zip_longest(case_names[count], values, fillvalue='')
+        temp_text = ''
+        for tl in temp_list:
+          temp_text += f"{' '.join(tl)}\n"
 
-      try:
-        current_time = await utils.get_time_now()
-        # Embed part
-        embed = discord.Embed(
-          title=f"Finnish Declension",
-          description=f"**Word:** {word}\n**Type:** {word_type}",
-          color=ctx.author.color,
-          timestamp=current_time,
-          url=req
+        embed.add_field(
+          name=key,
+          value=f"```apache\n{temp_text}```",
+          inline=True
         )
-        count = 0
-        for key, values in case_titles.items():
-          #print(key)
-          temp_list = zip_longest(case_names[count], values, fillvalue='')
-          temp_text = ''
-          for tl in temp_list:
-            temp_text += f"{' '.join(tl)}\n"
-
-          embed.add_field(
-            name=key,
-            value=f"```apache\n{temp_text}```",
-            inline=True
-          )
-          count += 1
-        await ctx.respond(embed=embed, ephemeral=True)
-      except Exception as e:
-        print(e)
-        return await ctx.respond("**I couldn't do this request, make sure to type things correctly!**", ephemeral=True)
+        count += 1
+      await ctx.respond(embed=embed, ephemeral=True)
+    except Exception as e:
+      print(e)
+      return await ctx.respond("**I couldn't do this request, make sure to type things correctly!**", ephemeral=True)
 
   @_decline.command(name='german')
   @commands.cooldown(1, 10, commands.BucketType.user)
   @utils.check_command_limit()
   async def german(self, interaction, 
-    word: Option(str, name='word', description='The word to decline', required=True)) -> None:
+    word: Option(str, name='word', description='The word to decline', required=True, autocomplete=_complete_word)) -> None:
     """ Declines a German word. """
 
     await interaction.defer(ephemeral=True)
 
     root = 'https://www.verbformen.com/declension/nouns'
-    req = f"{root}/?w={word}"
-    async with self.session.get(req) as response:
-      if response.status != 200:
-        return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
-
-      html = BeautifulSoup(await response.read(), 'html.parser')
-      div = html.select_one('.rAbschnitt')
-      decl_type_list = []
-      for decl_type in div.select('section.rBox.rBoxWht'):
-        try:
-          decl_type_list.append(decl_type.select_one('header h2').text)
-        except:
-          decl_type_list.append('...')
-          pass     
-      master_dict = {}
-      for dt in decl_type_list:
-        master_dict[dt] = []
-
-      # Gets the main section of the page
-      for section in html.select('.rAbschnitt '):
-        # Gets the declination tables
-        for i, table in enumerate(section.select('.rAufZu')):
-          # Gets the gender blocks of each table
-          # print(table.select('.vTbl'))
-          for case in table.select('.vTbl'):
-            category_name = '...'
-
-            if cat := case.select_one('h2'):
-              category_name = cat.text
-            elif cat := case.select_one('h3'):
-              category_name = cat.text
-              
-            case_dict = {}
-            decl_name = list(master_dict)[i-1]
-            #category_name = f"{category_name}
-            case_dict[category_name] = []
-        
-            # Gets each row of each table block
-            for row in case.select('tr'):
-              case_name = row.select_one('th').text
-              case_decl = [line.text for line in row.select('td')]
-              case_decl.insert(0, case_name)
-              case_dict[category_name].append(case_decl.copy())
-              case_decl.clear()
-            master_dict[decl_name].append(copy.deepcopy(case_dict))
-
-
-    master_list = [[k, v] for k, v in master_dict.items()]
+    query = normalization.make_query('verbformen', word_index('german')[1], word)
+    req = query.url("{root}/?w={term}", root=root)
+    try:
+      # Fetches and parses the declension tables
+      master_list = await self.client.lookup.fetch(req, scrapers.parse_verbformen, key=query.key, cache=True)
+    except UpstreamError:
+      return await interaction.respond("**Something went wrong with that search!**", ephemeral=True)
+
+    if not master_list:
+      return await interaction.respond("**Nothing found for that word!**", ephemeral=True)
+
+    # Verbformen answers with the closest word it knows without naming it, so German searches aren't learned
     # Additional data:
     additional = {
       'req': req,
@@ -2,15 +2,14 @@ import discord
 from discord.ext import commands
 from discord import ApplicationContext, Option, option, SlashCommandGroup, slash_command
 
-import aiohttp
 import requests
 import json
-from bs4 import BeautifulSoup
 import os
 
 from typing import Any, List, Dict, Union
-from others import utils
-from others.views import PaginatorView
+from others import utils, scrapers, normalization
+from others.lookup import UpstreamError
+from others.views import PaginatorView, Page
 
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
@@ -23,7 +22,6 @@ class Dictionaries(commands.Cog):
 		""" Class initializing method. """
 
 		self.client = client
-		self.session = aiohttp.ClientSession(loop=client.loop)
 		self.headers = {
 			"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
 						"AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -50,145 +48,47 @@ class Dictionaries(commands.Cog):
 		member = interaction.author
 		await interaction.defer(ephemeral=True)
 
-		req = f"https://dictionary.cambridge.org/us/dictionary/english/{search.strip().replace(' ', '%20')}"
-		async with self.session.get(req, headers=self.headers) as response:
-			if response.status != 200:
-				return await interaction.respond(f"**{member.mention}, something went wrong with that search!**", ephemeral=True)
-
-			html = BeautifulSoup(await response.read(), 'html.parser')
-
-			page = html.select_one('.page')
-
-			if not page:
-				return await interaction.respond(f"**{member.mention}, nothing found for the given search!**", ephemeral=True)
-				
-			examples = page.select('.pr .dictionary')
-
-
-			# Additional data:
-			additional = {
-				'client': self.client,
-				'req': req,
-				'search': search,
-				'change_embed': self.make_embed
-			}
-			view = PaginatorView(examples, **additional)
-			embed = await view.make_embed(interaction.author)
-			await interaction.respond(embed=embed, view=view)
-
-	async def get_header(self, example) -> Dict[str, str]:
-		""" Gets a header for the example. 
-		:param example: The whole HTML of the search word example. """
-
-		header = example.select_one('.pos-header')
-
-		# Gets simple tags from the HTML, as the title, type of word (noun, adjective, verb, etc)
-		title = header.select_one('.di-title').get_text().strip()
-		kind = kd.get_text().strip() if (kd := header.select_one('.posgram.dpos-g.hdib.lmr-5')) else '?'
-
-		# Gets all phonetic texts from elements that have specific class names in the list below
-		phonetics = []
-		for phonetic_tag in ['.us.dpron-i', '.uk.dpron-i']:
-			if pho := header.select_one(phonetic_tag):
-				temp_pho_span = []
-				# Gets only text from useful subtags, as listed below
-				for cl in [['region', 'dreg'], ['pron', 'dpron']]:
-					for content in pho.contents:
-						if content.get('class') == cl:
-							# Appends to the a temp list, regarding this iteration
-							temp_pho_span.append(content.get_text().strip())
-
-				# Appends to the main list
-				phonetics.append(' '.join(temp_pho_span[:]))
-
-		# Makes a neat dictionary to return it and be easier to handle the data
-		header_dict = {
-			"title": title,
-			"kind": kind,
-			"phonetics": ' | '.join(phonetics) if phonetics else '?'
-		}
-		
-		# Returns it
-		return header_dict
-
-
-	async def get_content(self, example) -> Any:
-		""" Gets the content of the given search. 
-		:param example: The whole HTML of the search word example. """
-
-		# Gets the main example div
-		content = example.select_one('.pos-body')
-		# Gets the inner content of the main example div
-		# inner = content.select_one('.hflxrev.hdf-xs.hdb-s.hdf-l')
-		# Gets image, word level (a1, a2, b1, b2, c1, c2) and the description
-		image_class = '.dimg > amp-img'
-		image = f"https://dictionary.cambridge.org/{link['src']}" if (link := content.select_one(image_class)) else ''
-		level = level.get_text().strip() if (level := content.select_one('.def-info.ddef-info')) else ''
-		description = content.select_one('.def.ddef_d.db').get_text().strip()
-
-		the_content = {
-			'level': level,
-			'description': description,
-			'image': image
-		}
+		query = normalization.make_query('cambridge', 'english', search)
+		req = query.url("https://dictionary.cambridge.org/us/dictionary/english/{term}")
+		try:
+			# Fetches and parses the dictionary entries
+			examples = await self.client.lookup.fetch(req, scrapers.parse_cambridge, key=query.key, cache=True, headers=self.headers)
+		except UpstreamError:
+			return await interaction.respond(f"**{member.mention}, something went wrong with that search!**", ephemeral=True)
 
-		return the_content
+		if not examples:
+			return await interaction.respond(f"**{member.mention}, nothing found for the given search!**", ephemeral=True)
 
-	async def get_examples(self, example) -> List[Any]:
-		""" Get examples for the given search. 
-		:param example: The whole HTML of the search wor example. """
 
-		# Gets the main examples div
-		examples_div = example.select_one('.def-body.ddef_b')
-		# Gets all examples
-		examples = []
-		if examples_div:
-			examples = examples_div.select('.examp.dexamp')
-			examples = list(map(lambda ex: ex.get_text().strip(), examples))
+		# Builds the pages up front, so the view only keeps their text
+		view = PaginatorView(self.make_pages(req, search, examples), client=self.client)
+		embed = await view.make_embed(interaction.author)
+		await interaction.respond(embed=embed, view=view)
 
-		return examples
-
-	async def make_embed(self, req: str, member: Union[discord.Member, discord.User], search: str, example: Any, 
-		offset: int, lentries: int, entries: Dict[str, Any], title: str = None, result: str = None) -> discord.Embed:
-		""" Makes an embed for the current search example.
+	def make_pages(self, req: str, search: str, examples: List[Dict[str, Any]]) -> List[Page]:
+		""" Makes a page for each dictionary entry.
 		:param req: The request URL link.
-		:param member: The member who triggered the command.
 		:param search: The search that was performed.
-		:param example: The current search example.
-		:param offset: The current page of the total entries.
-		:param lentries: The length of entries for the given search.
-		:param entries: The entries of the search.
-		:param title: The title of the search.
-		:param result: The result of the search. """
+		:param examples: The parsed dictionary entries. """
 
-		header = await self.get_header(example)
-		current_time = await utils.get_time_now()
+		pages = []
+		for example in examples:
+			header, content = example['header'], example['content']
+			# Adds a content field with the word level (a1, a2, b1, b2, c1, c2) and the description
+			fields = [(f"({content['level']})", content['description'], False)]
+			# Adds a field for each example
+			for i, value in enumerate(example['examples']):
+				fields.append((f"Example {i+1}", f"```{value}```", True))
 
-		# Makes the embed's header
-		embed = discord.Embed(
-			title=f"Search for __{search}__",
-			description=f"**Title:** `{header['title']}`\n**Kind:** `{header['kind']}`\n**Phonetics:** `{header['phonetics']}`",
-			color=member.color,
-			timestamp=current_time,
-			url=req
-		)
+			pages.append(Page(
+				title=f"Search for __{search}__",
+				description=f"**Title:** `{header['title']}`\n**Kind:** `{header['kind']}`\n**Phonetics:** `{header['phonetics']}`",
+				url=req,
+				fields=tuple(fields),
+				thumbnail=content['image']
+			))
 
-		# Adds a content field with the search value description
-		content = await self.get_content(example)
-		# Adds a word level and an image if there is one, respectively
-		embed.add_field(name=f"({content['level']})", value=content['description'], inline=False)
-		embed.set_thumbnail(url=content['image'])
-		examples = await self.get_examples(example)
-		# Adds a field for each example
-		for i, example in enumerate(examples):
-			embed.add_field(name=f"Example {i+1}", value=f"```{example}```", inline=True)
-
-		# Sets the author of the search
-		embed.set_author(name=member, icon_url=member.display_avatar)
-		# Makes a footer with the a current page and total page counter
-		embed.set_footer(text=f"{offset}/{lentries}", icon_url=member.guild.icon.url)
-
-		return embed
+		return pages
 
 
 	@_dictionary.command(name="french")
@@ -201,29 +101,28 @@ class Dictionaries(commands.Cog):
 
 		await interaction.defer(ephemeral=True)
 
-		url = f"https://dicolink.p.rapidapi.com/mot/{search.strip().replace(' ', '%20')}/definitions"
+		url = normalization.make_query('dicolink', 'french', search).url("https://dicolink.p.rapidapi.com/mot/{term}/definitions")
 
 		headers = {
 			'x-rapidapi-key': os.getenv('RAPID_API_TOKEN'),
 			'x-rapidapi-host': "dicolink.p.rapidapi.com"
 		}
 
-		async with self.session.get(url=url, headers=headers) as response:
-			if response.status != 200:
-				return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
-
-			data = json.loads(await response.read())
-
-			# Additional data:
-			additional = {
-				'client': self.client,
-				'req': response,
-				'search': search,
-				'change_embed': self.make_french_embed
-			}
-			view = PaginatorView(data, **additional)
-			embed = await view.make_embed(interaction.author)
-			await interaction.respond(embed=embed, view=view)
+		try:
+			data = await self.client.lookup.fetch(url, json.loads, headers=headers)
+		except UpstreamError:
+			return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
+
+		# Additional data:
+		additional = {
+			'client': self.client,
+			'req': url,
+			'search': search,
+			'change_embed': self.make_french_embed
+		}
+		view = PaginatorView(data, **additional)
+		embed = await view.make_embed(interaction.author)
+		await interaction.respond(embed=embed, view=view)
 
 
 	async def make_french_embed(self, req: str, member: Union[discord.Member, discord.User], search: str, example: Any, 
@@ -4,12 +4,12 @@ from discord.ext import commands
 from discord import ApplicationContext, slash_command, Option, SlashCommandGroup
 
 import json
-import aiohttp
 import os
 
 from typing import Any, Union, Dict
 from others.views import PaginatorView
-from others import utils
+from others import utils, normalization
+from others.lookup import UpstreamError
 
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
@@ -23,7 +23,6 @@ class Expressions(commands.Cog):
 		""" Class initializing method. """
 
 		self.client = client
-		self.session = aiohttp.ClientSession(loop=client.loop)
 
 	_expression = SlashCommandGroup("expression", "Searches for an expression in a given language.", guild_ids=TEST_GUILDS)
 
@@ -42,7 +41,7 @@ class Expressions(commands.Cog):
 		await interaction.defer(ephemeral=True)
 		member = interaction.author
 
-		url = f"https://dicolink.p.rapidapi.com/mot/{search.strip().replace(' ', '%20')}/expressions"
+		url = normalization.make_query('dicolink', 'french', search).url("https://dicolink.p.rapidapi.com/mot/{term}/expressions")
 
 		querystring = {"limite": "10"}
 
@@ -51,23 +50,21 @@ class Expressions(commands.Cog):
 			'x-rapidapi-host': "dicolink.p.rapidapi.com"
 			}
 
-		async with self.session.get(url=url, headers=headers, params=querystring) as response:
-
-			if response.status != 200:
-				self.french.reset_cooldown(interaction)
-				return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
-
-			data = json.loads(await response.read())
-
-			# Additional data:
-			additional = {
-				'req': response,
-				'search': search,
-				'change_embed': self.make_french_embed
-			}
-			view = PaginatorView(data, **additional)
-			embed = await view.make_embed(interaction.author)
-			await interaction.respond(embed=embed, view=view)
+		try:
+			data = await self.client.lookup.fetch(url, json.loads, headers=headers, params=querystring)
+		except UpstreamError:
+			self.french.reset_cooldown(interaction)
+			return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
+
+		# Additional data:
+		additional = {
+			'req': url,
+			'search': search,
+			'change_embed': self.make_french_embed
+		}
+		view = PaginatorView(data, **additional)
+		embed = await view.make_embed(interaction.author)
+		await interaction.respond(embed=embed, view=view)
 
 	async def make_french_embed(self, req: str, member: Union[discord.Member, discord.User], search: str, example: Any, 
 		offset: int, lentries: int, entries: Dict[str, Any], title: str = None, result: str = None) -> discord.Embed:
@@ -4,19 +4,24 @@ from discord.ext import commands
 from discord import Option, SlashCommandGroup, ApplicationContext, slash_command
 
 import os
+import time
 import asyncio
 import aiomysql
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, List, Dict, Union
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple, Union
 
 from others import utils
-from others.views import PaginatorView
+from others.views import PaginatorView, KeysetPaginatorView
 from others.prompt.menu import ConfirmButton
 from others.customerrors import NotInWhitelist
 
 # Environment variables
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
+# Search settings (must match MySQL's ngram_token_size)
+NGRAM_TOKEN_SIZE = int(os.getenv("DB_NGRAM_TOKEN_SIZE", 2))
+SEARCH_LIMIT = 50
 
 
 class FlashCard(commands.Cog):
@@ -28,6 +33,17 @@ class FlashCard(commands.Cog):
     self.client = client
     self.loop = asyncio.get_event_loop()
     self.whitelist: List[int] = []
+    self.pool: Optional[aiomysql.Pool] = None
+    self.pool_lock = asyncio.Lock()
+    self.pool_stats: Dict[str, Union[int, float]] = {"acquires": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+  def cog_unload(self) -> None:
+    """ Closes the connection pool when the cog is unloaded. """
+
+    if self.pool is not None:
+      self.pool.close()
+      self.loop.create_task(self.pool.wait_closed())
+      self.pool = None
 
   _card = SlashCommandGroup('card', 'FlashCard manager', guild_ids=TEST_GUILDS)
   
@@ -138,11 +154,15 @@ class FlashCard(commands.Cog):
       return await interaction.respond("**This server is not whitelisted!**", ephemeral=True)
 
     member = interaction.author
-    cards = await self.get_user_cards(member.id)
-    if not cards:
+    total = await self.count_user_cards(member.id)
+    if not total:
       return await interaction.respond("**No cards to show!**", ephemeral=True)
 
-    await self.pagination_looping(interaction, member, cards)
+    # Only the current page of cards is kept in memory, the others are fetched on demand
+    fetch_page = lambda **kwargs: self.get_user_cards(member.id, **kwargs)
+    view = KeysetPaginatorView(total, fetch_page, change_embed=self.make_cards_embed, page_size=2)
+    embed = await view.make_embed(interaction.author)
+    await interaction.respond(embed=embed, view=view)
 
   @_card.command(name="search")
   @commands.cooldown(1, 15, commands.BucketType.user)
@@ -183,6 +203,17 @@ class FlashCard(commands.Cog):
       entries: Dict[str, Any], req: str = None, search: str = None, title: str = None, result: str = None
     ) -> discord.Embed:
 
+    return await self.make_cards_embed(member, entries[offset-1:offset+1], offset, lentries)
+
+  async def make_cards_embed(self, 
+      member: Union[discord.Member, discord.User], entries: List[List[Any]], offset: int, lentries: int
+    ) -> discord.Embed:
+    """ Makes an embed for a page of cards.
+    :param member: The owner of the cards.
+    :param entries: The cards of the current page.
+    :param offset: The position of the first card of the page, starting at 1.
+    :param lentries: The total amount of cards. """
+
     current_time = await utils.get_time_now()
 
     embed = discord.Embed(
@@ -194,12 +225,8 @@ class FlashCard(commands.Cog):
 
     embed.set_footer(text=f"{offset}-{offset+1} of {lentries}")
 
-    # Adds two fields to the embed
-    for i in range(2):
-      if lentries <= offset - 1 + i:
-        break
-
-      card = entries[offset-1+i]
+    # Adds a field for each card of the page
+    for i, card in enumerate(entries):
       creation = datetime.fromtimestamp(card[4])
       
       embed.add_field(
@@ -220,19 +247,38 @@ class FlashCard(commands.Cog):
     if await self.table_exists():
       return await interaction.respond("**The __Cards__ table already exists!**", ephemeral=True)
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("""CREATE TABLE Cards (
-      card_id BIGINT NOT NULL AUTO_INCREMENT,
-      user_id BIGINT NOT NULL,
-      front_value VARCHAR(300) NOT NULL,
-      back_value VARCHAR(300) NOT NULL,
-      timestamp BIGINT NOT NULL,
-      PRIMARY KEY (card_id)
-    ) DEFAULT CHARSET=utf8mb4""")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("""CREATE TABLE Cards (
+        card_id BIGINT NOT NULL AUTO_INCREMENT,
+        user_id BIGINT NOT NULL,
+        front_value VARCHAR(300) NOT NULL,
+        back_value VARCHAR(300) NOT NULL,
+        timestamp BIGINT NOT NULL,
+        PRIMARY KEY (card_id),
+        INDEX idx_cards_user (user_id, card_id),
+        FULLTEXT INDEX ft_cards_values (front_value, back_value) WITH PARSER ngram
+      ) DEFAULT CHARSET=utf8mb4""")
+      await db.commit()
     await interaction.respond("**Table __Cards__ created!**", ephemeral=True)
 
+  # @slash_command(guild_ids=TEST_GUILDS)
+  # @commands.is_owner()
+  async def create_table_indexes(self, interaction) -> None:
+    """ Adds the search indexes to an existing Cards table. """
+
+    if not await self.table_exists():
+      return await interaction.respond("**The __Cards__ table doesn't exist!**", ephemeral=True)
+
+    if await self.table_indexes_exist():
+      return await interaction.respond("**The __Cards__ indexes already exist!**", ephemeral=True)
+
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("""ALTER TABLE Cards
+        ADD INDEX idx_cards_user (user_id, card_id),
+        ADD FULLTEXT INDEX ft_cards_values (front_value, back_value) WITH PARSER ngram""")
+      await db.commit()
+    await interaction.respond("**Indexes for __Cards__ created!**", ephemeral=True)
+
   # @slash_command(guild_ids=TEST_GUILDS)
   # @commands.is_owner()
   async def drop_table(self, interaction) -> None:
@@ -241,10 +287,9 @@ class FlashCard(commands.Cog):
     if not await self.table_exists():
       return await interaction.respond("**The __Cards__ table doesn't exist!**", ephemeral=True)
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DROP TABLE Cards")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DROP TABLE Cards")
+      await db.commit()
     await interaction.respond("**Table __Cards__ dropped!**", ephemeral=True)
 
   # @slash_command(guild_ids=TEST_GUILDS)
@@ -255,24 +300,33 @@ class FlashCard(commands.Cog):
     if not await self.table_exists():
       return await interaction.respond("**The __Cards__ table doesn't exist yet!**", ephemeral=True)
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DELETE FROM Cards")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DELETE FROM Cards")
+      await db.commit()
     await interaction.respond("**Table __Cards__ reset!**", ephemeral=True)
 
   async def table_exists(self) -> bool:
     """ Gets all existing tables from the database. """
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("SHOW TABLE STATUS LIKE 'Cards'")
-    table = await mycursor.fetchone()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("SHOW TABLE STATUS LIKE 'Cards'")
+      table = await mycursor.fetchone()
     if table:
       return True
     else:
       return False
 
+  async def table_indexes_exist(self) -> bool:
+    """ Checks whether the search indexes of the Cards table exist. """
+
+    async with self.the_database() as (mycursor, _):
+      await mycursor.execute("SHOW INDEX FROM Cards WHERE Key_name = 'ft_cards_values'")
+      index = await mycursor.fetchone()
+    if index:
+      return True
+    else:
+      return False
+
   async def _insert_card(self, server_id: int, user_id: int, front: str, back: str, timestamp: int) -> bool:
     """ Checks whether the Cards table exists. 
     :param server_id: The ID of the server which to check whether it's whitelisted.
@@ -285,12 +339,11 @@ class FlashCard(commands.Cog):
     if server_id not in self.whitelist:
       return False
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("""INSERT INTO Cards (
-      user_id, front_value, back_value, timestamp) 
-      VALUES (%s, %s, %s, %s)""", (user_id, front, back, timestamp))
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("""INSERT INTO Cards (
+        user_id, front_value, back_value, timestamp) 
+        VALUES (%s, %s, %s, %s)""", (user_id, front, back, timestamp))
+      await db.commit()
     return True
 
   async def _delete_card(self, user_id: int, card_id: int) -> None:
@@ -298,32 +351,68 @@ class FlashCard(commands.Cog):
     :param user_id: The ID of the user from which the card is gonna be deleted.
     :param card_id: The ID of the card that is gonna be deleted. """
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DELETE FROM Cards WHERE user_id = %s and card_id = %s", (user_id, card_id))
-    await db.commit()
-    await mycursor.close()
-
-  async def get_user_cards(self, user_id: int) -> List[List[str]]:
-    """ Gets all cards of a particular user.
-    :param user_id: The ID of the user of which to get the cards. """
-
-    mycursor, _ = await self.the_database()
-    await mycursor.execute("SELECT * FROM Cards WHERE user_id = %s", (user_id,))
-    cards = await mycursor.fetchall()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DELETE FROM Cards WHERE user_id = %s and card_id = %s", (user_id, card_id))
+      await db.commit()
+
+  async def count_user_cards(self, user_id: int) -> int:
+    """ Counts the cards of a particular user.
+    :param user_id: The ID of the user of which to count the cards. """
+
+    async with self.the_database() as (mycursor, _):
+      await mycursor.execute("SELECT COUNT(*) FROM Cards WHERE user_id = %s", (user_id,))
+      count = await mycursor.fetchone()
+    return count[0]
+
+  async def get_user_cards(self, user_id: int, limit: int, after: int = 0, before: int = None) -> List[List[str]]:
+    """ Gets a page of cards of a particular user, ordered by card ID.
+    :param user_id: The ID of the user of which to get the cards.
+    :param limit: The maximum amount of cards to get.
+    :param after: Gets the cards with an ID greater than this one.
+    :param before: Gets the cards with an ID lower than this one instead. """
+
+    async with self.the_database() as (mycursor, _):
+      if before is not None:
+        await mycursor.execute("""
+          SELECT * FROM Cards WHERE user_id = %s AND card_id < %s
+          ORDER BY card_id DESC LIMIT %s""", (user_id, before, limit))
+        cards = list(reversed(await mycursor.fetchall()))
+      else:
+        await mycursor.execute("""
+          SELECT * FROM Cards WHERE user_id = %s AND card_id > %s
+          ORDER BY card_id LIMIT %s""", (user_id, after, limit))
+        cards = list(await mycursor.fetchall())
     return cards
 
-  async def fetch_values(self, user_id: int, values: str) -> List[List[str]]:
-    """ Fetch cards from the user's deck with the given values. 
+  async def fetch_values(self, user_id: int, values: str, limit: int = SEARCH_LIMIT) -> List[List[str]]:
+    """ Fetch cards from the user's deck with the given values, best matches first.
     :param user_id: The ID of the user from which the values are gonna be searched.
-    :param values: The values for which are gonna be searched. """
-
-    mycursor, _ = await self.the_database()
-    sql = "SELECT * FROM Cards WHERE user_id = " + str(user_id) + " AND front_value like '%" + \
-    values + "%' OR back_value like '%" + values + "%'"
-    await mycursor.execute(sql)
-    found_values =  await mycursor.fetchall()
-    await mycursor.close()
+    :param values: The values for which are gonna be searched.
+    :param limit: The maximum amount of cards to return. """
+
+    values = values.strip()
+    async with self.the_database() as (mycursor, _):
+      if len(values) >= NGRAM_TOKEN_SIZE:
+        # Ranked search over the n-gram FULLTEXT index
+        await mycursor.execute("""
+          SELECT card_id, user_id, front_value, back_value, timestamp,
+            MATCH (front_value, back_value) AGAINST (%s IN NATURAL LANGUAGE MODE) AS score
+          FROM Cards
+          WHERE user_id = %s AND MATCH (front_value, back_value) AGAINST (%s IN NATURAL LANGUAGE MODE)
+          ORDER BY score DESC, card_id
+          LIMIT %s""", (values, user_id, values, limit))
+      else:
+        # Values shorter than an n-gram token can't use the FULLTEXT index,
+        # so it scans the user's own cards through the (user_id, card_id) index
+        pattern = '%' + values.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        await mycursor.execute("""
+          SELECT card_id, user_id, front_value, back_value, timestamp
+          FROM Cards
+          WHERE user_id = %s AND (front_value LIKE %s OR back_value LIKE %s)
+          ORDER BY card_id
+          LIMIT %s""", (user_id, pattern, pattern, limit))
+
+      found_values = await mycursor.fetchall()
     return found_values
 
   async def card_exists(self, user_id: int, card_id: int) -> bool:
@@ -332,10 +421,9 @@ class FlashCard(commands.Cog):
     :param card_id: The ID of the card which it is gonna check.
     """
 
-    mycursor, _ = await self.the_database()
-    await mycursor.execute("SELECT card_id FROM Cards WHERE user_id = %s and card_id = %s", (user_id, card_id))
-    card_exists = await mycursor.fetchone()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, _):
+      await mycursor.execute("SELECT card_id FROM Cards WHERE user_id = %s and card_id = %s", (user_id, card_id))
+      card_exists = await mycursor.fetchone()
     if card_exists:
       return True
     else:
@@ -390,13 +478,12 @@ class FlashCard(commands.Cog):
     if await self.table_whitelist_exists():
       return await interaction.respond("**The __Whitelist__ table already exists!**", ephemeral=True)
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("""CREATE TABLE Whitelist (
-      server_id BIGINT NOT NULL,
-      PRIMARY KEY (server_id)
-    ) DEFAULT CHARSET=utf8mb4""")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("""CREATE TABLE Whitelist (
+        server_id BIGINT NOT NULL,
+        PRIMARY KEY (server_id)
+      ) DEFAULT CHARSET=utf8mb4""")
+      await db.commit()
     await interaction.respond("**Table __Whitelist__ created!**", ephemeral=True)
 
   # @slash_command(guild_ids=TEST_GUILDS)
@@ -407,10 +494,9 @@ class FlashCard(commands.Cog):
     if not await self.table_whitelist_exists():
       return await interaction.respond("**The __Whitelist__ table doesn't exist!**")
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DROP TABLE Whitelist")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DROP TABLE Whitelist")
+      await db.commit()
     await interaction.respond("**Table __Whitelist__ dropped!**", ephemeral=True)
 
   # @slash_command(guild_ids=TEST_GUILDS)
@@ -421,19 +507,17 @@ class FlashCard(commands.Cog):
     if not await self.table_whitelist_exists():
       return await interaction.respond("**The __Whitelist__ table doesn't exist yet!**")
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DELETE FROM Whitelist")
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DELETE FROM Whitelist")
+      await db.commit()
     await interaction.respond("**Table __Whitelist__ reset!**", ephemeral=True)
 
   async def table_whitelist_exists(self) -> bool:
     """ Checks whether the table Whitelist exists. """
 
-    mycursor, _ = await self.the_database()
-    await mycursor.execute("SHOW TABLE STATUS LIKE 'Whitelist'")
-    exists = await mycursor.fetchone()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, _):
+      await mycursor.execute("SHOW TABLE STATUS LIKE 'Whitelist'")
+      exists = await mycursor.fetchone()
     if exists:
       return True
     else:
@@ -443,44 +527,89 @@ class FlashCard(commands.Cog):
     """ Inserts a server into the whitelist. 
     :param server_id: The ID of the server which to insert into the whitelist. """
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("INSERT INTO Whitelist (server_id) VALUES (%s)", (server_id,))
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("INSERT INTO Whitelist (server_id) VALUES (%s)", (server_id,))
+      await db.commit()
     return True
 
   async def _delete_server(self, server_id: int) -> None:
     """ Deletes a server from the whitelist. 
     :param server_id: The ID of the server which to delete from the whitelist. """
 
-    mycursor, db = await self.the_database()
-    await mycursor.execute("DELETE FROM Whitelist WHERE server_id = %s", (server_id,))
-    await db.commit()
-    await mycursor.close()
+    async with self.the_database() as (mycursor, db):
+      await mycursor.execute("DELETE FROM Whitelist WHERE server_id = %s", (server_id,))
+      await db.commit()
 
   async def get_whitelist(self) -> List[int]:
     """ Gets all existing servers that are in the whitelist. """
 
-    mycursor, _ = await self.the_database()
-    await mycursor.execute("SELECT server_id FROM Whitelist")
-    whitelist = [s[0] for s in await mycursor.fetchall()]
-    await mycursor.close()
+    async with self.the_database() as (mycursor, _):
+      await mycursor.execute("SELECT server_id FROM Whitelist")
+      whitelist = [s[0] for s in await mycursor.fetchall()]
     
     return whitelist
 
-  async def the_database(self) -> List[Any]:
-    """ Gets a database connection. """
+  # Connection pool
+
+  async def get_pool(self) -> aiomysql.Pool:
+    """ Gets the cog's connection pool, creating it on first use. """
+
+    async with self.pool_lock:
+      if self.pool is None:
+        self.pool = await aiomysql.create_pool(
+          host=os.getenv("DB_HOST"),
+          user=os.getenv("DB_USER"),
+          password=os.getenv("DB_PASSWORD"),
+          db=os.getenv("DB_NAME"),
+          minsize=int(os.getenv("DB_POOL_MINSIZE", 1)),
+          maxsize=int(os.getenv("DB_POOL_MAXSIZE", 10)),
+          pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 3600)),
+          autocommit=True,
+          loop=self.loop
+        )
+
+    return self.pool
+
+  @asynccontextmanager
+  async def the_database(self) -> AsyncIterator[Tuple[aiomysql.Cursor, aiomysql.Connection]]:
+    """ Acquires a connection from the pool and a cursor, releasing both on exit. """
+
+    pool = await self.get_pool()
+    start = time.perf_counter()
+    async with pool.acquire() as db:
+      wait = time.perf_counter() - start
+      self.pool_stats["acquires"] += 1
+      self.pool_stats["wait_total"] += wait
+      self.pool_stats["wait_max"] = max(self.pool_stats["wait_max"], wait)
+
+      async with db.cursor() as mycursor:
+        yield mycursor, db
+
+  def get_pool_metrics(self) -> Dict[str, Union[int, float]]:
+    """ Gets the current usage metrics of the connection pool. """
+
+    acquires = self.pool_stats["acquires"]
+    size = self.pool.size if self.pool else 0
+    idle = self.pool.freesize if self.pool else 0
+    return {
+      "minsize": self.pool.minsize if self.pool else 0,
+      "maxsize": self.pool.maxsize if self.pool else 0,
+      "size": size,
+      "in_use": size - idle,
+      "idle": idle,
+      "acquires": acquires,
+      "wait_avg_ms": (self.pool_stats["wait_total"] / acquires * 1000) if acquires else 0.0,
+      "wait_max_ms": self.pool_stats["wait_max"] * 1000
+    }
 
-    con = await aiomysql.create_pool(
-      host=os.getenv("DB_HOST"),
-      user=os.getenv("DB_USER"),
-      password=os.getenv("DB_PASSWORD"),
-      db=os.getenv("DB_NAME"),
-      loop=self.loop
-    )
-    db = await con.acquire()
-    mycursor = await db.cursor()
-    return mycursor, db
+  @slash_command(name="dbpool", guild_ids=TEST_GUILDS)
+  @commands.is_owner()
+  async def _db_pool(self, interaction) -> None:
+    """ (Owner) Shows the database connection pool metrics. """
+
+    metrics = self.get_pool_metrics()
+    text = '\n'.join(f"{key:<12}| {value:.2f}" if isinstance(value, float) else f"{key:<12}| {value}" for key, value in metrics.items())
+    await interaction.respond(f"```apache\n{text}```", ephemeral=True)
 
 """
 CREATE TABLE `cards` (
@@ -489,7 +618,9 @@ CREATE TABLE `cards` (
   `front_value` varchar(300) NOT NULL,
   `back_value` varchar(300) NOT NULL,
   `timestamp` bigint(20) NOT NULL,
-  PRIMARY KEY (`card_id`)
+  PRIMARY KEY (`card_id`),
+  KEY `idx_cards_user` (`user_id`, `card_id`),
+  FULLTEXT KEY `ft_cards_values` (`front_value`, `back_value`) /*!50100 WITH PARSER `ngram` */
 ) ENGINE=InnoDB AUTO_INCREMENT=16488 DEFAULT CHARSET=utf8mb4
 """
 
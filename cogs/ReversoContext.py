@@ -2,12 +2,11 @@ import discord
 from discord.ext import commands
 from discord import ApplicationContext, SlashCommandGroup, Option
 import asyncio
-import aiohttp
 import json
-from bs4 import BeautifulSoup
 
 import os
-from others import utils
+from others import utils, scrapers, normalization
+from others.lookup import UpstreamError
 from others.views import ReversoContextView
 from typing import Union, Any, List, Dict
 
@@ -22,7 +21,6 @@ class ReversoContext(commands.Cog):
     """ Class initializing method."""
 
     self.client = client
-    self.session = aiohttp.ClientSession(loop=client.loop)
     self.headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                       "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -123,46 +121,31 @@ class ReversoContext(commands.Cog):
     :param language: The language that it's being searched for."""
 
     await interaction.defer(ephemeral=True)
-    req = f"{root}/{search.replace(' ', '%20')}"
-
-    async with self.session.get(req, headers=self.headers) as response:
-      if not response.status == 200:
-        return await interaction.send("**Something went wrong with that search!**")
-
-      html = BeautifulSoup(await response.read(), 'html.parser')
-
-      # Gets  all examples
-      examples = html.select('#examples-content > div')
-      groups = []
-
-      # Strips and formats the content text for each example
-      for ex in examples:
-        original = ex.select_one('div.src.ltr')
-        translation = ex.select_one('div.trg.ltr')
-        if not original and not translation:
-          continue
-
-        original = original.get_text().strip()
-        translation = translation.get_text().strip()
-        groups.append({'original': original, 'translation': translation})
-
-      
-      # Gets all translations
-      translations = [tr.get_text().strip() for tr in html.select('#translations-content > a') if tr.get_text()]
-      
-      # Additional data:
-      additional = {
-        'client': self.client,
-        'cog': self,
-        'emoji': emoji,
-        'search': search,
-        'title': language,
-        'translations': translations,
-        'change_embed': self.make_context_embed
-      }
-      view = ReversoContextView(groups, **additional)
-      embed = await view.make_embed(interaction.author)
-      await interaction.respond(embed=embed, view=view)
+    query = normalization.make_query('reverso_context', language.lower(), search)
+    req = query.url("{root}/{term}", root=root)
+
+    try:
+      # Fetches and parses the examples and translations
+      context = await self.client.lookup.fetch(req, scrapers.parse_reverso_context, key=query.key, cache=True, headers=self.headers)
+    except UpstreamError:
+      return await interaction.send("**Something went wrong with that search!**")
+
+    groups = context['examples']
+    translations = context['translations']
+
+    # Additional data:
+    additional = {
+      'client': self.client,
+      'cog': self,
+      'emoji': emoji,
+      'search': search,
+      'title': language,
+      'translations': translations,
+      'change_embed': self.make_context_embed
+    }
+    view = ReversoContextView(groups, **additional)
+    embed = await view.make_embed(interaction.author)
+    await interaction.respond(embed=embed, view=view)
 
   async def make_context_embed(self, req, emoji: str, member: Union[discord.Member, discord.User], search: str, example: Any, 
     offset: int, lentries: int, entries: Dict[str, Any], title: str, translations: List[str]) -> discord.Embed:
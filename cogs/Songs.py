@@ -1,13 +1,11 @@
-import discord
 from discord.ext import commands
 from discord import Option, SlashCommandGroup
 
-import aiohttp
-from bs4 import BeautifulSoup
 
-from others import utils
-from others.views import PaginatorView
-from typing import Any, Union, Dict
+from others import utils, scrapers, normalization
+from others.lookup import UpstreamError
+from others.views import PaginatorView, Page
+from typing import Dict, List
 import os
 
 IS_LOCAL = utils.is_local()
@@ -19,7 +17,6 @@ class Songs(commands.Cog):
 
     def __init__(self, client) -> None:
         self.client = client
-        self.session = aiohttp.ClientSession(loop=client.loop)
         self.lyrics = "https://www.lyrics.com"
 
     _find_by = SlashCommandGroup('find_by', "Searches a song", guild_ids=TEST_GUILDS)
@@ -37,101 +34,36 @@ class Songs(commands.Cog):
         member = interaction.author
         await interaction.defer(ephemeral=True)
 
-        query = await self.clean_url(value)
-        req = f"{self.lyrics}/lyrics/{query}"
-        async with self.session.get(req) as response:
-
-            if response.status != 200:
-                return await interaction.respond(f"**Something went wrong with that search, {member.mention}!**", ephemeral=True)
-
-            html = BeautifulSoup(await response.read(), 'html.parser')
-
-            songs = html.select('.sec-lyric.clearfix')
-            if not songs:
-                return await interaction.respond(f"**Nothing found for that search, {member.mention}!**", ephemeral=True)
-
-            # Additional data:
-            additional = {
-                'client': self.client,
-                'req': req,
-                'search': value,
-                'change_embed': self.make_embed
-            }
-            view = PaginatorView(songs, **additional)
-            embed = await view.make_embed(interaction.author)
-            await interaction.respond(embed=embed, view=view)
-
-    async def make_embed(self,
-                         req: str, member: Union[discord.Member, discord.User], search: str, example: Any,
-                         offset: int, lentries: int, entries: Dict[str, Any], title: str = None, result: str = None
-                         ) -> discord.Embed:
-        """ Makes an embed for the current search example.
+        query = normalization.make_query('lyrics', None, value)
+        req = query.url("{root}/lyrics/{term}", root=self.lyrics)
+        try:
+            # Fetches and parses the found songs
+            songs = await self.client.lookup.fetch(req, scrapers.parse_lyrics, key=query.key, cache=True)
+        except UpstreamError:
+            return await interaction.respond(f"**Something went wrong with that search, {member.mention}!**", ephemeral=True)
+
+        if not songs:
+            return await interaction.respond(f"**Nothing found for that search, {member.mention}!**", ephemeral=True)
+
+        # Builds the pages up front, so the view only keeps their text
+        view = PaginatorView(self.make_pages(req, value, songs), client=self.client)
+        embed = await view.make_embed(interaction.author)
+        await interaction.respond(embed=embed, view=view)
+
+    def make_pages(self, req: str, search: str, songs: List[Dict[str, str]]) -> List[Page]:
+        """ Makes a page for each found song.
         :param req: The request URL link.
-        :param member: The member who triggered the command.
         :param search: The search that was performed.
-        :param example: The current search example.
-        :param offset: The current page of the total entries.
-        :param lentries: The length of entries for the given search.
-        :param entries: The entries of the search.
-        :param title: The title of the search.
-        :param result: The result of the search. """
-
-        current_time = await utils.get_time_now()
-
-        # Makes the embed's header
-        embed = discord.Embed(
-            title=f"Search for __{search}__",
-            description="",
-            color=member.color,
-            timestamp=current_time,
-            url=req
-        )
-
-        title = example.select_one('.lyric-meta.within-lyrics')
-        href = h if (h := example.select_one('.lyric-meta-title a')['href']) else None
-        embed.add_field(
-            name="__Title__",
-            value=f"[{title.get_text().strip()}]({self.lyrics}/{href})")
-
-        image = img['src'] if (img := example.select_one('.album-thumb img')) else ''
-
-        if image.startswith('https://'):
-            embed.set_thumbnail(url=image)
-
-        # Sets the author of the search
-        embed.set_author(name=member, icon_url=member.display_avatar)
-        # Makes a footer with the a current page and total page counter
-        embed.set_footer(text=f"{offset}/{lentries}", icon_url=member.guild.icon.url)
-
-        return embed
-
-    async def clean_url(self, url: str) -> str:
-        """ Cleans the url link by replacing special characters with an url equivalent characters.
-        :param url: The url to clean. """
-
-        url = url.replace(' ', '%20') \
-            .replace(',', '%2C') \
-            .replace("'", '%27') \
-            .replace('!', '%21') \
-            .replace(':', '%3A') \
-            .replace(';', '%3B') \
-            .replace('>', '%26gt%3B') \
-            .replace('\\', '%5C') \
-            .replace('/', '%2F') \
-            .replace('|', '%7C') \
-            .replace('#', '%23') \
-            .replace('$', '%24') \
-            .replace('%', '%25') \
-            .replace('&', '%26') \
-            .replace('*', '%2A') \
-            .replace('(', '%28') \
-            .replace(')', '%29') \
-            .replace('[', '%5B') \
-            .replace(']', '%5D') \
-            .replace('{', '%7B') \
-            .replace('}', '%7D')
-
-        return url
+        :param songs: The parsed songs. """
+
+        return [
+            Page(
+                title=f"Search for __{search}__",
+                url=req,
+                fields=(("__Title__", f"[{song['title']}]({self.lyrics}/{song['href']})", True),),
+                thumbnail=song['image'] if song['image'].startswith('https://') else None
+            ) for song in songs
+        ]
 
 
 def setup(client) -> None:
@@ -3,11 +3,11 @@ from discord.ext import commands
 from discord import Option, slash_command, SlashCommandGroup, ApplicationContext
 
 import os
-import aiohttp
 import json
 
 from googletrans import Translator
-from others import utils
+from others import utils, normalization, conjugator
+from others.lookup import UpstreamError
 
 IS_LOCAL = utils.is_local()
 TEST_GUILDS = [os.getenv("TEST_GUILD_ID")] if IS_LOCAL else None
@@ -20,7 +20,6 @@ class Tools(commands.Cog):
         """ Class initializing method. """
 
         self.client = client
-        self.session = aiohttp.ClientSession(loop=client.loop)
 
     _synonym = SlashCommandGroup('synonym', 'Finds synonyms for a given word in a given language.', guild_ids=TEST_GUILDS)
     _antonym = SlashCommandGroup('antonym', 'Finds antonyms for a given word in a given language.', guild_ids=TEST_GUILDS)
@@ -68,7 +67,7 @@ class Tools(commands.Cog):
         member = interaction.author
         current_time = await utils.get_time_now()
 
-        url = f"https://dicolink.p.rapidapi.com/mot/{search.strip().replace(' ', '%20')}/synonymes"
+        url = normalization.make_query('dicolink', 'french', search).url("https://dicolink.p.rapidapi.com/mot/{term}/synonymes")
         querystring = {"limite": "10"}
 
         headers = {
@@ -76,28 +75,27 @@ class Tools(commands.Cog):
             'x-rapidapi-host': "dicolink.p.rapidapi.com"
         }
 
-        async with self.session.get(url=url, headers=headers, params=querystring) as response:
-            if response.status != 200:
-                return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
-
-            data = json.loads(await response.read())
+        try:
+            data = await self.client.lookup.fetch(url, json.loads, headers=headers, params=querystring)
+        except UpstreamError:
+            return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
 
-            # Makes the embed's header
-            embed = discord.Embed(
-                title="__French Synonyms__",
-                description=f"Showing results for: {search}",
-                color=member.color,
-                timestamp=current_time
-            )
+        # Makes the embed's header
+        embed = discord.Embed(
+            title="__French Synonyms__",
+            description=f"Showing results for: {search}",
+            color=member.color,
+            timestamp=current_time
+        )
 
-            words = ', '.join(list(map(lambda w: f"**{w['mot']}**", data)))
+        words = ', '.join(list(map(lambda w: f"**{w['mot']}**", data)))
 
-            # Adds a field for each example
-            embed.add_field(name="__Words__", value=words, inline=False)
+        # Adds a field for each example
+        embed.add_field(name="__Words__", value=words, inline=False)
 
-            # Sets the author of the search
-            embed.set_author(name=member, icon_url=member.display_avatar)
-            await interaction.respond(embed=embed, ephemeral=True)
+        # Sets the author of the search
+        embed.set_author(name=member, icon_url=member.display_avatar)
+        await interaction.respond(embed=embed, ephemeral=True)
 
     @_antonym.command(name="french")
     @commands.cooldown(1, 15, commands.BucketType.user)
@@ -109,7 +107,7 @@ class Tools(commands.Cog):
         member = interaction.author
         current_time = await utils.get_time_now()
 
-        url = f"https://dicolink.p.rapidapi.com/mot/{search.strip().replace(' ', '%20')}/antonymes"
+        url = normalization.make_query('dicolink', 'french', search).url("https://dicolink.p.rapidapi.com/mot/{term}/antonymes")
         querystring = {"limite": "10"}
 
         headers = {
@@ -117,28 +115,27 @@ class Tools(commands.Cog):
             'x-rapidapi-host': "dicolink.p.rapidapi.com"
         }
 
-        async with self.session.get(url=url, headers=headers, params=querystring) as response:
-            if response.status != 200:
-                return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
-
-            data = json.loads(await response.read())
+        try:
+            data = await self.client.lookup.fetch(url, json.loads, headers=headers, params=querystring)
+        except UpstreamError:
+            return await interaction.respond(f"**Nothing found, {member.mention}!**", ephemeral=True)
 
-            # Makes the embed's header
-            embed = discord.Embed(
-                title="__French Antonyms__",
-                description=f"Showing results for: {search}",
-                color=member.color,
-                timestamp=current_time
-            )
+        # Makes the embed's header
+        embed = discord.Embed(
+            title="__French Antonyms__",
+            description=f"Showing results for: {search}",
+            color=member.color,
+            timestamp=current_time
+        )
 
-            words = ', '.join(list(map(lambda w: f"**{w['mot']}**", data)))
+        words = ', '.join(list(map(lambda w: f"**{w['mot']}**", data)))
 
-            # Adds a field for each example
-            embed.add_field(name="__Words__", value=words, inline=False)
+        # Adds a field for each example
+        embed.add_field(name="__Words__", value=words, inline=False)
 
-            # Sets the author of the search
-            embed.set_author(name=member, icon_url=member.display_avatar)
-            await interaction.respond(embed=embed, ephemeral=True)
+        # Sets the author of the search
+        embed.set_author(name=member, icon_url=member.display_avatar)
+        await interaction.respond(embed=embed, ephemeral=True)
 
     @slash_command(name="has_sub", guild_ids=TEST_GUILDS)
     @commands.is_owner()
@@ -148,11 +145,29 @@ class Tools(commands.Cog):
         """ Creates a test sku. """
         
         await interaction.defer(ephemeral=True)
-        subscriptions = await self.client.fetch_entitlements()
-        has_subscription = discord.utils.get(subscriptions, user_id=interaction.author.id)
+        subscriptions = self.client.entitlements.get_user_entitlements(interaction.author.id)
+        has_subscription = subscriptions[0] if subscriptions else None
         
         await interaction.respond(content=f"Do you have it? {has_subscription}", ephemeral=True)
 
+    @slash_command(name="lookups", guild_ids=TEST_GUILDS)
+    @commands.is_owner()
+    async def _lookups(self, interaction: ApplicationContext) -> None:
+        """ (Owner) Shows the upstream lookup and per-host request metrics. """
+
+        hosts = self.client.session.get_metrics()
+        for provider, metrics in self.client.lookup.get_breaker_metrics().items():
+            hosts.setdefault(provider, {}).update({f"circuit_{key}": value for key, value in metrics.items()})
+        for provider, metrics in self.client.lookup.get_cache_metrics().items():
+            hosts.setdefault(provider, {}).update({f"cache_{key}": value for key, value in metrics.items()})
+
+        blocks = [("lookups", self.client.lookup.get_metrics()), ("local_conjugation", conjugator.stats), *hosts.items()]
+        text = '\n\n'.join(
+            f"[{name}]\n" + '\n'.join(f"{key:<12}| {value:.2f}" if isinstance(value, float) else f"{key:<12}| {value}" for key, value in metrics.items())
+            for name, metrics in blocks
+        )
+        await interaction.respond(f"```apache\n{text[:1980]}```", ephemeral=True)
+
 
 def setup(client) -> None:
     """ Cog's setup function. """
@@ -5,6 +5,15 @@ from random import randint
 from re import match
 from itertools import cycle
 from others import utils
+from others.entitlements import EntitlementCache
+from others.ratelimit import SQLiteCommandLimitStore
+from others.http_client import HTTPClient
+from others.cache import ResultCache
+from others.workers import ParserPool
+from others.lookup import Lookup, ProviderUnavailable
+from others.querylog import QueryLog
+from others.lemmas import Lemmas
+from others.deadline import DeadlineExceeded, start_deadline
 from others.customerrors import NotInWhitelist, DailyCommandsLimit
 from dotenv import load_dotenv
 load_dotenv()
@@ -39,14 +48,63 @@ status = cycle([
     "Italian context", "German context"
 ])
 
-client = commands.Bot(command_prefix='dec!', intents=discord.Intents.default(), help_command=None)
-client.commands_limit = {}
+
+class Declinator(commands.Bot):
+    """ The bot, owning the resources shared by its cogs. """
+
+    async def close(self) -> None:
+        """ Releases the shared resources before closing the bot. """
+
+        if self.is_closed():
+            return
+
+        await self.session.close()
+        self.commands_limit.close()
+        self.cache.close()
+        self.query_log.close()
+        self.lemmas.close()
+        self.parsers.close()
+        await super().close()
+
+
+client = Declinator(command_prefix='dec!', intents=discord.Intents.default(), help_command=None)
+client.session = HTTPClient()
+client.parsers = ParserPool()
+client.cache = ResultCache(
+    os.getenv("RESULT_CACHE_DB", "files/results_cache.db"),
+    max_memory=int(os.getenv("RESULT_CACHE_MEMORY_MB", 32)) * 1024 * 1024
+)
+# Should be on persistent storage, e.g. a mounted volume, for the warm-up to survive a dyno restart
+client.query_log = QueryLog(os.getenv("QUERY_LOG_DB", "files/query_log.db"))
+client.lookup = Lookup(client.session, client.parsers, client.cache, client.query_log)
+# The autocomplete word lists, each loaded when first used
+client.lemmas = Lemmas(
+    os.getenv("LEMMAS_DIR", "files/lemmas"),
+    max_learned=int(os.getenv("LEMMAS_MAX_LEARNED", 5000)),
+    min_checked_words=int(os.getenv("LEMMAS_MIN_CHECKED_WORDS", 2000))
+)
+client.commands_limit = SQLiteCommandLimitStore(os.getenv("COMMANDS_LIMIT_DB", "files/commands_limit.db"))
+client.entitlements = EntitlementCache(client)
 on_guild_log_id = os.getenv('ON_GUILD_LOG_ID')
 
 
 @client.event
 async def on_ready():
     change_status.start()
+    if not sync_entitlements.is_running():
+        sync_entitlements.start()
+    if not flush_commands_limit.is_running():
+        flush_commands_limit.start()
+    if not purge_cache.is_running():
+        purge_cache.start()
+    if not flush_query_log.is_running():
+        flush_query_log.start()
+    if not flush_lemmas.is_running():
+        flush_lemmas.start()
+    if not warm_cache.is_running():
+        warm_cache.start()
+    if not probe_circuits.is_running():
+        probe_circuits.start()
     print("Bot is ready!")
 
 
@@ -55,6 +113,83 @@ async def change_status():
     await client.change_presence(activity=discord.Activity(type=discord.ActivityType.playing, name=f"{next(status)}!"))
 
 
+@tasks.loop(minutes=int(os.getenv("ENTITLEMENTS_SYNC_MINUTES", 30)))
+async def sync_entitlements():
+    """ Re-syncs the entitlement cache in case a gateway event was missed. """
+
+    try:
+        await client.entitlements.sync()
+    except discord.HTTPException as e:
+        print(f"Couldn't sync entitlements: {e}")
+
+
+@tasks.loop(seconds=int(os.getenv("COMMANDS_LIMIT_FLUSH_SECONDS", 60)))
+async def flush_commands_limit():
+    """ Saves the daily command counters so they survive restarts. """
+
+    await client.commands_limit.flush()
+
+
+@tasks.loop(hours=1)
+async def purge_cache():
+    """ Deletes the expired results from the result cache. """
+
+    await client.cache.purge()
+
+
+@tasks.loop(minutes=5)
+async def flush_query_log():
+    """ Saves the lookup counts used to warm the cache up. """
+
+    await client.query_log.flush()
+
+
+@tasks.loop(minutes=5)
+async def flush_lemmas():
+    """ Saves the words the autocomplete learned. """
+
+    await client.lemmas.flush()
+
+
+@tasks.loop(count=1)
+async def warm_cache():
+    """ Prefetches the most popular lookups into the cache after a restart, giving way to live commands. """
+
+    warmed = await client.lookup.warm_up(int(os.getenv("WARMUP_TOP_N", 200)))
+    print(f"Warmed the cache up with {warmed} lookups")
+
+
+@tasks.loop(seconds=int(os.getenv("CIRCUIT_PROBE_SECONDS", 10)))
+async def probe_circuits():
+    """ Probes the providers whose circuit is open, closing it as soon as they recover. """
+
+    await client.lookup.probe()
+
+
+@client.before_invoke
+async def start_command_deadline(ctx):
+    """ Gives the command a time budget, which its upstream lookups are bounded by. """
+
+    interaction = getattr(ctx, 'interaction', None)
+    created_at = discord.utils.snowflake_time(interaction.id) if interaction else None
+    start_deadline(float(os.getenv("COMMAND_BUDGET_SECONDS", 30)), created_at)
+
+
+@client.event
+async def on_entitlement_create(entitlement):
+    client.entitlements.add(entitlement)
+
+
+@client.event
+async def on_entitlement_update(entitlement):
+    client.entitlements.add(entitlement)
+
+
+@client.event
+async def on_entitlement_delete(entitlement):
+    client.entitlements.remove(entitlement)
+
+
 @client.event
 async def on_command_error(ctx, error):
     """ Error handler. """
@@ -91,17 +226,24 @@ async def on_command_error(ctx, error):
 async def on_application_command_error(ctx, error) -> None:
 
     if isinstance(error, commands.CommandOnCooldown):
-        if client.commands_limit.get(ctx.author.id):
-            client.commands_limit[ctx.author.id]["limit"] -= 1
+        await client.commands_limit.refund(ctx.author.id)
         secs = int(float(error.retry_after))
         await ctx.respond(content=f"You are on cooldown! Try again in {secs} seconds!", ephemeral=True)
 
     elif isinstance(error, DailyCommandsLimit):
         await ctx.respond(content=f"You reached the {error.limit} daily commands limit. To have limitless commands per day, click on the bot's profile and subscribe to **Premium**!", ephemeral=True)
 
+    elif isinstance(original := getattr(error, 'original', None), ProviderUnavailable):
+        await client.commands_limit.refund(ctx.author.id)
+        secs = max(round(original.retry_in), 1)
+        await ctx.respond(content=f"**`{original.provider}` is having trouble right now, please try again in {secs} second{'s' if secs != 1 else ''}!**", ephemeral=True)
+
+    elif isinstance(getattr(error, 'original', None), DeadlineExceeded):
+        await client.commands_limit.refund(ctx.author.id)
+        await ctx.respond(content="**That took too long to answer, please try again later!**", ephemeral=True)
+
     else:
-        if client.commands_limit.get(ctx.author.id):
-            client.commands_limit[ctx.author.id]["limit"] -= 1
+        await client.commands_limit.refund(ctx.author.id)
         print(error)
 
 
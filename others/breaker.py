@@ -0,0 +1,98 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """ Stops calling a provider after consecutive failures, letting a probe through now and then.
+
+    Closed: calls go through. Open: calls fail fast until the reset timeout
+    is over. Half-open: a single probe goes through, closing the circuit if
+    it succeeds and opening it again if it fails. """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+    # When to retry while a probe is in flight, as its outcome isn't known yet
+    PROBE_RETRY = 5.0
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """ Class init method.
+        :param failure_threshold: How many consecutive failures open the circuit.
+        :param reset_timeout: For how many seconds the circuit stays open before a probe. """
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.stats: Dict[str, int] = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        """ Gets the circuit's current state. """
+
+        if self.opened_at is None:
+            return self.CLOSED
+
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+
+        return self.OPEN
+
+    def retry_in(self) -> float:
+        """ Gets in how many seconds the next probe is let through. """
+
+        if self.opened_at is None:
+            return 0.0
+
+        if (remaining := self.opened_at + self.reset_timeout - time.monotonic()) > 0:
+            return remaining
+
+        return self.PROBE_RETRY if self.probing else 0.0
+
+    def allow(self) -> bool:
+        """ Checks whether a call can go through, taking the probe slot when half-open. """
+
+        state = self.state
+        if state == self.CLOSED:
+            return True
+
+        if state == self.HALF_OPEN and not self.probing:
+            self.probing = True
+            return True
+
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """ Closes the circuit after a successful call. """
+
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        """ Counts a failed call, opening the circuit if needed. """
+
+        self.failures += 1
+        if self.probing or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self.probing:
+                self.stats["opened"] += 1
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+    def release(self) -> None:
+        """ Gives the probe slot back when a call ended without an outcome, e.g. it was cancelled. """
+
+        self.probing = False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """ Gets the circuit's metrics. """
+
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.stats["opened"],
+            "rejected": self.stats["rejected"],
+            "retry_in_s": self.retry_in()
+        }
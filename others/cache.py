@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_key(provider: str, *parts: str) -> str:
+    """ Makes a cache key out of a provider and the parts of a query.
+    :param provider: The website or API the result comes from.
+    :param parts: The query parts, e.g. the language and the searched term. """
+
+    return json.dumps([provider, *parts], ensure_ascii=False)
+
+
+class ResultCache:
+    """ Cache of parsed results with an in-memory LRU tier and a SQLite tier.
+
+    Each result has a hard expiry, after which it is gone, and optionally a
+    soft one, after which it is still served but should be refreshed. """
+
+    def __init__(self, path: str, max_memory: int = 32 * 1024 * 1024, ttl: int = 30 * 86400) -> None:
+        """ Class init method.
+        :param path: The path of the SQLite file.
+        :param max_memory: The maximum size in bytes of the serialized results kept in memory.
+        :param ttl: For how many seconds a result is kept by default. """
+
+        self.path = path
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.memory: "OrderedDict[str, Tuple[Any, int, float, Optional[float]]]" = OrderedDict()
+        self.memory_size = 0
+        self.stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if directory := os.path.dirname(path):
+            os.makedirs(directory, exist_ok=True)
+
+        # SQLite calls run on a single worker thread so they never block the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-cache")
+        self.db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS Results (
+            key TEXT NOT NULL PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            fresh_until REAL
+        )""")
+        # Files made before soft expiries existed lack their column
+        if "fresh_until" not in [column[1] for column in self.db.execute("PRAGMA table_info(Results)")]:
+            self.db.execute("ALTER TABLE Results ADD COLUMN fresh_until REAL")
+        self.db.commit()
+
+    async def _run(self, func, *args) -> Any:
+        """ Runs a SQLite call on the cache's worker thread. """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def _remember(self, key: str, value: Any, size: int, expires_at: float, fresh_until: Optional[float] = None) -> None:
+        """ Puts a result into the memory tier, evicting the least recently used ones if needed. """
+
+        if (old := self.memory.pop(key, None)) is not None:
+            self.memory_size -= old[1]
+
+        if size > self.max_memory:
+            return
+
+        self.memory[key] = (value, size, expires_at, fresh_until)
+        self.memory_size += size
+        while self.memory_size > self.max_memory:
+            _, (_, old_size, _, _) = self.memory.popitem(last=False)
+            self.memory_size -= old_size
+
+    def _forget(self, key: str) -> None:
+        """ Removes a result from the memory tier. """
+
+        if (old := self.memory.pop(key, None)) is not None:
+            self.memory_size -= old[1]
+
+    def _load(self, key: str) -> Optional[Tuple[str, float, Optional[float]]]:
+        """ Reads a serialized result from the SQLite tier. """
+
+        return self.db.execute("SELECT value, expires_at, fresh_until FROM Results WHERE key = ?", (key,)).fetchone()
+
+    def _store(self, key: str, value: str, expires_at: float, fresh_until: Optional[float]) -> None:
+        """ Writes a serialized result to the SQLite tier. """
+
+        self.db.execute("""INSERT INTO Results (key, value, expires_at, fresh_until) VALUES (?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at, fresh_until = excluded.fresh_until""",
+            (key, value, expires_at, fresh_until))
+        self.db.commit()
+
+    def _purge(self) -> int:
+        """ Deletes the expired results from the SQLite tier. """
+
+        deleted = self.db.execute("DELETE FROM Results WHERE expires_at <= ?", (time.time(),)).rowcount
+        self.db.commit()
+        return deleted
+
+    async def get(self, key: str) -> Optional[Any]:
+        """ Gets a result from the cache.
+        :param key: The key made with make_key. """
+
+        entry = await self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    async def get_entry(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """ Gets a result from the cache along with whether it is stale.
+        :param key: The key made with make_key. """
+
+        now = time.time()
+        if (entry := self.memory.get(key)) is not None:
+            if entry[2] > now:
+                self.memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[0], entry[3] is not None and entry[3] <= now
+            self._forget(key)
+
+        row = await self._run(self._load, key)
+        if row is None or row[1] <= now:
+            self.stats["misses"] += 1
+            return None
+
+        value = json.loads(row[0])
+        self._remember(key, value, len(row[0].encode()), row[1], row[2])
+        self.stats["disk_hits"] += 1
+        return value, row[2] is not None and row[2] <= now
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, soft_ttl: Optional[int] = None) -> None:
+        """ Stores a result in both tiers of the cache.
+        :param key: The key made with make_key.
+        :param value: The JSON serializable result.
+        :param ttl: For how many seconds to keep it. Default = the cache's TTL.
+        :param soft_ttl: After how many seconds it becomes stale. Default = it doesn't. """
+
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        fresh_until = None if soft_ttl is None else now + soft_ttl
+        serialized = json.dumps(value, ensure_ascii=False)
+        self._remember(key, value, len(serialized.encode()), expires_at, fresh_until)
+        await self._run(self._store, key, serialized, expires_at, fresh_until)
+
+    async def purge(self) -> int:
+        """ Deletes the expired results from the SQLite tier. """
+
+        return await self._run(self._purge)
+
+    def close(self) -> None:
+        """ Closes the SQLite file. """
+
+        self.executor.shutdown(wait=True)
+        self.db.close()
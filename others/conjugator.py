@@ -0,0 +1,573 @@
+""" Conjugates regular Romance verbs locally, in the same page structure as the Reverso conjugation pages.
+
+Only the verbs listed as regular are answered; any other verb, or one
+using a rule the engine doesn't know, returns None and is looked up on
+Reverso instead. The validation harness, benchmarks/validate_conjugator.py,
+compares the engine against the Reverso tables of the listed verbs.
+
+The Conjugation cog doesn't use the engine unless LOCAL_CONJUGATION=1: it
+hasn't been validated against Reverso yet, so it isn't enabled. """
+
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from others.scrapers import format_tense
+
+# The endings of a tense, one per person: 1st, 2nd and 3rd singular, then 1st, 2nd and 3rd plural
+Endings = Tuple[str, str, str, str, str, str]
+
+
+class Language(NamedTuple):
+    """ The rules a language conjugates its regular verbs with. """
+
+    pronouns: Tuple[str, ...]
+    subjunctive_pronouns: Tuple[str, ...]
+    # Verb class (the infinitive's ending) -> tense -> endings added to the stem
+    endings: Dict[str, Dict[str, Endings]]
+    # Verb class -> (gerund or present participle ending, past participle ending)
+    participles: Dict[str, Tuple[str, str]]
+    # Tense -> the auxiliary's forms, for the compound tenses
+    auxiliary: Dict[str, Endings]
+    # (page, mode, tense name, kind, tense), the kind being 'simple', 'compound', 'imperative' or 'single'
+    layout: Tuple[Tuple[int, str, str, str, str], ...]
+    # The verbs known to be regular
+    regular: FrozenSet[str]
+    # Regular verbs with an irregular past participle
+    past_participles: Dict[str, str] = {}
+    # Verbs conjugated with the second auxiliary, e.g. essere or être, and their agreeing participles
+    second_auxiliary: Dict[str, Endings] = {}
+    second_auxiliary_verbs: FrozenSet[str] = frozenset()
+
+
+def _endings(text: str) -> Endings:
+    """ Splits the six space-separated endings of a tense, '-' standing for an empty one. """
+
+    endings = tuple('' if ending == '-' else ending for ending in text.split())
+    assert len(endings) == 6, text
+    return endings
+
+
+def _spanish_spelling(stem: str, ending: str) -> str:
+    """ Keeps the consonant's sound before e, e.g. busqué and llegue. """
+
+    if ending[:1] in ('e', 'é'):
+        for end, replacement in (('c', 'qu'), ('g', 'gu'), ('z', 'c')):
+            if stem.endswith(end):
+                return stem[:-1] + replacement + ending
+
+    return stem + ending
+
+
+def _portuguese_spelling(stem: str, ending: str) -> str:
+    """ Keeps the consonant's sound before e, e.g. fiquei and comece. """
+
+    if ending[:1] in ('e', 'é', 'ê'):
+        for end, replacement in (('c', 'qu'), ('g', 'gu'), ('ç', 'c')):
+            if stem.endswith(end):
+                return stem[:-1] + replacement + ending
+
+    return stem + ending
+
+
+def _italian_spelling(stem: str, ending: str) -> str:
+    """ Keeps the consonant's sound and drops doubled i's, e.g. cerchi, mangerò and studi. """
+
+    if ending[:1] in ('e', 'i', 'è', 'ì'):
+        if stem.endswith(('c', 'g')):
+            return stem + 'h' + ending
+        if stem.endswith(('ci', 'gi')) and ending[:1] in ('e', 'è'):
+            return stem[:-1] + ending
+    if stem.endswith('i') and ending[:1] == 'i':
+        return stem + ending[1:]
+
+    return stem + ending
+
+
+def _french_spelling(stem: str, ending: str) -> str:
+    """ Keeps the consonant's sound before a and o, e.g. commençons and mangeons. """
+
+    if ending[:1] in ('a', 'â', 'o'):
+        if stem.endswith('c'):
+            return stem[:-1] + 'ç' + ending
+        if stem.endswith('g'):
+            return stem + 'e' + ending
+
+    return stem + ending
+
+
+def _concatenate(stem: str, ending: str) -> str:
+    """ Adds an ending to a stem as it is. """
+
+    return stem + ending
+
+
+SPANISH = Language(
+    pronouns=('yo', 'tú', 'él/ella/Ud.', 'nosotros', 'vosotros', 'ellos/ellas/Uds.'),
+    subjunctive_pronouns=('yo', 'tú', 'él/ella/Ud.', 'nosotros', 'vosotros', 'ellos/ellas/Uds.'),
+    endings={
+        'ar': {
+            'present': _endings("o as a amos áis an"),
+            'imperfect': _endings("aba abas aba ábamos abais aban"),
+            'preterite': _endings("é aste ó amos asteis aron"),
+            'future': _endings("aré arás ará aremos aréis arán"),
+            'conditional': _endings("aría arías aría aríamos aríais arían"),
+            'subjunctive_present': _endings("e es e emos éis en"),
+            'subjunctive_imperfect': _endings("ara aras ara áramos arais aran"),
+            'subjunctive_imperfect_se': _endings("ase ases ase ásemos aseis asen"),
+            'subjunctive_future': _endings("are ares are áremos areis aren"),
+        },
+        'er': {
+            'present': _endings("o es e emos éis en"),
+            'imperfect': _endings("ía ías ía íamos íais ían"),
+            'preterite': _endings("í iste ió imos isteis ieron"),
+            'future': _endings("eré erás erá eremos eréis erán"),
+            'conditional': _endings("ería erías ería eríamos eríais erían"),
+            'subjunctive_present': _endings("a as a amos áis an"),
+            'subjunctive_imperfect': _endings("iera ieras iera iéramos ierais ieran"),
+            'subjunctive_imperfect_se': _endings("iese ieses iese iésemos ieseis iesen"),
+            'subjunctive_future': _endings("iere ieres iere iéremos iereis ieren"),
+        },
+        'ir': {
+            'present': _endings("o es e imos ís en"),
+            'imperfect': _endings("ía ías ía íamos íais ían"),
+            'preterite': _endings("í iste ió imos isteis ieron"),
+            'future': _endings("iré irás irá iremos iréis irán"),
+            'conditional': _endings("iría irías iría iríamos iríais irían"),
+            'subjunctive_present': _endings("a as a amos áis an"),
+            'subjunctive_imperfect': _endings("iera ieras iera iéramos ierais ieran"),
+            'subjunctive_imperfect_se': _endings("iese ieses iese iésemos ieseis iesen"),
+            'subjunctive_future': _endings("iere ieres iere iéremos iereis ieren"),
+        },
+    },
+    participles={'ar': ('ando', 'ado'), 'er': ('iendo', 'ido'), 'ir': ('iendo', 'ido')},
+    auxiliary={
+        'present': _endings("he has ha hemos habéis han"),
+        'imperfect': _endings("había habías había habíamos habíais habían"),
+        'preterite': _endings("hube hubiste hubo hubimos hubisteis hubieron"),
+        'future': _endings("habré habrás habrá habremos habréis habrán"),
+        'conditional': _endings("habría habrías habría habríamos habríais habrían"),
+        'subjunctive_present': _endings("haya hayas haya hayamos hayáis hayan"),
+        'subjunctive_imperfect': _endings("hubiera hubieras hubiera hubiéramos hubierais hubieran"),
+        'subjunctive_imperfect_se': _endings("hubiese hubieses hubiese hubiésemos hubieseis hubiesen"),
+        'subjunctive_future': _endings("hubiere hubieres hubiere hubiéremos hubiereis hubieren"),
+    },
+    layout=(
+        (0, 'Indicativo', 'Presente', 'simple', 'present'),
+        (0, 'Indicativo', 'Futuro', 'simple', 'future'),
+        (0, 'Indicativo', 'Pretérito imperfecto', 'simple', 'imperfect'),
+        (0, 'Indicativo', 'Pretérito perfecto simple', 'simple', 'preterite'),
+        (1, 'Indicativo', 'Pretérito perfecto compuesto', 'compound', 'present'),
+        (1, 'Indicativo', 'Pretérito pluscuamperfecto', 'compound', 'imperfect'),
+        (1, 'Indicativo', 'Pretérito anterior', 'compound', 'preterite'),
+        (1, 'Indicativo', 'Futuro perfecto', 'compound', 'future'),
+        (2, 'Subjuntivo', 'Presente', 'simple', 'subjunctive_present'),
+        (2, 'Subjuntivo', 'Futuro', 'simple', 'subjunctive_future'),
+        (2, 'Subjuntivo', 'Pretérito imperfecto', 'simple', 'subjunctive_imperfect'),
+        (2, 'Subjuntivo', 'Pretérito imperfecto (2)', 'simple', 'subjunctive_imperfect_se'),
+        (3, 'Subjuntivo', 'Pretérito perfecto', 'compound', 'subjunctive_present'),
+        (3, 'Subjuntivo', 'Futuro perfecto', 'compound', 'subjunctive_future'),
+        (3, 'Subjuntivo', 'Pretérito pluscuamperfecto', 'compound', 'subjunctive_imperfect'),
+        (3, 'Subjuntivo', 'Pretérito pluscuamperfecto (2)', 'compound', 'subjunctive_imperfect_se'),
+        (4, 'Condicional', 'Condicional', 'simple', 'conditional'),
+        (4, 'Condicional', 'Condicional perfecto', 'compound', 'conditional'),
+        (4, 'Imperativo', 'Afirmativo', 'imperative', 'affirmative'),
+        (4, 'Imperativo', 'Negativo', 'imperative', 'negative'),
+        (5, 'Gerundio', '...', 'single', 'gerund'),
+        (5, 'Participio', '...', 'single', 'participle'),
+    ),
+    regular=frozenset({
+        'hablar', 'trabajar', 'estudiar', 'caminar', 'cantar', 'bailar', 'mirar', 'escuchar', 'llamar', 'llevar',
+        'necesitar', 'preparar', 'terminar', 'usar', 'viajar', 'ayudar', 'comprar', 'cocinar', 'descansar', 'entrar',
+        'esperar', 'ganar', 'lavar', 'limpiar', 'llegar', 'pagar', 'buscar', 'tocar', 'practicar', 'explicar',
+        'cruzar', 'nadar', 'olvidar', 'pasar', 'preguntar', 'tomar', 'visitar', 'enseñar', 'cambiar', 'dejar',
+        'comer', 'beber', 'aprender', 'comprender', 'correr', 'vender', 'deber', 'meter', 'responder',
+        'temer', 'prometer', 'romper', 'vivir', 'escribir', 'abrir', 'recibir', 'decidir', 'subir', 'partir',
+        'permitir', 'cubrir', 'describir', 'asistir', 'existir', 'insistir', 'sufrir', 'unir', 'discutir',
+    }),
+    past_participles={
+        'abrir': 'abierto', 'escribir': 'escrito', 'romper': 'roto', 'cubrir': 'cubierto', 'describir': 'descrito',
+    },
+)
+
+PORTUGUESE = Language(
+    pronouns=('eu', 'tu', 'ele/ela/você', 'nós', 'vós', 'eles/elas/vocês'),
+    subjunctive_pronouns=('que eu', 'que tu', 'que ele/ela/você', 'que nós', 'que vós', 'que eles/elas/vocês'),
+    endings={
+        'ar': {
+            'present': _endings("o as a amos ais am"),
+            'preterite': _endings("ei aste ou amos astes aram"),
+            'imperfect': _endings("ava avas ava ávamos áveis avam"),
+            'pluperfect': _endings("ara aras ara áramos áreis aram"),
+            'future': _endings("arei arás ará aremos areis arão"),
+            'conditional': _endings("aria arias aria aríamos aríeis ariam"),
+            'subjunctive_present': _endings("e es e emos eis em"),
+            'subjunctive_imperfect': _endings("asse asses asse ássemos ásseis assem"),
+            'subjunctive_future': _endings("ar ares ar armos ardes arem"),
+            'personal_infinitive': _endings("ar ares ar armos ardes arem"),
+        },
+        'er': {
+            'present': _endings("o es e emos eis em"),
+            'preterite': _endings("i este eu emos estes eram"),
+            'imperfect': _endings("ia ias ia íamos íeis iam"),
+            'pluperfect': _endings("era eras era êramos êreis eram"),
+            'future': _endings("erei erás erá eremos ereis erão"),
+            'conditional': _endings("eria erias eria eríamos eríeis eriam"),
+            'subjunctive_present': _endings("a as a amos ais am"),
+            'subjunctive_imperfect': _endings("esse esses esse êssemos êsseis essem"),
+            'subjunctive_future': _endings("er eres er ermos erdes erem"),
+            'personal_infinitive': _endings("er eres er ermos erdes erem"),
+        },
+        'ir': {
+            'present': _endings("o es e imos is em"),
+            'preterite': _endings("i iste iu imos istes iram"),
+            'imperfect': _endings("ia ias ia íamos íeis iam"),
+            'pluperfect': _endings("ira iras ira íramos íreis iram"),
+            'future': _endings("irei irás irá iremos ireis irão"),
+            'conditional': _endings("iria irias iria iríamos iríeis iriam"),
+            'subjunctive_present': _endings("a as a amos ais am"),
+            'subjunctive_imperfect': _endings("isse isses isse íssemos ísseis issem"),
+            'subjunctive_future': _endings("ir ires ir irmos irdes irem"),
+            'personal_infinitive': _endings("ir ires ir irmos irdes irem"),
+        },
+    },
+    participles={'ar': ('ando', 'ado'), 'er': ('endo', 'ido'), 'ir': ('indo', 'ido')},
+    auxiliary={
+        'present': _endings("tenho tens tem temos tendes têm"),
+        'imperfect': _endings("tinha tinhas tinha tínhamos tínheis tinham"),
+        'future': _endings("terei terás terá teremos tereis terão"),
+        'conditional': _endings("teria terias teria teríamos teríeis teriam"),
+        'subjunctive_present': _endings("tenha tenhas tenha tenhamos tenhais tenham"),
+        'subjunctive_imperfect': _endings("tivesse tivesses tivesse tivéssemos tivésseis tivessem"),
+        'subjunctive_future': _endings("tiver tiveres tiver tivermos tiverdes tiverem"),
+    },
+    layout=(
+        (0, 'Indicativo', 'Presente', 'simple', 'present'),
+        (0, 'Indicativo', 'Pretérito Perfeito', 'simple', 'preterite'),
+        (0, 'Indicativo', 'Pretérito Imperfeito', 'simple', 'imperfect'),
+        (0, 'Indicativo', 'Pretérito Mais-que-perfeito', 'simple', 'pluperfect'),
+        (1, 'Indicativo', 'Futuro do Presente', 'simple', 'future'),
+        (1, 'Indicativo', 'Pretérito Perfeito Composto', 'compound', 'present'),
+        (1, 'Indicativo', 'Pretérito Mais-que-perfeito Composto', 'compound', 'imperfect'),
+        (1, 'Indicativo', 'Futuro do Presente Composto', 'compound', 'future'),
+        (2, 'Conjuntivo / Subjuntivo', 'Presente', 'simple', 'subjunctive_present'),
+        (2, 'Conjuntivo / Subjuntivo', 'Pretérito Imperfeito', 'simple', 'subjunctive_imperfect'),
+        (2, 'Conjuntivo / Subjuntivo', 'Futuro', 'simple', 'subjunctive_future'),
+        (3, 'Conjuntivo / Subjuntivo', 'Pretérito Perfeito', 'compound', 'subjunctive_present'),
+        (3, 'Conjuntivo / Subjuntivo', 'Pretérito Mais-que-perfeito', 'compound', 'subjunctive_imperfect'),
+        (3, 'Conjuntivo / Subjuntivo', 'Futuro Composto', 'compound', 'subjunctive_future'),
+        (4, 'Condicional', 'Futuro do Pretérito', 'simple', 'conditional'),
+        (4, 'Condicional', 'Futuro do Pretérito Composto', 'compound', 'conditional'),
+        (4, 'Imperativo', 'Afirmativo', 'imperative', 'affirmative'),
+        (4, 'Imperativo', 'Negativo', 'imperative', 'negative'),
+        (5, 'Infinitivo Pessoal', '...', 'simple', 'personal_infinitive'),
+        (5, 'Gerúndio', '...', 'single', 'gerund'),
+        (5, 'Particípio', '...', 'single', 'participle'),
+    ),
+    regular=frozenset({
+        'falar', 'trabalhar', 'estudar', 'andar', 'cantar', 'dançar', 'olhar', 'escutar', 'chamar', 'levar',
+        'precisar', 'preparar', 'terminar', 'usar', 'viajar', 'ajudar', 'comprar', 'cozinhar', 'descansar', 'entrar',
+        'esperar', 'lavar', 'limpar', 'chegar', 'ficar', 'tocar', 'praticar', 'explicar', 'começar', 'nadar',
+        'morar', 'passar', 'perguntar', 'tomar', 'visitar', 'ensinar', 'mudar', 'deixar', 'gostar', 'jogar',
+        'comer', 'beber', 'aprender', 'compreender', 'correr', 'vender', 'dever', 'meter', 'responder', 'escrever',
+        'temer', 'prometer', 'romper', 'viver', 'abrir', 'partir', 'decidir', 'permitir', 'assistir', 'existir',
+        'insistir', 'discutir', 'unir', 'receber', 'resumir',
+    }),
+    past_participles={'abrir': 'aberto', 'escrever': 'escrito'},
+)
+
+ITALIAN = Language(
+    pronouns=('io', 'tu', 'lei/lui', 'noi', 'voi', 'loro'),
+    subjunctive_pronouns=('che io', 'che tu', 'che lei/lui', 'che noi', 'che voi', 'che loro'),
+    endings={
+        'are': {
+            'present': _endings("o i a iamo ate ano"),
+            'imperfect': _endings("avo avi ava avamo avate avano"),
+            'preterite': _endings("ai asti ò ammo aste arono"),
+            'future': _endings("erò erai erà eremo erete eranno"),
+            'conditional': _endings("erei eresti erebbe eremmo ereste erebbero"),
+            'subjunctive_present': _endings("i i i iamo iate ino"),
+            'subjunctive_imperfect': _endings("assi assi asse assimo aste assero"),
+        },
+        'ere': {
+            'present': _endings("o i e iamo ete ono"),
+            'imperfect': _endings("evo evi eva evamo evate evano"),
+            'preterite': _endings("ei esti é emmo este erono"),
+            'future': _endings("erò erai erà eremo erete eranno"),
+            'conditional': _endings("erei eresti erebbe eremmo ereste erebbero"),
+            'subjunctive_present': _endings("a a a iamo iate ano"),
+            'subjunctive_imperfect': _endings("essi essi esse essimo este essero"),
+        },
+        'ire': {
+            'present': _endings("o i e iamo ite ono"),
+            'imperfect': _endings("ivo ivi iva ivamo ivate ivano"),
+            'preterite': _endings("ii isti ì immo iste irono"),
+            'future': _endings("irò irai irà iremo irete iranno"),
+            'conditional': _endings("irei iresti irebbe iremmo ireste irebbero"),
+            'subjunctive_present': _endings("a a a iamo iate ano"),
+            'subjunctive_imperfect': _endings("issi issi isse issimo iste issero"),
+        },
+        # -ire verbs like finire, which take -isc- when the stem is stressed
+        'isc': {
+            'present': _endings("isco isci isce iamo ite iscono"),
+            'imperfect': _endings("ivo ivi iva ivamo ivate ivano"),
+            'preterite': _endings("ii isti ì immo iste irono"),
+            'future': _endings("irò irai irà iremo irete iranno"),
+            'conditional': _endings("irei iresti irebbe iremmo ireste irebbero"),
+            'subjunctive_present': _endings("isca isca isca iamo iate iscano"),
+            'subjunctive_imperfect': _endings("issi issi isse issimo iste issero"),
+        },
+    },
+    participles={'are': ('ando', 'ato'), 'ere': ('endo', 'uto'), 'ire': ('endo', 'ito'), 'isc': ('endo', 'ito')},
+    auxiliary={
+        'present': _endings("ho hai ha abbiamo avete hanno"),
+        'imperfect': _endings("avevo avevi aveva avevamo avevate avevano"),
+        'preterite': _endings("ebbi avesti ebbe avemmo aveste ebbero"),
+        'future': _endings("avrò avrai avrà avremo avrete avranno"),
+        'conditional': _endings("avrei avresti avrebbe avremmo avreste avrebbero"),
+        'subjunctive_present': _endings("abbia abbia abbia abbiamo abbiate abbiano"),
+        'subjunctive_imperfect': _endings("avessi avessi avesse avessimo aveste avessero"),
+    },
+    layout=(
+        (0, 'Indicativo', 'Presente', 'simple', 'present'),
+        (0, 'Indicativo', 'Imperfetto', 'simple', 'imperfect'),
+        (0, 'Indicativo', 'Passato remoto', 'simple', 'preterite'),
+        (0, 'Indicativo', 'Futuro semplice', 'simple', 'future'),
+        (1, 'Indicativo', 'Passato prossimo', 'compound', 'present'),
+        (1, 'Indicativo', 'Trapassato prossimo', 'compound', 'imperfect'),
+        (1, 'Indicativo', 'Trapassato remoto', 'compound', 'preterite'),
+        (1, 'Indicativo', 'Futuro anteriore', 'compound', 'future'),
+        (2, 'Congiuntivo', 'Presente', 'simple', 'subjunctive_present'),
+        (2, 'Congiuntivo', 'Imperfetto', 'simple', 'subjunctive_imperfect'),
+        (2, 'Congiuntivo', 'Passato', 'compound', 'subjunctive_present'),
+        (2, 'Congiuntivo', 'Trapassato', 'compound', 'subjunctive_imperfect'),
+        (3, 'Condizionale', 'Presente', 'simple', 'conditional'),
+        (3, 'Condizionale', 'Passato', 'compound', 'conditional'),
+        (3, 'Imperativo', '...', 'imperative', 'affirmative'),
+        (4, 'Gerundio', '...', 'single', 'gerund'),
+        (4, 'Participio passato', '...', 'single', 'participle'),
+    ),
+    regular=frozenset({
+        'parlare', 'lavorare', 'amare', 'cantare', 'ballare', 'guardare', 'ascoltare', 'chiamare', 'portare', 'abitare',
+        'preparare', 'trovare', 'usare', 'viaggiare', 'aiutare', 'comprare', 'cucinare', 'entrare', 'arrivare', 'tornare',
+        'restare', 'aspettare', 'lavare', 'pagare', 'cercare', 'giocare', 'mangiare', 'cominciare', 'studiare', 'pensare',
+        'imparare', 'insegnare', 'cambiare', 'lasciare', 'camminare', 'nuotare', 'visitare', 'domandare', 'spiegare', 'toccare',
+        'credere', 'vendere', 'ripetere', 'temere', 'ricevere', 'battere', 'cedere', 'godere', 'dormire', 'partire',
+        'sentire', 'servire', 'seguire', 'aprire', 'offrire', 'soffrire', 'coprire', 'finire', 'capire', 'preferire',
+        'pulire', 'spedire', 'costruire', 'colpire', 'garantire', 'unire', 'suggerire', 'sparire',
+    }),
+    past_participles={'aprire': 'aperto', 'offrire': 'offerto', 'soffrire': 'sofferto', 'coprire': 'coperto'},
+    second_auxiliary={
+        'present': _endings("sono sei è siamo siete sono"),
+        'imperfect': _endings("ero eri era eravamo eravate erano"),
+        'preterite': _endings("fui fosti fu fummo foste furono"),
+        'future': _endings("sarò sarai sarà saremo sarete saranno"),
+        'conditional': _endings("sarei saresti sarebbe saremmo sareste sarebbero"),
+        'subjunctive_present': _endings("sia sia sia siamo siate siano"),
+        'subjunctive_imperfect': _endings("fossi fossi fosse fossimo foste fossero"),
+    },
+    second_auxiliary_verbs=frozenset({'entrare', 'arrivare', 'tornare', 'restare', 'partire', 'sparire'}),
+)
+
+# -ire verbs that take -isc-
+ITALIAN_ISC = frozenset({
+    'finire', 'capire', 'preferire', 'pulire', 'spedire', 'costruire', 'colpire', 'garantire', 'unire', 'suggerire', 'sparire',
+})
+
+FRENCH = Language(
+    pronouns=('je', 'tu', 'il', 'nous', 'vous', 'ils'),
+    subjunctive_pronouns=('que je', 'que tu', "qu'il", 'que nous', 'que vous', "qu'ils"),
+    endings={
+        'er': {
+            'present': _endings("e es e ons ez ent"),
+            'imperfect': _endings("ais ais ait ions iez aient"),
+            'preterite': _endings("ai as a âmes âtes èrent"),
+            'future': _endings("erai eras era erons erez eront"),
+            'conditional': _endings("erais erais erait erions eriez eraient"),
+            'subjunctive_present': _endings("e es e ions iez ent"),
+            'subjunctive_imperfect': _endings("asse asses ât assions assiez assent"),
+        },
+        'ir': {
+            'present': _endings("is is it issons issez issent"),
+            'imperfect': _endings("issais issais issait issions issiez issaient"),
+            'preterite': _endings("is is it îmes îtes irent"),
+            'future': _endings("irai iras ira irons irez iront"),
+            'conditional': _endings("irais irais irait irions iriez iraient"),
+            'subjunctive_present': _endings("isse isses isse issions issiez issent"),
+            'subjunctive_imperfect': _endings("isse isses ît issions issiez issent"),
+        },
+        're': {
+            'present': _endings("s s - ons ez ent"),
+            'imperfect': _endings("ais ais ait ions iez aient"),
+            'preterite': _endings("is is it îmes îtes irent"),
+            'future': _endings("rai ras ra rons rez ront"),
+            'conditional': _endings("rais rais rait rions riez raient"),
+            'subjunctive_present': _endings("e es e ions iez ent"),
+            'subjunctive_imperfect': _endings("isse isses ît issions issiez issent"),
+        },
+    },
+    participles={'er': ('ant', 'é'), 'ir': ('issant', 'i'), 're': ('ant', 'u')},
+    auxiliary={
+        'present': _endings("ai as a avons avez ont"),
+        'imperfect': _endings("avais avais avait avions aviez avaient"),
+        'preterite': _endings("eus eus eut eûmes eûtes eurent"),
+        'future': _endings("aurai auras aura aurons aurez auront"),
+        'conditional': _endings("aurais aurais aurait aurions auriez auraient"),
+        'subjunctive_present': _endings("aie aies ait ayons ayez aient"),
+        'subjunctive_imperfect': _endings("eusse eusses eût eussions eussiez eussent"),
+    },
+    layout=(
+        (0, 'Indicatif', 'Présent', 'simple', 'present'),
+        (0, 'Indicatif', 'Imparfait', 'simple', 'imperfect'),
+        (0, 'Indicatif', 'Passé simple', 'simple', 'preterite'),
+        (0, 'Indicatif', 'Futur', 'simple', 'future'),
+        (1, 'Indicatif', 'Passé composé', 'compound', 'present'),
+        (1, 'Indicatif', 'Plus-que-parfait', 'compound', 'imperfect'),
+        (1, 'Indicatif', 'Passé antérieur', 'compound', 'preterite'),
+        (1, 'Indicatif', 'Futur antérieur', 'compound', 'future'),
+        (2, 'Subjonctif', 'Présent', 'simple', 'subjunctive_present'),
+        (2, 'Subjonctif', 'Imparfait', 'simple', 'subjunctive_imperfect'),
+        (2, 'Subjonctif', 'Passé', 'compound', 'subjunctive_present'),
+        (2, 'Subjonctif', 'Plus-que-parfait', 'compound', 'subjunctive_imperfect'),
+        (3, 'Conditionnel', 'Présent', 'simple', 'conditional'),
+        (3, 'Conditionnel', 'Passé', 'compound', 'conditional'),
+        (3, 'Impératif', 'Présent', 'imperative', 'affirmative'),
+        (4, 'Participe', 'Présent', 'single', 'gerund'),
+        (4, 'Participe', 'Passé', 'single', 'participle'),
+    ),
+    regular=frozenset({
+        'parler', 'aimer', 'chanter', 'danser', 'regarder', 'écouter', 'travailler', 'habiter', 'donner', 'trouver',
+        'penser', 'demander', 'arriver', 'entrer', 'rester', 'tomber', 'monter', 'rentrer', 'retourner', 'passer',
+        'jouer', 'porter', 'montrer', 'oublier', 'étudier', 'chercher', 'garder', 'commencer', 'manger', 'nager',
+        'voyager', 'changer', 'placer', 'laver', 'marcher', 'préparer', 'visiter', 'gagner', 'expliquer', 'fermer',
+        'finir', 'choisir', 'réussir', 'grandir', 'remplir', 'obéir', 'réfléchir', 'bâtir', 'rougir', 'saisir',
+        'vendre', 'attendre', 'entendre', 'répondre', 'perdre', 'descendre', 'rendre', 'défendre', 'tondre', 'fondre',
+    }),
+    second_auxiliary={
+        'present': _endings("suis es est sommes êtes sont"),
+        'imperfect': _endings("étais étais était étions étiez étaient"),
+        'preterite': _endings("fus fus fut fûmes fûtes furent"),
+        'future': _endings("serai seras sera serons serez seront"),
+        'conditional': _endings("serais serais serait serions seriez seraient"),
+        'subjunctive_present': _endings("sois sois soit soyons soyez soient"),
+        'subjunctive_imperfect': _endings("fusse fusses fût fussions fussiez fussent"),
+    },
+    second_auxiliary_verbs=frozenset({'arriver', 'entrer', 'rester', 'tomber', 'rentrer', 'retourner'}),
+)
+
+LANGUAGES: Dict[str, Tuple[Language, Callable[[str, str], str]]] = {
+    'spanish': (SPANISH, _spanish_spelling),
+    'portuguese': (PORTUGUESE, _portuguese_spelling),
+    'italian': (ITALIAN, _italian_spelling),
+    'french': (FRENCH, _french_spelling),
+}
+
+# How many verbs were answered locally, and how many were left to the scraper
+stats: Dict[str, int] = {"answered": 0, "fallbacks": 0}
+
+
+def _verb_class(language: str, verb: str, rules: Language) -> Optional[str]:
+    """ Gets the class of a verb from its infinitive, None when the engine doesn't know it. """
+
+    if language == 'italian' and verb in ITALIAN_ISC:
+        return 'isc'
+
+    for verb_class in rules.endings:
+        if verb.endswith(verb_class) and len(verb) > len(verb_class):
+            return verb_class
+
+    return None
+
+
+def _with_pronoun(pronoun: str, form: str, language: str) -> str:
+    """ Puts the pronoun before a form, eliding French je and que before a vowel. """
+
+    if language == 'french' and pronoun.endswith(('je', 'que')) and form[:1] in 'aâeéèêiîoôuûhy':
+        return f"{pronoun[:-1]}'{form}"
+
+    return f"{pronoun} {form}"
+
+
+def _imperative(language: str, kind: str, simple: Dict[str, List[str]], verb: str) -> List[str]:
+    """ Makes the imperative forms from the other tenses. """
+
+    present, subjunctive = simple['present'], simple['subjunctive_present']
+    if language == 'spanish':
+        if kind == 'negative':
+            return [f"no {form}" for form in subjunctive[1:]]
+        return [present[2], subjunctive[2], subjunctive[3], verb[:-1] + 'd', subjunctive[5]]
+
+    if language == 'portuguese':
+        if kind == 'negative':
+            return [f"não {form}" for form in subjunctive[1:]]
+        return [present[2], subjunctive[2], subjunctive[3], present[4][:-1], subjunctive[5]]
+
+    if language == 'italian':
+        second = present[2] if verb.endswith('are') else present[1]
+        return [second, subjunctive[2], present[3], present[4], subjunctive[5]]
+
+    # French has no third person imperative, and -er verbs drop the s of the second person
+    return [present[0] if verb.endswith('er') else present[1], present[3], present[4]]
+
+
+def conjugate(language: str, verb: str, aligned: bool = True) -> Optional[Dict[str, Any]]:
+    """ Conjugates a regular verb, in the structure parse_reverso_conjugation returns.
+    :param language: The verb's language, e.g. 'spanish'.
+    :param verb: The verb's infinitive, normalized.
+    :param aligned: If the fields will be inline. """
+
+    known = language in LANGUAGES and verb in LANGUAGES[language][0].regular
+    result = build(language, verb, aligned) if known else None
+    stats["answered" if result else "fallbacks"] += 1
+    return result
+
+
+def build(language: str, verb: str, aligned: bool = True) -> Optional[Dict[str, Any]]:
+    """ Conjugates any verb with the regular rules, known to be regular or not; the validation harness uses it directly.
+    :param language: The verb's language, e.g. 'spanish'.
+    :param verb: The verb's infinitive, normalized.
+    :param aligned: If the fields will be inline. """
+
+    if language not in LANGUAGES or ' ' in verb:
+        return None
+
+    rules, spell = LANGUAGES[language]
+    verb_class = _verb_class(language, verb, rules)
+    if verb_class is None:
+        return None
+    # The spelling changes only keep the sound of the first conjugation's stems, e.g. vencer makes venzo, not venquo
+    if verb_class != next(iter(rules.endings)):
+        spell = _concatenate
+
+    stem = verb[:-3] if verb_class == 'isc' else verb[:-len(verb_class)]
+    endings = rules.endings[verb_class]
+    simple = {tense: [spell(stem, ending) if ending else stem for ending in forms] for tense, forms in endings.items()}
+
+    gerund_ending, participle_ending = rules.participles[verb_class]
+    gerund = spell(stem, gerund_ending)
+    participle = rules.past_participles.get(verb, spell(stem, participle_ending))
+    second = verb in rules.second_auxiliary_verbs
+
+    def compound(tense: str) -> List[str]:
+        if not second:
+            return [f"{auxiliary} {participle}" for auxiliary in rules.auxiliary[tense]]
+        # Participles agree with the subject when conjugated with essere or être
+        plural = participle[:-1] + 'i' if language == 'italian' else participle + 's'
+        return [
+            f"{auxiliary} {participle if person < 3 else plural}"
+            for person, auxiliary in enumerate(rules.second_auxiliary[tense])
+        ]
+
+    conjugations: Dict[str, List[Dict[str, List[Any]]]] = {}
+    for page, mode, name, kind, tense in rules.layout:
+        pronouns: Sequence[str] = rules.subjunctive_pronouns if tense.startswith('subjunctive') else rules.pronouns
+        if kind == 'simple':
+            forms = [_with_pronoun(pronoun, form, language) for pronoun, form in zip(pronouns, simple[tense])]
+        elif kind == 'compound':
+            forms = [_with_pronoun(pronoun, form, language) for pronoun, form in zip(pronouns, compound(tense))]
+        elif kind == 'imperative':
+            forms = _imperative(language, tense, simple, verb)
+        else:
+            forms = [gerund if tense == 'gerund' else participle]
+
+        conjugations.setdefault(f'page{page}', []).append({'tense': [format_tense(forms, mode), name, aligned]})
+
+    return {'found_verb': verb, 'conjugations': conjugations}
@@ -0,0 +1,48 @@
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+# When the current command has to be answered by, in time.monotonic() seconds
+current_deadline: ContextVar[Optional[float]] = ContextVar("current_deadline", default=None)
+
+# Interaction tokens can be used for 15 minutes, a margin is kept to still send the answer
+INTERACTION_LIFETIME = 15 * 60 - 10
+
+
+class DeadlineExceeded(Exception):
+    """ Raised when the current command ran out of time. """
+
+
+def start_deadline(budget: float, created_at: Optional[datetime] = None) -> float:
+    """ Starts the deadline of the current command.
+    :param budget: For how many seconds the command may run.
+    :param created_at: When the command's interaction was created, it bounds the deadline to the token's lifetime. """
+
+    now = time.monotonic()
+    deadline = now + budget
+    if created_at is not None:
+        expires_in = created_at.timestamp() + INTERACTION_LIFETIME - time.time()
+        deadline = min(deadline, now + expires_in)
+
+    current_deadline.set(deadline)
+    return deadline
+
+
+def time_left() -> Optional[float]:
+    """ Gets how many seconds the current command has left, None if it has no deadline. """
+
+    if (deadline := current_deadline.get()) is None:
+        return None
+
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """ Raises if the current command is out of time, otherwise gets the time it has left. """
+
+    remaining = time_left()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded()
+
+    return remaining
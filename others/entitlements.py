@@ -0,0 +1,71 @@
+import discord
+from discord.utils import MISSING
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+
+class EntitlementCache:
+    """ In-process cache of the bot's entitlements, indexed by user ID. """
+
+    def __init__(self, client) -> None:
+        """ Class init method.
+        :param client: The bot client. """
+
+        self.client = client
+        self.entitlements: Dict[int, discord.Entitlement] = {}
+        self.users: Dict[int, Set[int]] = {}
+        self.synced_at: Optional[datetime] = None
+
+    async def sync(self) -> None:
+        """ Fetches all entitlements from Discord and rebuilds the cache. """
+
+        entitlements = await self.client.fetch_entitlements()
+
+        self.entitlements.clear()
+        self.users.clear()
+        for entitlement in entitlements:
+            self.add(entitlement)
+
+        self.synced_at = datetime.now(timezone.utc)
+
+    def add(self, entitlement: discord.Entitlement) -> None:
+        """ Adds or replaces an entitlement in the cache.
+        :param entitlement: The entitlement to cache. """
+
+        self.remove(entitlement)
+        if entitlement.deleted or entitlement.user_id is MISSING:
+            return
+
+        self.entitlements[entitlement.id] = entitlement
+        self.users.setdefault(entitlement.user_id, set()).add(entitlement.id)
+
+    def remove(self, entitlement: discord.Entitlement) -> None:
+        """ Removes an entitlement from the cache.
+        :param entitlement: The entitlement to remove. """
+
+        cached = self.entitlements.pop(entitlement.id, None)
+        if cached is None:
+            return
+
+        user_entitlements = self.users.get(cached.user_id, set())
+        user_entitlements.discard(cached.id)
+        if not user_entitlements:
+            self.users.pop(cached.user_id, None)
+
+    def get_user_entitlements(self, user_id: int) -> List[discord.Entitlement]:
+        """ Gets the cached entitlements of a user.
+        :param user_id: The ID of the user. """
+
+        return [self.entitlements[eid] for eid in self.users.get(user_id, ())]
+
+    def has_entitlement(self, user_id: int) -> bool:
+        """ Checks whether the user has an active entitlement.
+        :param user_id: The ID of the user. """
+
+        now = datetime.now(timezone.utc)
+        for entitlement in self.get_user_entitlements(user_id):
+            if entitlement.ends_at is MISSING or entitlement.ends_at is None or entitlement.ends_at > now:
+                return True
+
+        return False
@@ -0,0 +1,77 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def levenshtein(first: str, second: str, max_distance: int) -> int:
+    """ Counts the insertions, deletions and substitutions that turn a word into another, giving up past a maximum.
+    :param first: A word.
+    :param second: The other word.
+    :param max_distance: The distance past which the exact value doesn't matter.
+    :returns: The distance, or max_distance + 1 when it's greater than max_distance. """
+
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(second) + 1))
+    for i, letter in enumerate(first, 1):
+        current = [i]
+        for j, other in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (letter != other)))
+        # The distance can't get smaller than the best of the row
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return min(previous[-1], max_distance + 1)
+
+
+
+def deletions(word: str, max_distance: int) -> Set[str]:
+    """ Gets the strings left by deleting up to a number of letters from a word, the word itself included.
+    :param word: The word.
+    :param max_distance: The maximum amount of deleted letters. """
+
+    found = edge = {word}
+    for _ in range(max_distance):
+        edge = {variant[:i] + variant[i + 1:] for variant in edge for i in range(len(variant))}
+        found = found | edge
+
+    return found
+
+
+class DeletionIndex:
+    """ SymSpell-style index, finding the words within a distance of a word without comparing against all of them.
+
+    Two words are within a distance d of each other only if deleting at most
+    d letters from each leaves the same string, so each word is stored under
+    its deletions and a search only compares the words stored under the
+    searched word's. A word of n letters takes about n * n / 2 entries for a
+    distance of 2, which is little for the bundled lists and capped learned words. """
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2) -> None:
+        """ Class init method.
+        :param words: The initial words, without repetitions.
+        :param max_distance: The maximum distance searched. """
+
+        self.max_distance = max_distance
+        # Deletion -> the words it's left from
+        self.entries: Dict[str, List[str]] = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """ Adds a word, which mustn't be in the index yet.
+        :param word: The word. """
+
+        for variant in deletions(word, self.max_distance):
+            self.entries.setdefault(variant, []).append(word)
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """ Finds the words within a distance of a word, closest first.
+        :param word: The searched word.
+        :param max_distance: The maximum distance of the words found, up to the index's. """
+
+        max_distance = min(max_distance, self.max_distance)
+        candidates = {found for variant in deletions(word, max_distance) for found in self.entries.get(variant, ())}
+        return sorted(
+            (distance, found) for found in candidates if (distance := levenshtein(word, found, max_distance)) <= max_distance
+        )
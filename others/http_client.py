@@ -0,0 +1,257 @@
+import asyncio
+import aiohttp
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    # aiohttp only decodes brotli through brotlipy's Decompressor API
+    import brotli
+    HAS_BROTLI = hasattr(brotli.Decompressor, 'decompress')
+except ImportError:
+    HAS_BROTLI = False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """ Parses a Retry-After header into seconds.
+    :param value: Either an amount of seconds or an HTTP date. """
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_host_pairs(value: str) -> Dict[str, Tuple[float, float]]:
+    """ Parses per-host pairs of settings written as ``host=first:second,...``.
+    :param value: The settings, e.g. the HTTP_HOST_LIMITS env var. """
+
+    pairs = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        host, _, pair = item.partition('=')
+        first, _, second = pair.partition(':')
+        pairs[host.strip().lower()] = (float(first), float(second))
+
+    return pairs
+
+
+class HostGovernor:
+    """ Bounds the requests in flight to one host and their rate.
+
+    The in-flight limit grows additively while the host answers well, and is
+    halved when it answers 429/503 or its latency spikes (AIMD). Low priority
+    requests, e.g. prefetches, only use half of the slots and never go ahead
+    of queued live requests. """
+
+    def __init__(self, max_in_flight: int, rate: float, min_in_flight: int = 1) -> None:
+        """ Class init method.
+        :param max_in_flight: The maximum amount of requests in flight.
+        :param rate: The maximum amount of requests per second.
+        :param min_in_flight: The in-flight limit is never shrunk below this. """
+
+        self.max_in_flight = max_in_flight
+        self.min_in_flight = min(min_in_flight, max_in_flight)
+        self.limit = float(max_in_flight)
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self.in_flight = 0
+        self.next_slot = 0.0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.latency: Optional[float] = None
+        self.waiters: Deque["asyncio.Future[None]"] = deque()
+        self.live_waiting = 0
+        self.stats: Dict[str, float] = {"requests": 0, "throttled": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    def _can_start(self, now: float, low_priority: bool) -> bool:
+        """ Checks whether a request can start right now. """
+
+        if now < self.blocked_until:
+            return False
+
+        if low_priority:
+            return not self.live_waiting and self.in_flight < max(int(self.limit) // 2, 1)
+
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self, low_priority: bool = False) -> None:
+        """ Waits for a slot, then for the request's turn within the rate.
+        :param low_priority: Whether the request gives way to live ones. """
+
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        while not self._can_start(now := time.monotonic(), low_priority):
+            waiter = loop.create_future()
+            self.waiters.append(waiter)
+            self.live_waiting += not low_priority
+            timeout = self.blocked_until - now if now < self.blocked_until else None
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.live_waiting -= not low_priority
+                if waiter in self.waiters:
+                    self.waiters.remove(waiter)
+
+        self.in_flight += 1
+        slot = max(time.monotonic(), self.next_slot)
+        self.next_slot = slot + self.interval
+        try:
+            if (delay := slot - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
+        waited = time.monotonic() - start
+        self.stats["requests"] += 1
+        self.stats["wait_total"] += waited
+        self.stats["wait_max"] = max(self.stats["wait_max"], waited)
+
+    def release(self, status: Optional[int] = None, latency: Optional[float] = None, retry_after: Optional[float] = None) -> None:
+        """ Frees the request's slot and adapts the limit to how the host answered.
+        :param status: The response's status, None if the request failed.
+        :param latency: How many seconds the host took to answer.
+        :param retry_after: For how many seconds the host asked to be left alone. """
+
+        self.in_flight -= 1
+        now = time.monotonic()
+
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+        if status in (429, 503):
+            self.stats["throttled"] += 1
+            self._decrease(now)
+        elif latency is not None:
+            # Latency well above its moving average means the host is getting congested
+            if self.latency is not None and latency > 2 * self.latency:
+                self._decrease(now)
+            elif status is not None and status < 500:
+                self.limit = min(self.limit + 1 / self.limit, self.max_in_flight)
+
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+        # Every waiter checks again whether it can start
+        while self.waiters:
+            if not (waiter := self.waiters.popleft()).done():
+                waiter.set_result(None)
+
+    def _decrease(self, now: float) -> None:
+        """ Halves the in-flight limit, at most once per round trip. """
+
+        if now - self.last_decrease >= (self.latency or 0.0):
+            self.limit = max(self.limit / 2, self.min_in_flight)
+            self.last_decrease = now
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """ Gets the governor's metrics. """
+
+        requests = self.stats["requests"]
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self.waiters),
+            "requests": int(requests),
+            "throttled": int(self.stats["throttled"]),
+            "wait_avg_ms": (self.stats["wait_total"] / requests * 1000) if requests else 0.0,
+            "wait_max_ms": self.stats["wait_max"] * 1000
+        }
+
+
+class HTTPClient:
+    """ HTTP client shared by all cogs, owning a single connection pool. """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """ Class init method.
+        :param limit: The maximum amount of open connections. Default = HTTP_LIMIT env var or 100.
+        :param limit_per_host: The maximum amount of open connections per host. Default = HTTP_LIMIT_PER_HOST env var or 10.
+        :param dns_ttl: For how many seconds resolved hosts are cached. Default = 300.
+        :param keepalive_timeout: For how many seconds idle connections are kept alive. Default = 30.
+        :param host_max_in_flight: The maximum amount of requests in flight per host. Default = HTTP_HOST_MAX_IN_FLIGHT env var or 8.
+        :param host_rate: The maximum amount of requests per second per host. Default = HTTP_HOST_RATE env var or 10.
+        :param host_limits: Limits for specific hosts, as (max_in_flight, rate). Default = parsed from the HTTP_HOST_LIMITS env var. """
+
+        self.limit = kwargs.get('limit', int(os.getenv("HTTP_LIMIT", 100)))
+        self.limit_per_host = kwargs.get('limit_per_host', int(os.getenv("HTTP_LIMIT_PER_HOST", 10)))
+        self.dns_ttl = kwargs.get('dns_ttl', 300)
+        self.keepalive_timeout = kwargs.get('keepalive_timeout', 30)
+        self.host_max_in_flight = kwargs.get('host_max_in_flight', int(os.getenv("HTTP_HOST_MAX_IN_FLIGHT", 8)))
+        self.host_rate = kwargs.get('host_rate', float(os.getenv("HTTP_HOST_RATE", 10)))
+        self.host_limits = kwargs.get('host_limits', parse_host_pairs(os.getenv("HTTP_HOST_LIMITS", "")))
+        self.governors: Dict[str, HostGovernor] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """ Gets the underlying session, creating it on first use, which is within the running event loop. """
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True
+            )
+            encodings = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept-Encoding": encodings}
+            )
+
+        return self._session
+
+    def governor(self, host: str) -> HostGovernor:
+        """ Gets the governor of a host, creating it on first use.
+        :param host: The host's name. """
+
+        if (governor := self.governors.get(host)) is None:
+            max_in_flight, rate = self.host_limits.get(host, (self.host_max_in_flight, self.host_rate))
+            governor = self.governors[host] = HostGovernor(int(max_in_flight), rate)
+
+        return governor
+
+    @asynccontextmanager
+    async def get(self, url: str, low_priority: bool = False, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """ Performs a GET request within the host's limits, to be used as an async context manager.
+        :param url: The URL to request.
+        :param low_priority: Whether the request gives way to live ones, e.g. for prefetches. Default = False. """
+
+        governor = self.governor((urlsplit(url).hostname or '').lower())
+        await governor.acquire(low_priority)
+
+        status = latency = retry_after = None
+        start = time.monotonic()
+        try:
+            async with self.session.get(url, **kwargs) as response:
+                status, latency = response.status, time.monotonic() - start
+                if status in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                yield response
+        finally:
+            governor.release(status, latency, retry_after)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """ Gets the metrics of each host's governor. """
+
+        return {host: governor.get_metrics() for host, governor in self.governors.items()}
+
+    async def close(self) -> None:
+        """ Closes the session and its connections. """
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
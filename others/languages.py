@@ -0,0 +1,65 @@
+""" The languages that can be conjugated and where their conjugations are looked up.
+
+Kept apart from the cog, so it can be used without discord. """
+
+from typing import Dict, NamedTuple, Tuple
+
+# Where each provider's conjugation pages are, by language code and normalized verb
+PROVIDER_URLS = {
+    'reverso': 'https://conjugator.reverso.net/conjugation-{code}-verb-{term}.html',
+    'cooljugator': 'https://cooljugator.com/{code}/{term}',
+    'mijnwoordenboek': 'https://www.mijnwoordenboek.nl/werkwoord/{term}',
+}
+
+
+class Language(NamedTuple):
+    """ A language that can be conjugated, with a command of its own. """
+
+    name: str
+    title: str
+    group: str
+    provider: str
+    code: str
+    emoji: str
+    space: bool = False
+    aligned: bool = True
+
+
+# Every conjugation command, in the order they're registered
+LANGUAGES: Tuple[Language, ...] = (
+    Language('dutch', 'Dutch', 'germanic', 'mijnwoordenboek', 'nl', '🇳🇱'),
+    Language('japanese', 'Japanese', 'asian', 'reverso', 'japanese', '🇯🇵', space=True, aligned=False),
+    Language('arabic', 'Arabic', 'other', 'reverso', 'arabic', '🇸🇦-🇪🇬', space=True, aligned=False),
+    Language('portuguese', 'Portuguese', 'romance', 'reverso', 'portuguese', '🇧🇷-🇵🇹', space=True),
+    Language('italian', 'Italian', 'romance', 'reverso', 'italian', '🇮🇹-🇨🇭'),
+    Language('french', 'French', 'romance', 'reverso', 'french', '🇫🇷-🇧🇪'),
+    Language('spanish', 'Spanish', 'romance', 'reverso', 'spanish', '🇪🇸-🇲🇽'),
+    Language('english', 'English', 'germanic', 'reverso', 'english', '🇺🇸-🇬🇧'),
+    Language('german', 'German', 'germanic', 'reverso', 'german', '🇩🇪|🇦🇹'),
+    Language('polish', 'Polish', 'slavic', 'cooljugator', 'pl', '🇵🇱', space=True),
+    Language('russian', 'Russian', 'slavic', 'cooljugator', 'ru', '🇷🇺|🇧🇾', space=True),
+    Language('esperanto', 'Esperanto', 'romance', 'cooljugator', 'eo', '🟩', space=True),
+    Language('estonian', 'Estonian', 'uralic', 'cooljugator', 'ee', '🇪🇪', space=True),
+    Language('turkish', 'Turkish', 'turkic', 'cooljugator', 'tr', '🇹🇷', space=True),
+    Language('danish', 'Danish', 'germanic', 'cooljugator', 'da', '🇩🇰', space=True),
+    Language('swedish', 'Swedish', 'germanic', 'cooljugator', 'sv', '🇸🇪', space=True),
+    Language('norwegian', 'Norwegian', 'germanic', 'cooljugator', 'no', '🇳🇴', space=True),
+    Language('faroese', 'Faroese', 'germanic', 'cooljugator', 'fo', '🇫🇴', space=True),
+    Language('icelandic', 'Icelandic', 'germanic', 'cooljugator', 'is', '🇮🇸', space=True),
+    Language('finnish', 'Finnish', 'uralic', 'cooljugator', 'fi', '🇫🇮', space=True),
+    Language('indonesian', 'Indonesian', 'asian', 'cooljugator', 'id', '🇮🇩', space=True),
+    Language('maltese', 'Maltese', 'asian', 'cooljugator', 'mt', '🇲🇹', space=True),
+    Language('thai', 'Thai', 'asian', 'cooljugator', 'th', '🇹🇭', space=True),
+    Language('vietnamese', 'Vietnamese', 'asian', 'cooljugator', 'vi', '🇻🇳', space=True),
+    Language('malay', 'Malay', 'asian', 'cooljugator', 'ms', '🇲🇾', space=True),
+    Language('catalan', 'Catalan', 'romance', 'cooljugator', 'ca', '🟨', space=True),
+    Language('romanian', 'Romanian', 'romance', 'cooljugator', 'ro', '🇷🇴', space=True),
+    Language('greek', 'Greek', 'other', 'cooljugator', 'gr', '🇬🇷', space=True),
+    Language('afrikaans', 'Afrikaans', 'germanic', 'cooljugator', 'af', '🇿🇦', space=True),
+    Language('lithuanian', 'Lithuanian', 'uralic', 'cooljugator', 'lt', '🇱🇹', space=True),
+    Language('latvian', 'Latvian', 'uralic', 'cooljugator', 'lv', '🇱🇻', space=True),
+    Language('macedonian', 'Macedonian', 'slavic', 'cooljugator', 'mk', '🇲🇰', space=True),
+    Language('persian', 'Persian', 'other', 'cooljugator', 'fa', '🇮🇷', space=True),
+    Language('hebrew', 'Hebrew', 'other', 'cooljugator', 'he', '🇮🇱', space=True),
+)
+LANGUAGES_BY_NAME: Dict[str, Language] = {language.name: language for language in LANGUAGES}
@@ -0,0 +1,224 @@
+import asyncio
+import heapq
+import os
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from others.fuzzy import DeletionIndex
+from others.wordlist import WordList, build
+
+
+class LemmaIndex:
+    """ Sorted words of a language, searched by prefix with a binary search.
+
+    The bundled words stay in their memory-mapped word list and only the
+    learned words are kept as Python strings. """
+
+    def __init__(self, words: Iterable[str] = (), bundled: Optional[WordList] = None) -> None:
+        """ Class init method.
+        :param words: The initial words, normalized.
+        :param bundled: The bundled word list. """
+
+        self.bundled = bundled
+        self.words: List[str] = sorted(set(words))
+        # Built the first time a suggestion is needed
+        self.deletions: Optional[DeletionIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.words) + (len(self.bundled) if self.bundled is not None else 0)
+
+    def __contains__(self, word: str) -> bool:
+        index = bisect_left(self.words, word)
+        if index < len(self.words) and self.words[index] == word:
+            return True
+
+        return self.bundled is not None and word in self.bundled
+
+    def add(self, word: str) -> bool:
+        """ Adds a word, if it isn't in the index yet.
+        :param word: The normalized word.
+        :returns: Whether the word is new. """
+
+        if not word or word in self:
+            return False
+
+        insort(self.words, word)
+        if self.deletions is not None:
+            self.deletions.add(word)
+        return True
+
+    def starting_with(self, prefix: str) -> Iterator[str]:
+        """ Yields the words starting with a prefix, in alphabetical order.
+        :param prefix: The normalized beginning of the word. """
+
+        learned = []
+        index = bisect_left(self.words, prefix)
+        while index < len(self.words) and self.words[index].startswith(prefix):
+            learned.append(self.words[index])
+            index += 1
+
+        if self.bundled is None:
+            return iter(learned)
+
+        # Both are sorted and don't share words, the bundled list being in UTF-8 order, which is the code point order
+        return heapq.merge(learned, self.bundled.starting_with(prefix))
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """ Gets the words starting with a prefix, in alphabetical order.
+        :param prefix: The normalized beginning of the word.
+        :param limit: The maximum amount of words, Discord shows up to 25. """
+
+        return list(islice(self.starting_with(prefix), limit))
+
+    def suggest(self, word: str, limit: int = 5, max_distance: Optional[int] = None) -> List[str]:
+        """ Gets the words closest to a misspelled one, closest first.
+        :param word: The normalized word.
+        :param limit: The maximum amount of words.
+        :param max_distance: The maximum distance of the words. Default = 1 for words of up to 4 letters, otherwise 2. """
+
+        if not word:
+            return []
+
+        if self.deletions is None:
+            self.deletions = DeletionIndex(heapq.merge(self.bundled or (), self.words))
+
+        # Short words are too close to too many others to allow two typos
+        if max_distance is None:
+            max_distance = 1 if len(word) <= 4 else 2
+        return [found for _, found in self.deletions.search(word, max_distance)[:limit]]
+
+
+class Lemmas:
+    """ The word indexes of every language, each loaded the first time it's used.
+
+    An index starts with its bundled word list, a text file with one word
+    per line named after it, and grows with the searches that found something.
+    The text file is compiled into a compact word list next to it the first
+    time, or when it changes, and that file is what's memory-mapped. The
+    learned words are appended to a file of their own in batches, so they
+    survive restarts. Every user sees them, so only the forms the providers
+    answered with are learned, and only up to a maximum per index. """
+
+    # Longer words are more likely junk than lemmas
+    MAX_WORD_LENGTH = 50
+
+    def __init__(self, directory: str, max_learned: int = 5000, min_checked_words: int = 2000) -> None:
+        """ Class init method.
+        :param directory: The folder with the bundled word lists.
+        :param max_learned: How many words each index learns at most.
+        :param min_checked_words: How many words an index needs for searches to be checked for typos before the lookup. """
+
+        self.directory = directory
+        self.max_learned = max_learned
+        self.min_checked_words = min_checked_words
+        self.indexes: Dict[str, LemmaIndex] = {}
+        # Index -> the learned words not written yet
+        self.pending: Dict[str, List[str]] = {}
+        # Files are written on a thread of their own instead of the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lemmas")
+
+    def index(self, name: str) -> LemmaIndex:
+        """ Gets an index, loading its bundled and learned words the first time.
+        :param name: The index's name, e.g. 'spanish_verbs'. """
+
+        if (index := self.indexes.get(name)) is None:
+            index = self.indexes[name] = LemmaIndex(self._learned(name), bundled=self._load(name))
+
+        return index
+
+    def _load(self, name: str) -> Optional[WordList]:
+        """ Maps the bundled word list of an index, compiling it first if needed. """
+
+        source = os.path.join(self.directory, f"{name}.txt")
+        path = os.path.join(self.directory, f"{name}.words")
+        if os.path.isfile(source) and (not os.path.isfile(path) or os.path.getmtime(path) < os.path.getmtime(source)):
+            with open(source, encoding='utf-8') as f:
+                build((line.strip() for line in f), path)
+
+        return WordList(path) if os.path.isfile(path) else None
+
+    def _learned(self, name: str) -> List[str]:
+        """ Reads the words an index learned before. """
+
+        path = os.path.join(self.directory, f"{name}.learned")
+        if not os.path.isfile(path):
+            return []
+
+        # Other processes append to the same file, so it can hold a few more than the maximum
+        with open(path, encoding='utf-8') as f:
+            return list(islice((word for line in f if (word := line.strip())), self.max_learned))
+
+    def add(self, name: str, word: str) -> None:
+        """ Adds a word that was successfully looked up, unless the index learned enough words.
+        :param name: The index's name.
+        :param word: The normalized word, as the provider answered with it. """
+
+        index = self.index(name)
+        if len(word) > self.MAX_WORD_LENGTH or len(index.words) >= self.max_learned:
+            return
+
+        if index.add(word):
+            self.pending.setdefault(name, []).append(word)
+
+    async def flush(self) -> None:
+        """ Appends the words learned since the last flush to their files. """
+
+        pending, self.pending = self.pending, {}
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._write, pending)
+
+    def _write(self, pending: Dict[str, List[str]]) -> None:
+        """ Synchronously appends learned words to their indexes' files. """
+
+        if pending:
+            os.makedirs(self.directory, exist_ok=True)
+        for name, words in pending.items():
+            # A single short append, other processes' lines aren't interleaved with it
+            with open(os.path.join(self.directory, f"{name}.learned"), 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{word}\n" for word in words))
+
+    def complete(self, name: str, prefix: str, limit: int = 25) -> List[str]:
+        """ Gets the words of an index starting with a prefix.
+        :param name: The index's name.
+        :param prefix: The normalized beginning of the word.
+        :param limit: The maximum amount of words. """
+
+        return self.index(name).complete(prefix, limit)
+
+    def suggest(self, name: str, word: str, limit: int = 5) -> List[str]:
+        """ Gets the words of an index closest to a word that isn't in it.
+        :param name: The index's name.
+        :param word: The normalized word.
+        :param limit: The maximum amount of words.
+        :returns: No words if the word is in the index. """
+
+        index = self.index(name)
+        return [] if word in index else index.suggest(word, limit)
+
+    def check(self, name: str, word: str, limit: int = 5) -> List[str]:
+        """ Gets the known words a search is likely a typo of, before it's looked up.
+
+        A word missing from a small index is more likely a word it doesn't
+        know than a typo, so only indexes with enough words are checked, and
+        only words one letter away are suggested.
+        :param name: The index's name.
+        :param word: The normalized word.
+        :param limit: The maximum amount of words.
+        :returns: No words if the word may well be right. """
+
+        index = self.index(name)
+        if len(index) < self.min_checked_words or word in index:
+            return []
+
+        return index.suggest(word, limit, max_distance=1)
+
+    def close(self) -> None:
+        """ Writes the learned words and unmaps the bundled word lists. """
+
+        self.executor.shutdown(wait=True)
+        pending, self.pending = self.pending, {}
+        self._write(pending)
+        for index in self.indexes.values():
+            if index.bundled is not None:
+                index.bundled.close()
@@ -0,0 +1,455 @@
+import aiohttp
+import asyncio
+import contextvars
+import hashlib
+import importlib
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from others import scrapers
+from others.breaker import CircuitBreaker
+from others.cache import ResultCache, make_key
+from others.deadline import DeadlineExceeded, check_deadline, current_deadline, time_left
+from others.http_client import HTTPClient, parse_host_pairs
+from others.querylog import QueryLog
+from others.workers import ParserPool
+
+logger = logging.getLogger(__name__)
+
+# Marks a cached "nothing found" result
+NOT_FOUND = "__not_found__"
+
+# Providers whose results change slowly but do change: (soft TTL, hard TTL) in seconds.
+# Past the soft TTL a result is still served while it's refreshed in the background.
+CACHE_TTLS: Dict[str, Tuple[float, float]] = {
+    "conjugator.reverso.net": (7 * 86400, 30 * 86400),
+    "cooljugator.com": (7 * 86400, 30 * 86400),
+    "www.verbformen.com": (7 * 86400, 30 * 86400),
+    "dictionary.cambridge.org": (86400, 30 * 86400),
+    "context.reverso.net": (86400, 14 * 86400),
+    "www.lyrics.com": (6 * 3600, 7 * 86400),
+}
+
+# Headers holding credentials, lookups sent with them aren't written to the query log
+SECRET_HEADERS = ("auth", "key", "token", "cookie")
+
+
+class UpstreamError(Exception):
+    """ Raised when a website or API doesn't give a usable response. """
+
+    def __init__(self, url: str, status: Optional[int] = None) -> None:
+        self.url = url
+        self.status = status
+        super().__init__(f"{url} answered with {status}")
+
+
+class ProviderUnavailable(Exception):
+    """ Raised without calling a provider whose circuit is open.
+
+    It isn't an UpstreamError, so it reaches the bot's error handler,
+    which tells the user when to try again. """
+
+    def __init__(self, url: str, provider: str, retry_in: float) -> None:
+        self.url = url
+        self.provider = provider
+        self.retry_in = retry_in
+        super().__init__(f"{provider} is unavailable for {retry_in:.0f} seconds")
+
+
+class SingleFlight:
+    """ Runs at most one call per key at a time, sharing its result with every concurrent caller. """
+
+    def __init__(self) -> None:
+        """ Class init method. """
+
+        self.calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self.waiters: Dict["asyncio.Future[Any]", int] = {}
+        self.stats: Dict[str, int] = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """ Runs the call for the key, or joins the one already in flight.
+        :param key: The normalized key of the call.
+        :param func: Makes the call.
+        :param timeout: For how many seconds this caller waits for the result. Default = no limit. """
+
+        task = self.calls.get(key)
+        if task is None:
+            self.stats["calls"] += 1
+            # Runs as its own task, so one caller giving up doesn't cancel it for the others. It keeps the
+            # deadline of the caller that started it, commands get the same budget so the joiners' deadlines are about as late
+            task = asyncio.ensure_future(func())
+            self.calls[key] = task
+            self.waiters[task] = 0
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.stats["coalesced"] += 1
+
+        self.waiters[task] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            # Finished calls are already forgotten
+            if task in self.waiters:
+                self.waiters[task] -= 1
+                # Nobody waits for it anymore, so it stops holding a connection
+                if not self.waiters[task]:
+                    task.cancel()
+
+    def _finish(self, key: str, task: "asyncio.Future[Any]") -> None:
+        """ Forgets a finished call. """
+
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        self.waiters.pop(task, None)
+
+        # Marks the error as retrieved in case every caller has given up
+        if not task.cancelled():
+            task.exception()
+
+
+class Lookup:
+    """ Fetches and parses upstream pages for the cogs. """
+
+    def __init__(self, session: HTTPClient, parsers: ParserPool, cache: ResultCache, query_log: Optional[QueryLog] = None) -> None:
+        """ Class init method.
+        :param session: The shared HTTP client.
+        :param parsers: The pool the parsers run on.
+        :param cache: The result cache.
+        :param query_log: Where the cached lookups are counted, to warm the cache up on startup. Default = None. """
+
+        self.session = session
+        self.parsers = parsers
+        self.cache = cache
+        self.query_log = query_log
+        self.warmed_up = False
+        self.flights = SingleFlight()
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        # Provider -> the URL, headers and query parameters of its last failed request, requested again to probe it
+        self.probe_requests: Dict[str, Tuple[str, Optional[Dict[str, str]], Optional[Dict[str, str]]]] = {}
+        self.failure_threshold = int(os.getenv("CIRCUIT_FAILURES", 5))
+        self.reset_timeout = float(os.getenv("CIRCUIT_RESET_SECONDS", 30))
+        self.connect_timeout = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", 3))
+        self.read_timeout = float(os.getenv("UPSTREAM_READ_TIMEOUT", 10))
+        self.provider_timeouts = parse_host_pairs(os.getenv("UPSTREAM_TIMEOUTS", ""))
+        self.negative_ttl = int(os.getenv("NEGATIVE_CACHE_TTL", 6 * 3600))
+        self.cache_ttls = {**CACHE_TTLS, **parse_host_pairs(os.getenv("CACHE_TTLS", ""))}
+        self.cache_stats: Dict[str, Dict[str, int]] = {}
+        self.refreshing: Dict[str, "asyncio.Task[Any]"] = {}
+        self.truncated_reads = 0
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        """ Gets the circuit breaker of a provider, creating it on first use.
+        :param provider: The provider's host name. """
+
+        if (breaker := self.breakers.get(provider)) is None:
+            breaker = self.breakers[provider] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+
+        return breaker
+
+    def timeout(self, provider: str) -> aiohttp.ClientTimeout:
+        """ Gets the connect and read timeouts of a provider, bounded by the time the current command has left.
+        :param provider: The provider's host name. """
+
+        connect, read = self.provider_timeouts.get(provider, (self.connect_timeout, self.read_timeout))
+        if (remaining := check_deadline()) is not None:
+            connect, read = min(connect, remaining), min(read, remaining)
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+    async def fetch(self, url: str, parser: Optional[Callable[..., Any]] = None, *args: Any, **kwargs: Any) -> Any:
+        """ Fetches a page and parses it, joining an identical lookup if one is in flight.
+        :param url: The URL to request.
+        :param parser: The parser for the page's body, run on the parser pool. Default = returns the raw body.
+        :param args: Extra arguments for the parser.
+        :param key: The normalized key of the lookup. Default = the URL and query parameters.
+        :param cache: Whether to read and store the result in the result cache. Default = False.
+        :param ttl: For how many seconds a found result is cached. Default = the provider's hard TTL or the cache's TTL.
+        :param headers: The request headers.
+        :param params: The query parameters.
+        :param low_priority: Whether the request gives way to live ones, e.g. for prefetches. Default = False. """
+
+        remaining = check_deadline()
+        key = kwargs.get('key') or make_key(url, *(f"{name}={value}" for name, value in sorted((kwargs.get('params') or {}).items())))
+        if self.query_log is not None and kwargs.get('cache', False) and not kwargs.get('low_priority', False):
+            self._record(key, url, parser, args, kwargs)
+
+        try:
+            # The lookup is cancelled once every caller waiting for it is out of time
+            return await self.flights.do(key, lambda: self._lookup(key, url, parser, args, kwargs), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded()
+
+    async def _lookup(self, key: str, url: str, parser: Optional[Callable[..., Any]], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """ Performs a lookup, reading from and writing to the cache if asked to. """
+
+        provider = (urlsplit(url).hostname or '').lower()
+        if kwargs.get('cache', False):
+            entry = await self.cache.get_entry(key)
+            if entry is None:
+                self._count(provider, "misses")
+            elif isinstance(cached := entry[0], dict) and NOT_FOUND in cached:
+                self._count(provider, "negative_hits")
+                if cached["status"] != 200:
+                    raise UpstreamError(url, cached["status"])
+                return cached["result"]
+            else:
+                self._count(provider, "hits")
+                if entry[1]:
+                    self._count(provider, "stale_hits")
+                    self._revalidate(key, url, provider, parser, args, kwargs, cached)
+                return cached
+
+        return await self._refresh(key, url, provider, parser, args, kwargs)
+
+    def _revalidate(self, key: str, url: str, provider: str, parser: Optional[Callable[..., Any]], args: tuple, kwargs: Dict[str, Any], stale: Any) -> None:
+        """ Refreshes a stale result in the background, unless it's already being refreshed. """
+
+        if key in self.refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._refresh(key, url, provider, parser, args, {**kwargs, 'low_priority': True}, stale)
+            except (UpstreamError, ProviderUnavailable):
+                # The stale result keeps being served until its hard TTL
+                pass
+            except Exception:
+                # Nobody awaits this task, so anything else would go unnoticed; the stale result is still served
+                logger.exception("Couldn't refresh %s", url)
+            finally:
+                self.refreshing.pop(key, None)
+
+        # Runs outside of the caller's deadline, the caller already has its answer
+        context = contextvars.copy_context()
+        context.run(current_deadline.set, None)
+        self.refreshing[key] = context.run(asyncio.ensure_future, refresh())
+
+    async def _refresh(
+        self, key: str, url: str, provider: str, parser: Optional[Callable[..., Any]], args: tuple, kwargs: Dict[str, Any], stale: Any = None
+    ) -> Any:
+        """ Fetches and parses a page, storing the result in the cache if asked to.
+
+        A stale result is revalidated with the validators the page was last
+        served with, and reused as is when the page hasn't changed. """
+
+        cache = kwargs.get('cache', False)
+        headers = dict(kwargs.get('headers') or {})
+        validators = None
+        if cache and stale is not None and (validators := await self.cache.get(make_key("validators", key))):
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        breaker = self.breaker(provider)
+        if not breaker.allow():
+            raise ProviderUnavailable(url, provider, breaker.retry_in())
+
+        try:
+            async with self.session.get(
+                url, headers=headers or None, params=kwargs.get('params'), timeout=self.timeout(provider),
+                low_priority=kwargs.get('low_priority', False)
+            ) as response:
+                status = response.status
+                body = await self._read(response, getattr(parser, 'section', None)) if status == 200 else None
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Running out of the command's time isn't the provider's fault
+            if isinstance(e, asyncio.TimeoutError) and (remaining := time_left()) is not None and remaining <= 0:
+                breaker.release()
+                raise DeadlineExceeded() from e
+            self._record_failure(provider, url, kwargs)
+            raise UpstreamError(url) from e
+        except BaseException:
+            breaker.release()
+            raise
+
+        # Only the provider's own failures count, not e.g. a 404 for a misspelled word
+        if status >= 500 or status == 429:
+            self._record_failure(provider, url, kwargs)
+        else:
+            breaker.record_success()
+
+        if status == 304 and validators:
+            self._count(provider, "not_modified")
+            await self._store(key, provider, stale, validators, kwargs)
+            return stale
+
+        if status != 200:
+            # A missing page is a "nothing found" too, e.g. a misspelled word
+            if cache and status == 404:
+                await self.cache.set(key, {NOT_FOUND: True, "status": status, "result": None}, ttl=self.negative_ttl)
+            raise UpstreamError(url, status)
+
+        # Providers without validators still often serve the very same page, which needn't be parsed again
+        digest = hashlib.sha256(body).hexdigest()
+        if validators and validators.get("hash") == digest:
+            self._count(provider, "unchanged")
+            result = stale
+        else:
+            result = await self.parsers.run(parser, body, *args) if parser else body
+
+        if cache:
+            if result:
+                await self._store(key, provider, result, {"etag": etag, "last_modified": last_modified, "hash": digest}, kwargs)
+            else:
+                # Nothing found results are kept for less time, in case the page shows up later
+                await self.cache.set(key, {NOT_FOUND: True, "status": status, "result": result}, ttl=self.negative_ttl)
+
+        return result
+
+    def _record_failure(self, provider: str, url: str, kwargs: Dict[str, Any]) -> None:
+        """ Counts a provider's failure, keeping the request to probe the provider with. """
+
+        self.breaker(provider).record_failure()
+        self.probe_requests[provider] = (url, kwargs.get('headers'), kwargs.get('params'))
+
+    async def probe(self) -> int:
+        """ Requests again the last failed page of each provider whose circuit can be probed,
+        so a provider that recovered is closed without a user's command paying for the probe.
+        :returns: How many providers were probed. """
+
+        probes = []
+        for provider, breaker in self.breakers.items():
+            if breaker.state == CircuitBreaker.HALF_OPEN and provider in self.probe_requests and breaker.allow():
+                probes.append(self._probe(provider, *self.probe_requests[provider]))
+
+        await asyncio.gather(*probes)
+        return len(probes)
+
+    async def _probe(self, provider: str, url: str, headers: Optional[Dict[str, str]], params: Optional[Dict[str, str]]) -> None:
+        """ Requests a page to probe its provider, the probe slot being already taken. """
+
+        breaker = self.breaker(provider)
+        try:
+            async with self.session.get(url, headers=headers, params=params, timeout=self.timeout(provider), low_priority=True) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            breaker.record_failure()
+            return
+        except BaseException:
+            breaker.release()
+            raise
+
+        if status >= 500 or status == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    async def _read(self, response: aiohttp.ClientResponse, section: Optional[str]) -> bytes:
+        """ Reads a page's body, stopping once the section its parser needs is over.
+        :param response: The page's response.
+        :param section: The #id or .class selector of the section. Default = reads the whole body. """
+
+        if section is None:
+            return await response.read()
+
+        watcher = scrapers.SectionWatcher(section)
+        chunks = []
+        # If the section is missing or never ends, this is a full read
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            if watcher.feed(chunk):
+                # The connection isn't reused, as the rest of the body is still on it
+                response.close()
+                self.truncated_reads += 1
+                break
+
+        return b''.join(chunks)
+
+    async def _store(self, key: str, provider: str, result: Any, validators: Dict[str, Optional[str]], kwargs: Dict[str, Any]) -> None:
+        """ Stores a found result in the cache, along with the validators to revalidate it with. """
+
+        soft_ttl, ttl = self.cache_ttls.get(provider, (None, kwargs.get('ttl')))
+        await self.cache.set(key, result, ttl=ttl, soft_ttl=soft_ttl)
+        # Only needed to revalidate a stale result
+        if soft_ttl is not None:
+            await self.cache.set(make_key("validators", key), validators, ttl=ttl)
+
+    def _record(self, key: str, url: str, parser: Optional[Callable[..., Any]], args: tuple, kwargs: Dict[str, Any]) -> None:
+        """ Counts a cached lookup in the query log, with what's needed to prefetch it. """
+
+        # Only parsers that can be imported back by name are prefetched
+        parser_name = f"{parser.__module__}.{parser.__qualname__}" if parser else None
+        if parser_name and '<' in parser_name:
+            return
+
+        # Credentials aren't stored, and replaying the lookup without them would only fail
+        headers = kwargs.get('headers') or {}
+        if any(secret in name.lower() for name in headers for secret in SECRET_HEADERS):
+            return
+
+        recipe = {
+            "url": url, "parser": parser_name, "args": list(args),
+            "headers": headers, "params": kwargs.get('params'), "ttl": kwargs.get('ttl')
+        }
+        try:
+            self.query_log.record(key, recipe)
+        except (TypeError, ValueError):
+            # The parser's arguments can't be stored
+            pass
+
+    async def prefetch(self, key: str, recipe: Dict[str, Any]) -> Any:
+        """ Makes a logged lookup again at a low priority, storing its result in the cache.
+        :param key: The lookup's normalized key.
+        :param recipe: The lookup's recipe, as stored in the query log. """
+
+        parser = None
+        if recipe["parser"]:
+            module, _, name = recipe["parser"].rpartition('.')
+            parser = getattr(importlib.import_module(module), name)
+
+        return await self.fetch(
+            recipe["url"], parser, *recipe["args"], key=key, cache=True, low_priority=True,
+            headers=recipe["headers"] or None, params=recipe["params"], ttl=recipe.get("ttl")
+        )
+
+    async def warm_up(self, amount: int) -> int:
+        """ Prefetches the most popular lookups into the cache, one at a time.
+        :param amount: How many lookups to prefetch. """
+
+        if self.query_log is None or self.warmed_up:
+            return 0
+
+        self.warmed_up = True
+        warmed = 0
+        for key, recipe in await self.query_log.top(amount):
+            try:
+                await self.prefetch(key, recipe)
+            except (UpstreamError, ProviderUnavailable, DeadlineExceeded, ImportError, AttributeError):
+                continue
+            warmed += 1
+
+        return warmed
+
+    def _count(self, provider: str, event: str) -> None:
+        """ Counts a cache event of a provider. """
+
+        stats = self.cache_stats.setdefault(
+            provider, {"hits": 0, "stale_hits": 0, "negative_hits": 0, "misses": 0, "not_modified": 0, "unchanged": 0}
+        )
+        stats[event] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """ Gets the lookup metrics. """
+
+        return {
+            "lookups": self.flights.stats["calls"],
+            "coalesced": self.flights.stats["coalesced"],
+            "in_flight": len(self.flights.calls),
+            "refreshing": len(self.refreshing),
+            "truncated_reads": self.truncated_reads,
+            "open_circuits": sum(breaker.state != CircuitBreaker.CLOSED for breaker in self.breakers.values())
+        }
+
+    def get_breaker_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """ Gets the metrics of each provider's circuit breaker. """
+
+        return {provider: breaker.get_metrics() for provider, breaker in self.breakers.items()}
+
+    def get_cache_metrics(self) -> Dict[str, Dict[str, int]]:
+        """ Gets the cache hits, stale hits, "nothing found" hits, misses and revalidations of each provider. """
+
+        return {provider: dict(stats) for provider, stats in self.cache_stats.items()}
@@ -0,0 +1,76 @@
+import unicodedata
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+from others.cache import make_key
+
+
+class Rule(NamedTuple):
+    """ How the searches of a language are normalized. """
+
+    # 'fold' ignores case entirely, 'lower' only lowercases and 'keep' leaves it as typed
+    case: str = 'fold'
+    # What each run of whitespace becomes
+    separator: str = ' '
+    # Letters that are lowercased differently than Unicode's default, applied before lowercasing
+    case_map: Tuple[Tuple[str, str], ...] = ()
+
+
+DEFAULT_RULE = Rule()
+
+# The languages that don't follow the default rule
+RULES: Dict[str, Rule] = {
+    # ß and ss are different spellings, which casefolding would merge
+    'german': Rule(case='lower'),
+    # Nouns are always capitalized, and verbformen tells them apart from other words by it
+    'german_nouns': Rule(case='keep'),
+    # Casefolding turns the final ς into σ, which isn't how words are written
+    'greek': Rule(case='lower'),
+    # The dotted and dotless i are different letters
+    'turkish': Rule(case='lower', case_map=(('I', 'ı'), ('İ', 'i'))),
+    # The declinator API takes a single word
+    'polish_declension': Rule(separator=''),
+}
+
+
+class Query(NamedTuple):
+    """ A normalized search, with its cache key. """
+
+    term: str
+    key: str
+
+    def url(self, template: str, **fields: str) -> str:
+        """ Makes the upstream URL of the search.
+        :param template: The URL, with {term} where the percent-encoded term goes.
+        :param fields: Other values for the template, e.g. a language code. """
+
+        return template.format(term=quote(self.term, safe=''), **fields)
+
+
+def normalize(text: str, language: Optional[str] = None) -> str:
+    """ Puts a search into its canonical form, so equivalent searches are the same.
+    :param text: The search as it was typed.
+    :param language: The language of the search, which picks its rule. Default = the default rule. """
+
+    rule = RULES.get(language, DEFAULT_RULE)
+    # Composes the characters, e.g. "e" followed by a combining circumflex becomes "ê"
+    term = rule.separator.join(unicodedata.normalize('NFC', text).split())
+    for letter, replacement in rule.case_map:
+        term = term.replace(letter, replacement)
+
+    if rule.case == 'fold':
+        term = term.casefold()
+    elif rule.case == 'lower':
+        term = term.lower()
+
+    return term
+
+
+def make_query(provider: str, language: Optional[str], text: str) -> Query:
+    """ Normalizes a search and makes its cache key.
+    :param provider: The website or API the search goes to.
+    :param language: The language of the search, which picks its rule.
+    :param text: The search as it was typed. """
+
+    term = normalize(text, language)
+    return Query(term, make_key(provider, *([language] if language else []), term))
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+
+class QueryLog:
+    """ Counts how often each cached lookup is made, so the popular ones can be prefetched.
+
+    The counts are kept in memory and added to a SQLite file in batches.
+    Each entry stores what's needed to make the lookup again (its recipe). """
+
+    def __init__(self, path: str, max_entries: int = 10000, max_age: int = 30 * 86400) -> None:
+        """ Class init method.
+        :param path: The path of the SQLite file.
+        :param max_entries: The maximum amount of lookups kept in the file, the least popular are dropped.
+        :param max_age: After how many seconds without being made a lookup is dropped. """
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.pending: Dict[str, Tuple[int, float, str]] = {}
+
+        if directory := os.path.dirname(path):
+            os.makedirs(directory, exist_ok=True)
+
+        # SQLite calls block, so they run on a thread of their own instead of the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="query-log")
+        self.db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS Queries (
+            key TEXT NOT NULL PRIMARY KEY,
+            recipe TEXT NOT NULL,
+            hits INTEGER NOT NULL,
+            last_seen REAL NOT NULL
+        )""")
+        self.db.commit()
+
+    def record(self, key: str, recipe: Dict[str, Any]) -> None:
+        """ Counts a lookup.
+        :param key: The lookup's normalized key.
+        :param recipe: The JSON serializable arguments to make the lookup again. """
+
+        hits = self.pending[key][0] if key in self.pending else 0
+        self.pending[key] = (hits + 1, time.time(), json.dumps(recipe, ensure_ascii=False))
+
+    async def _run(self, func, *args) -> Any:
+        """ Runs a SQLite call on the log's worker thread. """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def _take_pending(self) -> List[Tuple[str, str, int, float]]:
+        """ Takes the pending counts as rows, the lookups made meanwhile being counted anew. """
+
+        rows = [(key, recipe, hits, last_seen) for key, (hits, last_seen, recipe) in self.pending.items()]
+        self.pending = {}
+        return rows
+
+    async def flush(self) -> None:
+        """ Adds the pending counts to the file and drops the stale and least popular lookups. """
+
+        await self._run(self._write, self._take_pending())
+
+    def _write(self, rows: List[Tuple[str, str, int, float]]) -> None:
+        """ Synchronously adds counts and drops the stale and least popular lookups.
+        :param rows: The keys, recipes, counts and last times of the lookups to add. """
+
+        if rows:
+            self.db.executemany("""INSERT INTO Queries (key, recipe, hits, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET recipe = excluded.recipe, hits = hits + excluded.hits, last_seen = excluded.last_seen""", rows)
+
+        self.db.execute("DELETE FROM Queries WHERE last_seen <= ?", (time.time() - self.max_age,))
+        self.db.execute("""DELETE FROM Queries WHERE key NOT IN (
+            SELECT key FROM Queries ORDER BY hits DESC LIMIT ?
+        )""", (self.max_entries,))
+        self.db.commit()
+
+    async def top(self, amount: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """ Gets the most popular lookups.
+        :param amount: How many lookups to get. """
+
+        await self.flush()
+        rows = await self._run(self._top, amount)
+        return [(key, json.loads(recipe)) for key, recipe in rows]
+
+    def _top(self, amount: int) -> List[Tuple[str, str]]:
+        """ Synchronously gets the keys and recipes of the most popular lookups. """
+
+        return self.db.execute("SELECT key, recipe FROM Queries ORDER BY hits DESC LIMIT ?", (amount,)).fetchall()
+
+    def close(self) -> None:
+        """ Writes the pending counts and closes the file. """
+
+        self.executor.shutdown(wait=True)
+        self._write(self._take_pending())
+        self.db.close()
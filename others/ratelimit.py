@@ -0,0 +1,179 @@
+import asyncio
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class CommandLimitStore(ABC):
+    """ Interface for the per-user daily command counters.
+
+    Any implementation backed by storage that several bot processes can
+    reach (a SQLite file on the same host, Redis, MySQL...) can be used. """
+
+    @abstractmethod
+    async def hit(self, user_id: int, limit: int) -> bool:
+        """ Counts a command for the user if they are still within the limit.
+        :param user_id: The ID of the user who ran the command.
+        :param limit: The maximum amount of commands per window. """
+
+    @abstractmethod
+    async def refund(self, user_id: int) -> None:
+        """ Gives a command back to the user, e.g. when it failed.
+        :param user_id: The ID of the user who ran the command. """
+
+    async def flush(self) -> None:
+        """ Persists pending changes. """
+
+    def close(self) -> None:
+        """ Persists pending changes and releases the store. """
+
+
+class SQLiteCommandLimitStore(CommandLimitStore):
+    """ Fixed-window command counters kept in memory and added to a SQLite file in batches.
+
+    Windows are aligned to multiples of their length, e.g. UTC days, so every
+    process sharing the file counts the same window. Each process only adds
+    its own hits and refunds to the file's counts, so none overwrites another's,
+    and counters are read back from the file after each flush to see the others'. """
+
+    def __init__(self, path: str, window: int = 86400, max_entries: int = 50000) -> None:
+        """ Class init method.
+        :param path: The path of the SQLite file.
+        :param window: The length of a window in seconds.
+        :param max_entries: The maximum amount of counters kept in memory. """
+
+        self.path = path
+        self.window = window
+        self.max_entries = max_entries
+        # User -> [window start, count], the file's count plus this process' pending changes
+        self.counters: "OrderedDict[int, List[int]]" = OrderedDict()
+        # User -> [window start, change], what this process hasn't added to the file yet
+        self.pending: Dict[int, List[int]] = {}
+
+        if directory := os.path.dirname(path):
+            os.makedirs(directory, exist_ok=True)
+
+        # SQLite calls run on a single worker thread so they never block the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="command-limits")
+        self.db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS CommandLimits (
+            user_id INTEGER NOT NULL PRIMARY KEY,
+            window_start INTEGER NOT NULL,
+            count INTEGER NOT NULL
+        )""")
+        self.db.commit()
+
+    async def _run(self, func, *args) -> Any:
+        """ Runs a SQLite call on the store's worker thread. """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def _window_start(self) -> int:
+        """ Gets when the current window started. """
+
+        now = int(time.time())
+        return now - now % self.window
+
+    def _load(self, user_id: int) -> Optional[Tuple[int, int]]:
+        """ Reads a user's counter from the file. """
+
+        return self.db.execute("SELECT window_start, count FROM CommandLimits WHERE user_id = ?", (user_id,)).fetchone()
+
+    async def _get_counter(self, user_id: int) -> List[int]:
+        """ Gets the user's counter for the current window, loading it from the file if needed.
+        :param user_id: The ID of the user. """
+
+        start = self._window_start()
+        if (counter := self.counters.get(user_id)) is None:
+            row = await self._run(self._load, user_id)
+            # Another hit may have loaded it in the meantime
+            if (counter := self.counters.get(user_id)) is None:
+                counter = [start, max(row[1], 0)] if row and row[0] == start else [start, 0]
+                if (change := self.pending.get(user_id)) and change[0] == start:
+                    counter[1] += change[1]
+                self.counters[user_id] = counter
+                self._evict()
+        self.counters.move_to_end(user_id)
+
+        # Starts a new window once the current one is over
+        if counter[0] != start:
+            counter[0], counter[1] = start, 0
+
+        return counter
+
+    def _evict(self) -> None:
+        """ Drops the least recently used counters from memory, their pending changes are kept. """
+
+        while len(self.counters) > self.max_entries:
+            self.counters.popitem(last=False)
+
+    def _change(self, user_id: int, start: int, amount: int) -> None:
+        """ Adds to the user's pending change for a window. """
+
+        change = self.pending.get(user_id)
+        if change is None or change[0] != start:
+            change = self.pending[user_id] = [start, 0]
+        change[1] += amount
+
+    async def hit(self, user_id: int, limit: int) -> bool:
+        """ Counts a command for the user if they are still within the limit.
+        :param user_id: The ID of the user who ran the command.
+        :param limit: The maximum amount of commands per window. """
+
+        counter = await self._get_counter(user_id)
+        if counter[1] >= limit:
+            return False
+
+        counter[1] += 1
+        self._change(user_id, counter[0], 1)
+        return True
+
+    async def refund(self, user_id: int) -> None:
+        """ Gives a command back to the user, e.g. when it failed.
+        :param user_id: The ID of the user who ran the command. """
+
+        counter = await self._get_counter(user_id)
+        if counter[1] > 0:
+            counter[1] -= 1
+            self._change(user_id, counter[0], -1)
+
+    async def flush(self) -> None:
+        """ Adds the pending changes to the file and purges the expired counters. """
+
+        changes, self.pending = self.pending, {}
+        await self._run(self._write, changes, self._window_start())
+
+        # Reloaded when next used, with the other processes' hits
+        for user_id in changes:
+            if user_id not in self.pending:
+                self.counters.pop(user_id, None)
+
+    def _write(self, changes: Dict[int, List[int]], current_start: int) -> None:
+        """ Synchronously adds changes to the file's counters and purges the expired ones. """
+
+        if changes:
+            rows = [(user_id, start, amount) for user_id, (start, amount) in changes.items() if start == current_start]
+            # A change for an older window than the file's is dropped, one for a newer window replaces the count
+            self.db.executemany("""INSERT INTO CommandLimits (user_id, window_start, count) VALUES (?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    count = CASE
+                        WHEN excluded.window_start = window_start THEN MAX(count + excluded.count, 0)
+                        WHEN excluded.window_start > window_start THEN MAX(excluded.count, 0)
+                        ELSE count END,
+                    window_start = MAX(window_start, excluded.window_start)""", rows)
+
+        self.db.execute("DELETE FROM CommandLimits WHERE window_start < ?", (current_start,))
+        self.db.commit()
+
+    def close(self) -> None:
+        """ Writes the pending changes and closes the file. """
+
+        self.executor.shutdown(wait=True)
+        self._write(self.pending, self._window_start())
+        self.pending = {}
+        self.db.close()
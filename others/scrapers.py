@@ -0,0 +1,569 @@
+from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from itertools import cycle, zip_longest
+import copy
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from lxml import etree
+    DEFAULT_BACKEND = 'lxml'
+except ImportError:
+    etree = None
+    DEFAULT_BACKEND = 'html.parser'
+
+# The tree builder used by BeautifulSoup, lxml is several times faster than the pure-Python one
+PARSER_BACKEND = os.getenv("HTML_PARSER", DEFAULT_BACKEND)
+
+
+def make_soup(markup: bytes) -> BeautifulSoup:
+    """ Parses a page with the configured backend.
+    :param markup: The page's HTML. """
+
+    return BeautifulSoup(markup, PARSER_BACKEND)
+
+
+def reads_until(selector: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """ Marks a parser as only needing the page up to the end of a section, so the rest isn't downloaded.
+    :param selector: The section's #id or .class selector, everything the parser reads must come before its end. """
+
+    def decorator(parser: Callable[..., Any]) -> Callable[..., Any]:
+        parser.section = selector
+        return parser
+
+    return decorator
+
+
+class SectionWatcher:
+    """ Scans a page for the end of a section as it's downloaded, telling once it's over.
+
+    This runs on the event loop, so the page isn't parsed: once the section's
+    opening tag is found, only the tags with the same name are counted, with
+    a byte search, until the one closing the section. """
+
+    # How much of the scanned bytes is kept for an opening tag split between chunks
+    TAIL = 1024
+
+    def __init__(self, selector: str) -> None:
+        """ Class init method.
+        :param selector: The section's #id or .class selector. """
+
+        attribute, before = (b'id', b'') if selector.startswith('#') else (b'class', rb'(?:[^"\'>]*\s)?')
+        # An opening tag with the name as its id, or among its classes
+        self.start = re.compile(
+            rb'<([a-z][a-z0-9]*)(?:\s[^>]*?)?\s' + attribute + rb'\s*=\s*["\']?' + before + re.escape(selector[1:].encode()) + rb'(?=[\s"\'>])',
+            re.IGNORECASE
+        )
+        self.tags: Optional[re.Pattern] = None
+        self.depth = 0
+        self.pending = b''
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """ Scans the next chunk of the page, telling whether the section is over.
+        :param chunk: The chunk's bytes. """
+
+        if self.done:
+            return True
+
+        self.pending += chunk
+        if self.tags is None:
+            if (match := self.start.search(self.pending)) is None:
+                self.pending = self.pending[-self.TAIL:]
+                return False
+            self.tags = re.compile(rb'<(/?)' + re.escape(match.group(1)) + rb'[\s/>]', re.IGNORECASE)
+            self.depth = 1
+            self.pending = self.pending[match.end():]
+
+        scanned = 0
+        for match in self.tags.finditer(self.pending):
+            self.depth += -1 if match.group(1) else 1
+            if self.depth == 0:
+                self.done = True
+                return True
+            scanned = match.end()
+
+        # Keeps what could be the start of a tag split between chunks
+        self.pending = self.pending[max(scanned, len(self.pending) - 32):]
+        return False
+
+
+def compile_selectors(**selectors: str) -> Dict[str, sv.SoupSieve]:
+    """ Compiles the CSS selectors of a provider once, at import time.
+    :param selectors: The selectors by name. """
+
+    return {name: sv.compile(selector) for name, selector in selectors.items()}
+
+
+REVERSO_CONJUGATION = compile_selectors(
+    subhead='.subHead.subHead-res.clearfix',
+    translation='.word-transl-options',
+    found_verb='.targetted-word-wrap',
+    word_wrap='.word-wrap',
+    result_block='.result-block-api',
+    rows='.word-wrap-row',
+    tables='.wrap-three-col',
+    tense_name='p',
+    title='.word-wrap-title',
+    verbs='.wrap-verbs-listing li'
+)
+
+COOLJUGATOR = compile_selectors(
+    container='#conjugationDivs.fourteen.wide.column',
+    tables='.conjugation-table.collapsable',
+    pronouns='.conjugation-cell.conjugation-cell-four.conjugation-cell-pronouns.pronounColumn',
+    tenses='.conjugation-cell.conjugation-cell-four.tense-title',
+    cells='.conjugation-cell.conjugation-cell-four'
+)
+
+MIJNWOORDENBOEK = compile_selectors(
+    content_box='.content_box',
+    rows='table tr'
+)
+
+OPENRUSSIAN = compile_selectors(
+    container='.table-container',
+    modes='.table-audio',
+    long='.long',
+    case_names='tbody tr th .short',
+    rows='tbody tr',
+    cells='td'
+)
+
+VERBFORMEN = compile_selectors(
+    section='.rAbschnitt',
+    decl_types='section.rBox.rBoxWht',
+    decl_title='header h2',
+    tables='.rAufZu',
+    blocks='.vTbl',
+    h2='h2',
+    h3='h3',
+    rows='tr',
+    th='th',
+    td='td'
+)
+
+CAMBRIDGE = compile_selectors(
+    page='.page',
+    entries='.pr .dictionary',
+    header='.pos-header',
+    title='.di-title',
+    kind='.posgram.dpos-g.hdib.lmr-5',
+    us_phonetic='.us.dpron-i',
+    uk_phonetic='.uk.dpron-i',
+    body='.pos-body',
+    image='.dimg > amp-img',
+    level='.def-info.ddef-info',
+    description='.def.ddef_d.db',
+    examples_div='.def-body.ddef_b',
+    examples='.examp.dexamp'
+)
+
+REVERSO_CONTEXT = compile_selectors(
+    examples='#examples-content > div',
+    original='div.src.ltr',
+    translation='div.trg.ltr',
+    translations='#translations-content > a'
+)
+
+LYRICS = compile_selectors(
+    songs='.sec-lyric.clearfix',
+    title='.lyric-meta.within-lyrics',
+    link='.lyric-meta-title a',
+    image='.album-thumb img'
+)
+
+
+def format_tense(forms: List[str], mode: str) -> str:
+    """ Formats the conjugations of a tense the way the conjugation pages show them.
+    :param forms: The conjugations, one per line.
+    :param mode: The verbal mode the tense belongs to. """
+
+    text = ''.join(f"{form}\n" for form in forms)
+    return f"```apache\n{text}\nmode=\"{mode}\"\n```"
+
+
+@reads_until('.word-wrap')
+def parse_reverso_conjugation(markup: bytes, space: bool, aligned: bool) -> Optional[Dict[str, Any]]:
+    """ Parses the conjugation tables from a Reverso Conjugator page.
+    :param markup: The page's HTML.
+    :param space: If you want a space separator between the parts of each conjugation.
+    :param aligned: If the fields will be inline. """
+
+    html = make_soup(markup)
+    subhead = REVERSO_CONJUGATION['subhead'].select_one(html)
+    if not subhead:
+        return None
+
+    # Translation options
+    #-> Word translation
+    tr_div = REVERSO_CONJUGATION['translation'].select_one(subhead)
+    found_verb = REVERSO_CONJUGATION['found_verb'].select_one(tr_div).get_text().strip()
+    # Conjugation table divs
+    verb_div = REVERSO_CONJUGATION['word_wrap'].select_one(html)
+    word_wraps = REVERSO_CONJUGATION['result_block'].select_one(verb_div)
+    word_wrap_rows = REVERSO_CONJUGATION['rows'].select(word_wraps)
+
+    verbal_mode = ''
+
+    conjugations = {}
+    for i, current_row in enumerate(word_wrap_rows):
+        conjugations[f'page{i}'] = []
+        # Loops through the rows
+        for table in REVERSO_CONJUGATION['tables'].select(current_row):
+            # Specifies the verbal tense if there is one
+            if temp_tense_name := REVERSO_CONJUGATION['tense_name'].select_one(table):
+                tense_name = temp_tense_name.get_text()
+
+                # Changes verbal mode if it's time to change it
+                if (temp_title := REVERSO_CONJUGATION['title'].select_one(table)):
+                    title = temp_title.get_text().strip()
+                    verbal_mode = title
+                elif (temp_title := REVERSO_CONJUGATION['title'].select_one(current_row)):
+                    title = temp_title.get_text().strip()
+                    verbal_mode = title
+
+                verbal_mode = title
+
+            # If there isn't, it shows '...' instead
+            else:
+                tense_name = '...'
+                verbal_mode = REVERSO_CONJUGATION['title'].select_one(table).get_text().strip()
+
+            # Loops through each tense row
+            forms = [
+                li.get_text(separator=' ') if space else li.get_text()
+                for li in REVERSO_CONJUGATION['verbs'].select(table)
+            ]
+            conjugations[f'page{i}'].append({'tense': [format_tense(forms, verbal_mode), tense_name, aligned]})
+
+    return {'found_verb': found_verb, 'conjugations': conjugations}
+
+
+def parse_cooljugator(markup: bytes) -> Optional[List[List[Tuple[str, List[str]]]]]:
+    """ Parses the conjugation tables from a Cooljugator page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    container = COOLJUGATOR['container'].select_one(html)
+    if not container:
+        return None
+
+    conjugations = []
+    conj_divs = COOLJUGATOR['tables'].select(container)
+
+    # Gets all useful information
+    for conj_div in conj_divs:
+        # Gets all pronouns
+        pronouns = [
+            pronoun.get_text(separator=' ').strip()
+            for pronoun in COOLJUGATOR['pronouns'].select(conj_div) if pronoun.get_text()
+        ]
+        # Gets all tenses
+        tenses = [
+            tense.get_text().strip()
+            for tense in COOLJUGATOR['tenses'].select(conj_div) if tense.get_text()
+        ]
+        # Gets all conjugations
+        conjs = [
+            conj.get_text(separator='  ').strip() if conj.get_text() else ''
+            for conj in COOLJUGATOR['cells'].select(conj_div)
+        ][1:]
+        # Filters the conjugations a bit
+        new_conjs = []
+        for conj in conjs:
+            if conj.strip() not in pronouns and conj.strip() not in tenses:
+                conj = conj.strip().split('  ')[0]
+                new_conjs.append(conj)
+
+        # Unify the pronouns with the conjugations
+        rows = []
+        pronouns = cycle(pronouns)
+        for conj in new_conjs:
+            if conj:
+                try:
+                    temp = f"{next(pronouns)} {conj}"
+                except Exception:
+                    temp = f"- {conj}"
+
+                rows.append(temp)
+
+        # Unify the tenses with the rows
+        n = round(len(rows)/len(tenses))
+        rows = [rows[i:i + n] for i in range(0, len(rows), n)]
+        pairs = list(zip_longest(tenses, rows, fillvalue='_'))
+        conjugations.append(pairs)
+
+    return conjugations
+
+
+def parse_mijnwoordenboek(markup: bytes) -> List[str]:
+    """ Parses the conjugation table rows from a Mijnwoordenboek page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    if not (content_box := MIJNWOORDENBOEK['content_box'].select_one(html)):
+        return []
+
+    return [row.get_text().strip() for row in MIJNWOORDENBOEK['rows'].select(content_box)[1:]]
+
+
+def parse_openrussian(markup: bytes) -> Optional[Dict[str, List[Any]]]:
+    """ Parses the declension table from an OpenRussian page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    div = OPENRUSSIAN['container'].select_one(html)
+    if not div:
+        return None
+
+    # Gets the word modes (singular, plura, m., f., etc)
+    word_modes = []
+    for mode in OPENRUSSIAN['modes'].select(div):
+        # Checks whether the row has a long version of the mode
+        if value := OPENRUSSIAN['long'].select_one(mode):
+            if value.text:
+                word_modes.append(value.text.strip())
+        # If not just tries to get its content
+        else:
+            if mode.text:
+                word_modes.append(mode.text.strip())
+
+    # Gets all case names
+    case_names = [case.text.strip() for case in OPENRUSSIAN['case_names'].select(div) if case.text]
+
+    # Gets all values
+    case_values = []
+    for case in OPENRUSSIAN['rows'].select(div):
+        row_values = []
+        for row in OPENRUSSIAN['cells'].select(case):
+            if value := row.get_text(" | ", strip=True):
+                row_values.append(value.strip())
+
+        case_values.append(row_values)
+
+    return {'word_modes': word_modes, 'case_names': case_names, 'case_values': case_values}
+
+
+def parse_cooljugator_declension(markup: bytes) -> Optional[Dict[str, Any]]:
+    """ Parses the declension tables from a Cooljugator page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    div = COOLJUGATOR['tables'].select(html)
+    case_titles = {}
+    for d in div:
+        case_titles.update({title.text: [] for title in COOLJUGATOR['tenses'].select(d) if title.text})
+
+    # Get case names
+    case_names = []
+    for dd in div:
+        case_names.append([case.text for case in COOLJUGATOR['pronouns'].select(dd) if case.text])
+
+    indexes = list(case_titles)
+    if not indexes:
+        return None
+
+    index = indexes[0]
+    for dd in div:
+        for decl in COOLJUGATOR['cells'].select(dd):
+            if decl.text:
+                try:
+                    if new_i := indexes.index(decl.text):
+                        index = indexes[new_i]
+                except ValueError:
+                    pass
+
+                try:
+                    case_titles[index].append(decl['data-default'])
+                except Exception:
+                    pass
+
+    return {'case_titles': case_titles, 'case_names': case_names}
+
+
+def parse_verbformen(markup: bytes) -> Optional[List[List[Any]]]:
+    """ Parses the declension tables from a Verbformen page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    div = VERBFORMEN['section'].select_one(html)
+    if not div:
+        return None
+
+    decl_type_list = []
+    for decl_type in VERBFORMEN['decl_types'].select(div):
+        try:
+            decl_type_list.append(VERBFORMEN['decl_title'].select_one(decl_type).text)
+        except AttributeError:
+            decl_type_list.append('...')
+    master_dict = {}
+    for dt in decl_type_list:
+        master_dict[dt] = []
+
+    # Gets the main section of the page
+    for section in VERBFORMEN['section'].select(html):
+        # Gets the declination tables
+        for i, table in enumerate(VERBFORMEN['tables'].select(section)):
+            # Gets the gender blocks of each table
+            for case in VERBFORMEN['blocks'].select(table):
+                category_name = '...'
+
+                if cat := VERBFORMEN['h2'].select_one(case):
+                    category_name = cat.text
+                elif cat := VERBFORMEN['h3'].select_one(case):
+                    category_name = cat.text
+
+                case_dict = {}
+                decl_name = list(master_dict)[i-1]
+                case_dict[category_name] = []
+
+                # Gets each row of each table block
+                for row in VERBFORMEN['rows'].select(case):
+                    case_name = VERBFORMEN['th'].select_one(row).text
+                    case_decl = [line.text for line in VERBFORMEN['td'].select(row)]
+                    case_decl.insert(0, case_name)
+                    case_dict[category_name].append(case_decl.copy())
+                    case_decl.clear()
+                master_dict[decl_name].append(copy.deepcopy(case_dict))
+
+    return [[k, v] for k, v in master_dict.items()]
+
+
+@reads_until('.page')
+def parse_cambridge(markup: bytes) -> Optional[List[Dict[str, Any]]]:
+    """ Parses the dictionary entries from a Cambridge Dictionary page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+    page = CAMBRIDGE['page'].select_one(html)
+    if not page:
+        return None
+
+    entries = []
+    for example in CAMBRIDGE['entries'].select(page):
+        try:
+            entries.append({
+                'header': _get_cambridge_header(example),
+                'content': _get_cambridge_content(example),
+                'examples': _get_cambridge_examples(example)
+            })
+        except AttributeError:
+            # Skips entries that don't have the usual layout
+            continue
+
+    return entries
+
+
+def _get_cambridge_header(example) -> Dict[str, str]:
+    """ Gets a header for the example.
+    :param example: The whole HTML of the search word example. """
+
+    header = CAMBRIDGE['header'].select_one(example)
+
+    # Gets simple tags from the HTML, as the title, type of word (noun, adjective, verb, etc)
+    title = CAMBRIDGE['title'].select_one(header).get_text().strip()
+    kind = kd.get_text().strip() if (kd := CAMBRIDGE['kind'].select_one(header)) else '?'
+
+    # Gets all phonetic texts from elements that have specific class names in the list below
+    phonetics = []
+    for phonetic_selector in [CAMBRIDGE['us_phonetic'], CAMBRIDGE['uk_phonetic']]:
+        if pho := phonetic_selector.select_one(header):
+            temp_pho_span = []
+            # Gets only text from useful subtags, as listed below
+            for cl in [['region', 'dreg'], ['pron', 'dpron']]:
+                for content in pho.contents:
+                    if isinstance(content, Tag) and content.get('class') == cl:
+                        # Appends to the a temp list, regarding this iteration
+                        temp_pho_span.append(content.get_text().strip())
+
+            # Appends to the main list
+            phonetics.append(' '.join(temp_pho_span[:]))
+
+    # Makes a neat dictionary to return it and be easier to handle the data
+    return {
+        "title": title,
+        "kind": kind,
+        "phonetics": ' | '.join(phonetics) if phonetics else '?'
+    }
+
+
+def _get_cambridge_content(example) -> Dict[str, str]:
+    """ Gets the content of the given search.
+    :param example: The whole HTML of the search word example. """
+
+    # Gets the main example div
+    content = CAMBRIDGE['body'].select_one(example)
+    # Gets image, word level (a1, a2, b1, b2, c1, c2) and the description
+    image = f"https://dictionary.cambridge.org/{link['src']}" if (link := CAMBRIDGE['image'].select_one(content)) else ''
+    level = level.get_text().strip() if (level := CAMBRIDGE['level'].select_one(content)) else ''
+    description = CAMBRIDGE['description'].select_one(content).get_text().strip()
+
+    return {
+        'level': level,
+        'description': description,
+        'image': image
+    }
+
+
+def _get_cambridge_examples(example) -> List[str]:
+    """ Get examples for the given search.
+    :param example: The whole HTML of the search wor example. """
+
+    # Gets the main examples div
+    examples_div = CAMBRIDGE['examples_div'].select_one(example)
+    # Gets all examples
+    examples = []
+    if examples_div:
+        examples = [ex.get_text().strip() for ex in CAMBRIDGE['examples'].select(examples_div)]
+
+    return examples
+
+
+@reads_until('#examples-content')
+def parse_reverso_context(markup: bytes) -> Dict[str, List[Any]]:
+    """ Parses the examples and translations from a Reverso Context page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+
+    # Gets  all examples
+    examples = REVERSO_CONTEXT['examples'].select(html)
+    groups = []
+
+    # Strips and formats the content text for each example
+    for ex in examples:
+        original = REVERSO_CONTEXT['original'].select_one(ex)
+        translation = REVERSO_CONTEXT['translation'].select_one(ex)
+        if not original or not translation:
+            continue
+
+        original = original.get_text().strip()
+        translation = translation.get_text().strip()
+        groups.append({'original': original, 'translation': translation})
+
+    # Gets all translations
+    translations = [tr.get_text().strip() for tr in REVERSO_CONTEXT['translations'].select(html) if tr.get_text()]
+
+    return {'examples': groups, 'translations': translations}
+
+
+def parse_lyrics(markup: bytes) -> List[Dict[str, str]]:
+    """ Parses the found songs from a Lyrics.com search page.
+    :param markup: The page's HTML. """
+
+    html = make_soup(markup)
+
+    songs = []
+    for song in LYRICS['songs'].select(html):
+        title = LYRICS['title'].select_one(song)
+        link = LYRICS['link'].select_one(song)
+        image = img['src'] if (img := LYRICS['image'].select_one(song)) else ''
+        songs.append({
+            'title': title.get_text().strip() if title else '',
+            'href': link['href'] if link else '',
+            'image': image
+        })
+
+    return songs
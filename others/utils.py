@@ -7,6 +7,9 @@ import discord
 import os
 from .customerrors import DailyCommandsLimit
 
+# How many commands a day users without an entitlement can run
+DAILY_COMMANDS_LIMIT = 20
+
 
 def is_local() -> bool:
     """ Checks whether the bot is running
@@ -165,29 +168,25 @@ async def disable_buttons(view: discord.ui.View) -> None:
         child.disabled = True
 
 
-def check_command_limit(limit: int = 20) -> bool:
-    """ Checks whether the user is poisoned and disorients the command. """
+async def hit_command_limit(client, user_id: int, limit: int = DAILY_COMMANDS_LIMIT) -> bool:
+    """ Counts a command of a user, telling whether it's within their daily limit.
+    :param client: The bot.
+    :param user_id: The user's ID.
+    :param limit: The daily limit. """
 
-    async def real_check(ctx):
-        """ Perfoms the real check. """
+    if client.entitlements.has_entitlement(user_id):
+        return True
 
-        client = ctx.command.cog.client
-        current_timestamp = int(await get_timestamp())
-        user_entitlement = discord.utils.get(await client.fetch_entitlements(), user_id=ctx.author.id)
-        if user_entitlement:
-            return True
+    return await client.commands_limit.hit(user_id, limit)
 
-        user_limit = client.commands_limit.get(ctx.author.id)
-        if user_limit is None:
-            client.commands_limit[ctx.author.id] = {"timestamp": current_timestamp, "limit": 1}
-            return True
 
-        if user_limit["limit"] < limit:
-            client.commands_limit[ctx.author.id]["limit"] += 1
-            return True
+def check_command_limit(limit: int = DAILY_COMMANDS_LIMIT) -> bool:
+    """ Checks whether the user is poisoned and disorients the command. """
+
+    async def real_check(ctx):
+        """ Perfoms the real check. """
 
-        if current_timestamp - user_limit["timestamp"] >= 86400:
-            client.commands_limit[ctx.author.id] = {"timestamp": current_timestamp, "limit": 1}
+        if await hit_command_limit(ctx.command.cog.client, ctx.author.id, limit):
             return True
 
         raise DailyCommandsLimit(limit=limit)
@@ -1,9 +1,50 @@
 import discord
 from discord.ext import commands
 
-from typing import Optional, Any, Union, Dict
+from typing import Optional, Any, Union, Dict, List, Callable, Awaitable, NamedTuple, Tuple
 from others import utils
 
+
+class Page(NamedTuple):
+    """ A page of search results, built once so that flipping pages only formats it. """
+
+    title: str
+    description: str = ""
+    url: Optional[str] = None
+    fields: Tuple[Tuple[str, str, bool], ...] = ()
+    thumbnail: Optional[str] = None
+
+
+async def make_page_embed(member: Union[discord.Member, discord.User], example: Page, offset: int, lentries: int, **kwargs: Any) -> discord.Embed:
+    """ Makes an embed out of a prebuilt page.
+    :param member: The member who triggered this.
+    :param example: The current page.
+    :param offset: The number of the current page.
+    :param lentries: The total amount of pages. """
+
+    current_time = await utils.get_time_now()
+    embed = discord.Embed(
+        title=example.title,
+        description=example.description,
+        color=member.color,
+        timestamp=current_time,
+        url=example.url
+    )
+
+    for name, value, inline in example.fields:
+        embed.add_field(name=name, value=value, inline=inline)
+
+    if example.thumbnail:
+        embed.set_thumbnail(url=example.thumbnail)
+
+    # Sets the author of the search
+    embed.set_author(name=member, icon_url=member.display_avatar)
+    # Makes a footer with the a current page and total page counter
+    # There's no guild in DMs, and not every guild has an icon
+    embed.set_footer(text=f"{offset}/{lentries}", icon_url=member.guild.icon.url if getattr(member, 'guild', None) and member.guild.icon else None)
+    return embed
+
+
 class PaginatorView(discord.ui.View):
     """ View for the embed paginator. """
 
@@ -17,7 +58,7 @@ class PaginatorView(discord.ui.View):
         self.search = kwargs.get('search', None)
         self.result = kwargs.get('result', None)
         self.title = kwargs.get('title', None)
-        self.change_embed = kwargs.get('change_embed')
+        self.change_embed = kwargs.get('change_embed', make_page_embed)
         self.index: int = 0
         self.increment = increment
 
@@ -58,6 +99,70 @@ class PaginatorView(discord.ui.View):
         return embed
 
 
+class KeysetPaginatorView(discord.ui.View):
+    """ View for an embed paginator that fetches its pages on demand. """
+
+    def __init__(self, total: int, fetch_page: Callable[..., Awaitable[List[Any]]], timeout: Optional[float] = 180, page_size: int = 1, **kwargs: Any) -> None:
+        """ Class init method.
+        :param total: The total amount of entries.
+        :param fetch_page: Fetches a page of entries given either the key to start ``after`` or the key to end ``before``.
+        :param page_size: The amount of entries per page. """
+
+        super().__init__(timeout=timeout)
+        self.total = total
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.change_embed = kwargs.get('change_embed')
+        self.key = kwargs.get('key', lambda entry: entry[0])
+        self.entries: List[Any] = []
+        self.index: int = 0
+
+    @discord.ui.button(label="Left", emoji="⬅", style=discord.ButtonStyle.blurple, custom_id="left_button_id")
+    async def button_left(self, button: discord.ui.button, interaction: discord.Interaction) -> None:
+        """ Flips the page to the left. """
+
+        await interaction.response.defer()
+
+        if self.index > 0 and self.entries:
+            entries = await self.fetch_page(limit=self.page_size, before=self.key(self.entries[0]))
+            if len(entries) < self.page_size:
+                # Reached the beginning, so it refills the first page
+                self.index = 0
+                entries = await self.fetch_page(limit=self.page_size)
+            else:
+                self.index = max(self.index - self.page_size, 0)
+            self.entries = entries
+
+        embed = await self.make_embed(interaction.user)
+        await interaction.followup.edit_message(interaction.message.id, embed=embed)
+
+    @discord.ui.button(label="Right", emoji="➡", style=discord.ButtonStyle.blurple, custom_id="right_button_id")
+    async def button_right(self, button: discord.ui.button, interaction: discord.Interaction) -> None:
+        """ Flips the page to the right. """
+
+        await interaction.response.defer()
+
+        if self.index < self.total - self.page_size and self.entries:
+            if entries := await self.fetch_page(limit=self.page_size, after=self.key(self.entries[-1])):
+                self.index += self.page_size
+                self.entries = entries
+
+        embed = await self.make_embed(interaction.user)
+        await interaction.followup.edit_message(interaction.message.id, embed=embed)
+
+    async def make_embed(self, member: Union[discord.Member, discord.User]) -> discord.Embed:
+        """ Makes an embed for the current page, fetching the first one if needed.
+        :param member: The member who triggered this. """
+
+        if not self.entries:
+            self.entries = await self.fetch_page(limit=self.page_size)
+
+        embed = await self.change_embed(
+            member=member, entries=self.entries, offset=self.index+1, lentries=self.total
+        )
+        return embed
+
+
 class ReversoContextView(discord.ui.View):
     """ View for the Flashcards system. """
 
@@ -132,4 +237,47 @@ class ReversoContextView(discord.ui.View):
             lentries=len(self.data), entries=self.data,
             title=self.title, translations=self.translations
         )
-        return embed
\ No newline at end of file
+        return embed
+
+class SuggestionView(discord.ui.View):
+    """ View with a button for each word suggested in place of a misspelled one. """
+
+    def __init__(self, suggestions: List[str], search: Callable[[str], Awaitable[Any]], client: commands.Bot,
+        original: Optional[str] = None, timeout: Optional[float] = 180) -> None:
+        """ Class init method.
+        :param suggestions: The suggested words.
+        :param search: Searches the clicked word.
+        :param client: The bot, whose daily command limit the searches count towards.
+        :param original: The searched word, to offer searching it anyway. Default = not offered. """
+
+        super().__init__(timeout=timeout)
+        self.search = search
+        self.client = client
+        for word in suggestions:
+            self.add_item(self.make_button(word))
+        if original:
+            self.add_item(self.make_button(original, f"Search {original} anyway", discord.ButtonStyle.gray))
+
+    def make_button(self, word: str, label: Optional[str] = None, style: discord.ButtonStyle = discord.ButtonStyle.blurple) -> discord.ui.Button:
+        """ Makes a button that searches a word.
+        :param word: The word to search.
+        :param label: The button's text. Default = the word.
+        :param style: The button's style. """
+
+        # Discord limits labels to 80 characters
+        button = discord.ui.Button(label=(label or word)[:80], style=style)
+
+        async def callback(interaction: discord.Interaction) -> None:
+            await interaction.response.defer()
+            await utils.disable_buttons(self)
+            await interaction.followup.edit_message(interaction.message.id, view=self)
+            self.stop()
+            # A search from a button is a new search, so it counts as a command
+            if not await utils.hit_command_limit(self.client, interaction.user.id):
+                return await interaction.followup.send(
+                    f"You reached the {utils.DAILY_COMMANDS_LIMIT} daily commands limit. To have limitless commands per day, click on the bot's profile and subscribe to **Premium**!",
+                    ephemeral=True)
+            await self.search(word)
+
+        button.callback = callback
+        return button
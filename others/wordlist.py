@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+# Magic, format version, words per block, amount of words and amount of blocks
+HEADER = struct.Struct("<4sHHII")
+OFFSET = struct.Struct("<I")
+MAGIC = b"WRDL"
+VERSION = 1
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    """ Appends an unsigned integer, 7 bits per byte with the high bit set on all but the last. """
+
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position: int) -> Tuple[int, int]:
+    """ Reads an unsigned integer, returning it and the position after it. """
+
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def build(words: Iterable[str], path: str, block_size: int = 16) -> None:
+    """ Writes a word list in the compact format WordList reads.
+
+    Words are sorted by their UTF-8 bytes and split into blocks. The first word
+    of a block is stored whole and each following one only as the length of the
+    prefix it shares with the previous word plus the rest of it, so the common
+    beginnings of a language's words are stored once per block. A table with
+    the offset of each block lets a binary search jump between them.
+    :param words: The words, in any order and possibly repeated.
+    :param path: The file to write, replaced atomically.
+    :param block_size: How many words each block has. """
+
+    encoded = sorted({word.encode('utf-8') for word in words if word})
+    offsets, data = [], bytearray()
+    for index, word in enumerate(encoded):
+        if index % block_size == 0:
+            offsets.append(len(data))
+            shared = 0
+        else:
+            previous = encoded[index - 1]
+            shared = len(os.path.commonprefix([previous, word]))
+            _write_varint(shared, data)
+
+        _write_varint(len(word) - shared, data)
+        data += word[shared:]
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # Written aside and moved, so other processes never map a half-written file
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(descriptor, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, block_size, len(encoded), len(offsets)))
+        f.write(b''.join(OFFSET.pack(offset) for offset in offsets))
+        f.write(data)
+    os.replace(temporary, path)
+
+
+class WordList:
+    """ A sorted word list read from a memory-mapped file made by build.
+
+    Only the pages of the blocks a search touches are read, and processes
+    mapping the same file share them in the page cache. """
+
+    def __init__(self, path: str) -> None:
+        """ Class init method.
+        :param path: The file made by build. """
+
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.block_size, self.count, self.blocks = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path} isn't a word list of version {VERSION}")
+
+        self.data_start = HEADER.size + OFFSET.size * self.blocks
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, word: str) -> bool:
+        encoded = word.encode('utf-8')
+        return any(found == encoded for found in self._block(self._find(encoded)))
+
+    def __iter__(self) -> Iterator[str]:
+        for block in range(self.blocks):
+            yield from (word.decode('utf-8') for word in self._block(block))
+
+    def _offset(self, block: int) -> int:
+        """ Gets where a block starts in the file. """
+
+        return self.data_start + OFFSET.unpack_from(self.map, HEADER.size + OFFSET.size * block)[0]
+
+    def _first(self, block: int) -> bytes:
+        """ Gets the first word of a block, which is stored whole. """
+
+        length, position = _read_varint(self.map, self._offset(block))
+        return self.map[position:position + length]
+
+    def _block(self, block: int) -> List[bytes]:
+        """ Decodes the words of a block. """
+
+        if not 0 <= block < self.blocks:
+            return []
+
+        words, position = [], self._offset(block)
+        for index in range(min(self.block_size, self.count - block * self.block_size)):
+            shared = 0
+            if index:
+                shared, position = _read_varint(self.map, position)
+            length, position = _read_varint(self.map, position)
+            words.append((words[-1][:shared] if index else b'') + self.map[position:position + length])
+            position += length
+
+        return words
+
+    def _find(self, encoded: bytes) -> int:
+        """ Gets the block where a word is or would be, with a binary search over the blocks' first words. """
+
+        low, high = 0, self.blocks
+        while low < high:
+            middle = (low + high) // 2
+            if self._first(middle) <= encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        return max(low - 1, 0)
+
+    def starting_with(self, prefix: str) -> Iterator[str]:
+        """ Yields the words starting with a prefix, in alphabetical order, decoding one block at a time.
+        :param prefix: The normalized beginning of the word. """
+
+        encoded = prefix.encode('utf-8')
+        block = self._find(encoded)
+        while block < self.blocks:
+            words = self._block(block)
+            for word in words[bisect_left(words, encoded):]:
+                if not word.startswith(encoded):
+                    return
+                yield word.decode('utf-8')
+            block += 1
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """ Gets the words starting with a prefix, in alphabetical order.
+        :param prefix: The normalized beginning of the word.
+        :param limit: The maximum amount of words. """
+
+        return list(islice(self.starting_with(prefix), limit))
+
+    def close(self) -> None:
+        """ Unmaps the file. """
+
+        self.map.close()
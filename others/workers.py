@@ -0,0 +1,46 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class ParserPool:
+    """ Pool of workers that runs the page parsers off the event loop.
+
+    The parsers must be module-level functions taking and returning plain
+    picklable data, so they can also run on a process pool. """
+
+    def __init__(self, kind: Optional[str] = None, workers: Optional[int] = None) -> None:
+        """ Class init method.
+        :param kind: Either 'thread' or 'process'. Default = PARSER_POOL env var or 'thread'.
+        :param workers: The amount of workers. Default = PARSER_WORKERS env var or up to 4 per CPU count. """
+
+        self.kind = (kind or os.getenv("PARSER_POOL", "thread")).lower()
+        self.workers = workers or int(os.getenv("PARSER_WORKERS", min(4, os.cpu_count() or 1)))
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """ Gets the executor, creating it on first use. """
+
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parser")
+
+        return self._executor
+
+    async def run(self, parser: Callable[..., Any], *args: Any) -> Any:
+        """ Runs a parser on the pool.
+        :param parser: The parser function.
+        :param args: The arguments for the parser, usually the page's HTML. """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, parser, *args)
+
+    def close(self) -> None:
+        """ Shuts the workers down. """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
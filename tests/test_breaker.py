@@ -0,0 +1,46 @@
+import unittest
+from unittest import mock
+
+from others.breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the per-provider circuit breaker."""
+
+    def setUp(self):
+        """Set up a breaker that opens after two failures."""
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    def test_opens_after_consecutive_failures(self):
+        """ Tests that the circuit opens and fails fast after the threshold. """
+
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.get_metrics()["rejected"], 1)
+
+    def test_half_open_probe(self):
+        """ Tests that a single probe goes through once the reset timeout is over. """
+
+        with mock.patch("others.breaker.time.monotonic", return_value=100):
+            self.breaker.record_failure()
+            self.breaker.record_failure()
+
+        with mock.patch("others.breaker.time.monotonic", return_value=131):
+            self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+            self.assertTrue(self.breaker.allow())
+            self.assertFalse(self.breaker.allow())
+            # Those turned away while the probe is in flight still get a time to retry in
+            self.assertEqual(self.breaker.retry_in(), CircuitBreaker.PROBE_RETRY)
+
+            # A failed probe opens it again
+            self.breaker.record_failure()
+            self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+        with mock.patch("others.breaker.time.monotonic", return_value=162):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_success()
+            self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+            self.assertEqual(self.breaker.get_metrics()["opened"], 2)
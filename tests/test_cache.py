@@ -0,0 +1,46 @@
+import unittest
+import asyncio
+import os
+import tempfile
+
+from others.cache import ResultCache, make_key
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the two-tier result cache."""
+
+    def setUp(self):
+        """Set up a cache on a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.db")
+        self.cache = ResultCache(self.path, max_memory=64)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Clean up the temporary file."""
+        self.loop.close()
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_memory_and_disk_tiers(self):
+        """ Tests that results evicted from memory are read back from disk. """
+
+        key = make_key("reverso", "french", "être")
+        result = {"found_verb": "être", "conjugations": {"page0": []}}
+        self.loop.run_until_complete(self.cache.set(key, result))
+        self.assertEqual(self.loop.run_until_complete(self.cache.get(key)), result)
+        self.assertEqual(self.cache.stats["memory_hits"], 1)
+
+        self.loop.run_until_complete(self.cache.set(make_key("reverso", "french", "avoir"), "x" * 60))
+        self.assertNotIn(key, self.cache.memory)
+        self.assertLessEqual(self.cache.memory_size, 64)
+        self.assertEqual(self.loop.run_until_complete(self.cache.get(key)), result)
+        self.assertEqual(self.cache.stats["disk_hits"], 1)
+
+    def test_expired_results_are_missed(self):
+        """ Tests that expired results are neither returned nor kept. """
+
+        key = make_key("reverso", "spanish", "ser")
+        self.loop.run_until_complete(self.cache.set(key, ["ser"], ttl=-1))
+        self.assertIsNone(self.loop.run_until_complete(self.cache.get(key)))
+        self.assertEqual(self.loop.run_until_complete(self.cache.purge()), 1)
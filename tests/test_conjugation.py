@@ -0,0 +1,30 @@
+import unittest
+
+from others.languages import LANGUAGES, LANGUAGES_BY_NAME, PROVIDER_URLS
+
+try:
+    from cogs.Conjugation import Conjugation
+except ImportError:
+    Conjugation = None
+
+
+class TestLanguageRegistry(unittest.TestCase):
+    """Test cases for the conjugation commands made from the language registry."""
+
+    def test_every_language_can_be_looked_up(self):
+        """ Tests that each language has a unique name and a provider with a known URL. """
+
+        self.assertEqual(len(LANGUAGES_BY_NAME), len(LANGUAGES))
+        for language in LANGUAGES:
+            self.assertIn(language.provider, PROVIDER_URLS)
+
+    @unittest.skipIf(Conjugation is None, "discord isn't installed")
+    def test_every_language_has_a_command(self):
+        """ Tests that each language gets a command in its group, with a cooldown of its own. """
+
+        commands = {command.name: command for group in Conjugation._conjugate.subcommands for command in group.subcommands}
+        self.assertEqual(sorted(commands), sorted(language.name for language in LANGUAGES))
+        for language in LANGUAGES:
+            self.assertEqual(commands[language.name].parent.name, language.group)
+
+        self.assertEqual(len({id(command._buckets) for command in commands.values()}), len(LANGUAGES))
@@ -0,0 +1,57 @@
+import unittest
+
+from others import conjugator
+from others.scrapers import format_tense
+
+
+def forms(result, page, index):
+    """ Gets the lines of a tense, without its code block. """
+
+    return result['conjugations'][page][index]['tense'][0].split('\n')[1:-3]
+
+
+class TestConjugator(unittest.TestCase):
+    """Test cases for the local conjugation of regular verbs."""
+
+    def test_regular_verbs(self):
+        """ Tests a regular verb of each conjugation class. """
+
+        self.assertEqual(forms(conjugator.conjugate('spanish', 'vivir'), 'page0', 0),
+            ["yo vivo", "tú vives", "él/ella/Ud. vive", "nosotros vivimos", "vosotros vivís", "ellos/ellas/Uds. viven"])
+        self.assertEqual(forms(conjugator.conjugate('portuguese', 'comer'), 'page1', 0)[0], "eu comerei")
+        self.assertEqual(forms(conjugator.conjugate('italian', 'finire'), 'page0', 0)[-1], "loro finiscono")
+        self.assertEqual(forms(conjugator.conjugate('french', 'vendre'), 'page0', 0)[2], "il vend")
+
+    def test_spelling_changes(self):
+        """ Tests that stems keep their sound and French pronouns are elided. """
+
+        self.assertEqual(forms(conjugator.conjugate('spanish', 'llegar'), 'page0', 3)[0], "yo llegué")
+        self.assertEqual(forms(conjugator.conjugate('italian', 'mangiare'), 'page0', 3)[0], "io mangerò")
+        self.assertEqual(forms(conjugator.conjugate('italian', 'cercare'), 'page0', 0)[1], "tu cerchi")
+        self.assertEqual(forms(conjugator.conjugate('french', 'commencer'), 'page0', 0)[3], "nous commençons")
+        self.assertEqual(forms(conjugator.conjugate('french', 'aimer'), 'page2', 0)[0], "que j'aime")
+
+    def test_irregular_and_unknown_verbs_fall_back(self):
+        """ Tests that verbs the engine isn't sure about are left to the scraper. """
+
+        self.assertIsNone(conjugator.conjugate('spanish', 'ser'))
+        self.assertIsNone(conjugator.conjugate('french', 'aller'))
+        self.assertIsNone(conjugator.conjugate('german', 'machen'))
+        self.assertIsNone(conjugator.build('french', 'xyz'))
+
+    def test_exceptions(self):
+        """ Tests the irregular participles and the verbs conjugated with être and essere. """
+
+        self.assertEqual(forms(conjugator.conjugate('spanish', 'escribir'), 'page5', 1), ["escrito"])
+        self.assertEqual(forms(conjugator.conjugate('french', 'tomber'), 'page1', 0)[3], "nous sommes tombés")
+        self.assertEqual(forms(conjugator.conjugate('italian', 'arrivare'), 'page1', 0)[0], "io sono arrivato")
+
+    def test_same_structure_as_the_scraper(self):
+        """ Tests that the result can be shown the same way as a scraped one. """
+
+        result = conjugator.conjugate('spanish', 'hablar', aligned=False)
+        self.assertEqual(result['found_verb'], 'hablar')
+        self.assertEqual(list(result['conjugations']), [f'page{i}' for i in range(6)])
+        text, name, aligned = result['conjugations']['page0'][0]['tense']
+        self.assertEqual((name, aligned), ("Presente", False))
+        self.assertEqual(text, format_tense(forms(result, 'page0', 0), "Indicativo"))
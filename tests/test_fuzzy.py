@@ -0,0 +1,54 @@
+import random
+import tempfile
+import unittest
+
+from others.fuzzy import DeletionIndex, levenshtein
+from others.lemmas import Lemmas
+
+
+class TestFuzzy(unittest.TestCase):
+    """Test cases for the misspelled word suggestions."""
+
+    def test_levenshtein(self):
+        """ Tests the distance and that it stops counting past the maximum. """
+
+        self.assertEqual(levenshtein("kitten", "sitting", 5), 3)
+        self.assertEqual(levenshtein("hablar", "hablar", 2), 0)
+        self.assertEqual(levenshtein("kitten", "sitting", 2), 3)
+        self.assertEqual(levenshtein("a", "abcdef", 2), 3)
+        self.assertEqual(levenshtein("", "ab", 2), 2)
+
+    def test_index_finds_the_same_words_as_comparing_all(self):
+        """ Tests that the deletion index doesn't miss any word within the distance, whichever letter the typo is in. """
+
+        random.seed(7)
+        words = {"".join(random.choice("abcde") for _ in range(random.randint(1, 7))) for _ in range(2000)}
+        index = DeletionIndex(words)
+        for word in ("abc", "eeda", "bacdeab", "x", "xbcd"):
+            for max_distance in (1, 2):
+                expected = sorted((levenshtein(word, other, 10), other) for other in words if levenshtein(word, other, max_distance) <= max_distance)
+                self.assertEqual(index.search(word, max_distance), expected)
+
+    def test_suggestions(self):
+        """ Tests that known words aren't corrected and learned words are suggested. """
+
+        with tempfile.TemporaryDirectory() as directory:
+            with open(f"{directory}/spanish_verbs.txt", "w", encoding="utf-8") as f:
+                f.write("hablar\ncomer\nvivir\n")
+            lemmas = Lemmas(directory)
+
+            self.assertEqual(lemmas.suggest("spanish_verbs", "hablar"), [])
+            self.assertEqual(lemmas.suggest("spanish_verbs", "hablr"), ["hablar"])
+            self.assertEqual(lemmas.suggest("spanish_verbs", "ablar"), ["hablar"])
+            self.assertEqual(lemmas.suggest("spanish_verbs", "xyzxyz"), [])
+            lemmas.add("spanish_verbs", "cantar")
+            self.assertEqual(lemmas.suggest("spanish_verbs", "catar"), ["cantar"])
+            self.assertEqual(lemmas.suggest("russian_nouns", "дом"), [])
+
+            # Only large enough indexes are checked before the lookup, for words one letter away
+            self.assertEqual(lemmas.check("spanish_verbs", "catar"), [])
+            lemmas.min_checked_words = 4
+            self.assertEqual(lemmas.check("spanish_verbs", "catar"), ["cantar"])
+            self.assertEqual(lemmas.check("spanish_verbs", "ctar"), [])
+            self.assertEqual(lemmas.check("spanish_verbs", "cantar"), [])
+            lemmas.close()
@@ -0,0 +1,85 @@
+import unittest
+import asyncio
+
+from others.http_client import HostGovernor, parse_host_pairs, parse_retry_after
+
+
+class TestHostGovernor(unittest.TestCase):
+    """Test cases for the per-host request governor."""
+
+    def setUp(self):
+        """Set up a fresh event loop."""
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Close the event loop."""
+        self.loop.close()
+
+    def test_in_flight_limit_is_enforced(self):
+        """ Tests that no more than the limit of requests run at once. """
+
+        governor = HostGovernor(max_in_flight=2, rate=0)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            await governor.acquire()
+            peak = max(peak, governor.in_flight)
+            await asyncio.sleep(0.01)
+            governor.release(200, 0.01)
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        self.loop.run_until_complete(run())
+        self.assertEqual(peak, 2)
+        self.assertEqual(governor.get_metrics()["requests"], 6)
+        self.assertGreater(governor.get_metrics()["wait_max_ms"], 0)
+
+    def test_throttling_shrinks_the_limit(self):
+        """ Tests that 429s halve the limit and successes grow it back. """
+
+        governor = HostGovernor(max_in_flight=8, rate=0)
+
+        async def run():
+            await governor.acquire()
+            governor.release(429, 0.1, retry_after=0.05)
+            self.assertEqual(governor.limit, 4)
+
+            # Honors Retry-After before letting the next request start
+            start = self.loop.time()
+            await governor.acquire()
+            self.assertGreaterEqual(self.loop.time() - start, 0.04)
+            governor.release(200, 0.1)
+            self.assertGreater(governor.limit, 4)
+
+        self.loop.run_until_complete(run())
+
+    def test_low_priority_gives_way(self):
+        """ Tests that low priority requests use half the slots and wait behind live ones. """
+
+        governor = HostGovernor(max_in_flight=4, rate=0)
+        order = []
+
+        async def request(name, low_priority):
+            await governor.acquire(low_priority)
+            order.append(name)
+            await asyncio.sleep(0.01)
+            governor.release(200, 0.01)
+
+        async def run():
+            prefetches = [asyncio.ensure_future(request(f"prefetch{i}", True)) for i in range(3)]
+            await asyncio.sleep(0)
+            self.assertEqual(governor.in_flight, 2)
+            await asyncio.gather(*prefetches, *(request(f"live{i}", False) for i in range(4)))
+
+        self.loop.run_until_complete(run())
+        self.assertLess(order.index("live3"), order.index("prefetch2"))
+
+    def test_parsers(self):
+        """ Tests the Retry-After and per-host settings parsers. """
+
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_host_pairs("api.declinator.com=2:1.5, cooljugator.com=4:5"),
+                         {"api.declinator.com": (2, 1.5), "cooljugator.com": (4, 5.0)})
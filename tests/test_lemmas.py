@@ -0,0 +1,90 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from others.lemmas import LemmaIndex, Lemmas
+
+
+class TestLemmaIndex(unittest.TestCase):
+    """Test cases for the prefix index behind the autocomplete."""
+
+    def test_complete_by_prefix(self):
+        """ Tests that only the words starting with the prefix are suggested, in order and up to the limit. """
+
+        index = LemmaIndex(["hablar", "haber", "hacer", "comer", "hablar"])
+        self.assertEqual(index.complete("ha"), ["haber", "hablar", "hacer"])
+        self.assertEqual(index.complete("ha", limit=2), ["haber", "hablar"])
+        self.assertEqual(index.complete("x"), [])
+        self.assertEqual(len(index), 4)
+
+    def test_add_keeps_the_index_sorted(self):
+        """ Tests that learned words are suggested and not duplicated. """
+
+        index = LemmaIndex(["comer"])
+        index.add("beber")
+        index.add("beber")
+        self.assertEqual(index.words, ["beber", "comer"])
+        self.assertIn("beber", index)
+
+    def test_complete_is_fast(self):
+        """ Tests that a large index answers well within Discord's autocomplete deadline. """
+
+        index = LemmaIndex(f"word{i}" for i in range(200000))
+        start = time.perf_counter()
+        for i in range(1000):
+            index.complete(f"word{i}")
+        self.assertLess((time.perf_counter() - start) / 1000, 0.001)
+
+
+class TestLemmas(unittest.TestCase):
+    """Test cases for the lazily loaded word lists."""
+
+    def setUp(self):
+        """Set up a folder with a bundled word list."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "french_verbs.txt"), "w", encoding="utf-8") as f:
+            f.write("parler\npartir\n\naimer\n")
+
+    def tearDown(self):
+        """Remove the folder."""
+        self.directory.cleanup()
+
+    def test_loaded_when_first_used(self):
+        """ Tests that a word list is only read once its index is used, and grows with found words. """
+
+        lemmas = Lemmas(self.directory.name)
+        self.assertEqual(lemmas.indexes, {})
+        self.assertEqual(lemmas.complete("french_verbs", "par"), ["parler", "partir"])
+        lemmas.add("french_verbs", "parcourir")
+        self.assertEqual(lemmas.complete("french_verbs", "par"), ["parcourir", "parler", "partir"])
+        self.assertEqual(list(lemmas.indexes), ["french_verbs"])
+        self.assertEqual(lemmas.complete("dutch_verbs", "lo"), [])
+        lemmas.close()
+
+        # Learned words survive a restart, and aren't written twice
+        lemmas = Lemmas(self.directory.name)
+        lemmas.add("french_verbs", "parcourir")
+        self.assertEqual(lemmas.complete("french_verbs", "par"), ["parcourir", "parler", "partir"])
+        with open(os.path.join(self.directory.name, "french_verbs.learned"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "parcourir\n")
+        lemmas.close()
+
+    def test_learned_words_are_capped_and_written_in_batches(self):
+        """ Tests that an index stops learning at its maximum and the words are only written on flush. """
+
+        lemmas = Lemmas(self.directory.name, max_learned=2)
+        for word in ("abattre", "aboyer", "absoudre", "x" * 51):
+            lemmas.add("french_verbs", word)
+        self.assertEqual(lemmas.index("french_verbs").words, ["abattre", "aboyer"])
+
+        path = os.path.join(self.directory.name, "french_verbs.learned")
+        self.assertFalse(os.path.exists(path))
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(lemmas.flush())
+        loop.close()
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "abattre\naboyer\n")
+        lemmas.close()
@@ -0,0 +1,320 @@
+import unittest
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import ANY
+
+from others import scrapers
+from others.cache import ResultCache, make_key
+from others.deadline import DeadlineExceeded, start_deadline
+from others.lookup import Lookup, SingleFlight, UpstreamError
+from others.querylog import QueryLog
+from others.workers import ParserPool
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for the request coalescing layer."""
+
+    def setUp(self):
+        """Set up a fresh event loop."""
+        self.loop = asyncio.new_event_loop()
+        self.flights = SingleFlight()
+        self.calls = 0
+
+    def tearDown(self):
+        """Close the event loop."""
+        self.loop.close()
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"found_verb": "tener"}
+
+    def test_concurrent_calls_are_coalesced(self):
+        """ Tests that identical concurrent calls share one fetch. """
+
+        async def run():
+            return await asyncio.gather(*(self.flights.do("tener", self.fetch) for _ in range(5)))
+
+        results = self.loop.run_until_complete(run())
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.flights.stats, {"calls": 1, "coalesced": 4})
+        self.assertEqual(self.flights.calls, {})
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """ Tests that the fetch goes on when the caller who started it gives up. """
+
+        async def run():
+            first = asyncio.ensure_future(self.flights.do("tener", self.fetch))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(self.flights.do("tener", self.fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(self.loop.run_until_complete(run()), {"found_verb": "tener"})
+        self.assertEqual(self.calls, 1)
+
+    def test_call_is_cancelled_once_every_caller_gives_up(self):
+        """ Tests that a call nobody waits for anymore doesn't keep running. """
+
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.flights.do("tener", slow, timeout=0.01)
+            await asyncio.sleep(0)
+
+        self.loop.run_until_complete(run())
+        self.assertTrue(cancelled)
+        self.assertEqual(self.flights.calls, {})
+
+
+def parse_nothing(markup):
+    return None
+
+
+def parse_page(markup):
+    return {"page": markup.decode()}
+
+
+class FakeSession:
+    """Answers every request with a fixed status and counts the requests."""
+
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.requests = 0
+        self.sent = []
+        self.params = []
+        self.body = b"<html></html>"
+
+    @asynccontextmanager
+    async def get(self, url, **kwargs):
+        self.requests += 1
+        self.sent.append(kwargs.get("headers") or {})
+        self.params.append(kwargs.get("params"))
+
+        async def read():
+            return self.body
+
+        yield SimpleNamespace(status=self.status, read=read, headers=self.headers)
+
+
+class TestLookupCache(unittest.TestCase):
+    """Test cases for how lookups use the result cache."""
+
+    def setUp(self):
+        """Set up a lookup with a cache on a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.tmp.name, "cache.db"))
+        self.parsers = ParserPool(kind="thread", workers=1)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Clean up the temporary file."""
+        self.loop.close()
+        self.parsers.close()
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_nothing_found_is_cached(self):
+        """ Tests that a page without results is only fetched once. """
+
+        session = FakeSession(200)
+        lookup = Lookup(session, self.parsers, self.cache)
+        url = "https://cooljugator.com/sv/xyz"
+        for _ in range(2):
+            self.assertIsNone(self.loop.run_until_complete(lookup.fetch(url, parse_nothing, cache=True)))
+
+        self.assertEqual(session.requests, 1)
+        self.assertEqual(lookup.get_cache_metrics()["cooljugator.com"], {
+            "hits": 0, "stale_hits": 0, "negative_hits": 1, "misses": 1, "not_modified": 0, "unchanged": 0
+        })
+
+    def test_missing_page_is_cached(self):
+        """ Tests that a 404 is answered from the cache the second time. """
+
+        session = FakeSession(404)
+        lookup = Lookup(session, self.parsers, self.cache)
+        for _ in range(2):
+            with self.assertRaises(UpstreamError):
+                self.loop.run_until_complete(lookup.fetch("https://cooljugator.com/sv/xyz", parse_nothing, cache=True))
+
+        self.assertEqual(session.requests, 1)
+
+    def test_stale_result_is_served_and_refreshed(self):
+        """ Tests that a stale result is returned at once and refreshed in the background. """
+
+        session = FakeSession(200)
+        lookup = Lookup(session, self.parsers, self.cache)
+        lookup.cache_ttls["cooljugator.com"] = (-1, 3600)
+        url = "https://cooljugator.com/sv/vara"
+
+        async def run():
+            first = await lookup.fetch(url, parse_page, cache=True)
+            second = await lookup.fetch(url, parse_page, cache=True)
+            self.assertEqual(second, first)
+            self.assertEqual(len(lookup.refreshing), 1)
+            await asyncio.gather(*lookup.refreshing.values())
+
+        self.loop.run_until_complete(run())
+        self.assertEqual(session.requests, 2)
+        self.assertEqual(lookup.get_cache_metrics()["cooljugator.com"]["stale_hits"], 1)
+        self.assertEqual(lookup.refreshing, {})
+
+    def test_failed_refresh_keeps_the_stale_result(self):
+        """ Tests that an error in a background refresh is logged and the stale result still served. """
+
+        session = FakeSession(200)
+        lookup = Lookup(session, self.parsers, self.cache)
+        lookup.cache_ttls["cooljugator.com"] = (-1, 3600)
+        url = "https://cooljugator.com/sv/vara"
+
+        def parse_broken(markup):
+            raise ValueError("the page changed")
+
+        async def run():
+            first = await lookup.fetch(url, parse_page, key="vara", cache=True)
+            session.body = b"<html><p>changed</p></html>"
+            with self.assertLogs("others.lookup", level="ERROR"):
+                self.assertEqual(await lookup.fetch(url, parse_broken, key="vara", cache=True), first)
+                await asyncio.gather(*lookup.refreshing.values())
+            self.assertEqual((await self.cache.get_entry("vara"))[0], first)
+
+        self.loop.run_until_complete(run())
+        self.assertEqual(lookup.refreshing, {})
+
+    def test_stale_result_is_revalidated(self):
+        """ Tests that an unchanged page isn't parsed again, whether the provider sends validators or not. """
+
+        parsed = []
+
+        def parse(markup):
+            parsed.append(markup)
+            return parse_page(markup)
+
+        session = FakeSession(200, {"ETag": '"v1"'})
+        lookup = Lookup(session, self.parsers, self.cache)
+        lookup.cache_ttls["cooljugator.com"] = (-1, 3600)
+        url = "https://cooljugator.com/sv/vara"
+
+        async def run():
+            result = await lookup.fetch(url, parse, cache=True)
+            # Unchanged body without a 304
+            self.assertEqual(await lookup.fetch(url, parse, cache=True), result)
+            await asyncio.gather(*lookup.refreshing.values())
+            self.assertEqual(session.sent[-1]["If-None-Match"], '"v1"')
+
+            # 304
+            session.status = 304
+            self.assertEqual(await lookup.fetch(url, parse, cache=True), result)
+            await asyncio.gather(*lookup.refreshing.values())
+            self.assertEqual(await self.cache.get(make_key("validators", make_key(url))), {"etag": '"v1"', "last_modified": None, "hash": ANY})
+
+        self.loop.run_until_complete(run())
+        self.assertEqual(len(parsed), 1)
+        metrics = lookup.get_cache_metrics()["cooljugator.com"]
+        self.assertEqual((metrics["unchanged"], metrics["not_modified"]), (1, 1))
+
+    def test_timeouts_are_bounded_by_the_deadline(self):
+        """ Tests that a request doesn't wait on its provider for longer than the command has left. """
+
+        lookup = Lookup(FakeSession(200), self.parsers, self.cache)
+        lookup.connect_timeout, lookup.read_timeout = 3, 10
+        self.assertEqual((lookup.timeout("cooljugator.com").sock_connect, lookup.timeout("cooljugator.com").sock_read), (3, 10))
+
+        async def run(budget):
+            start_deadline(budget)
+            return lookup.timeout("cooljugator.com")
+
+        timeout = self.loop.run_until_complete(run(2))
+        self.assertLessEqual(timeout.sock_connect, 2)
+        self.assertLessEqual(timeout.sock_read, 2)
+        self.assertEqual(self.loop.run_until_complete(run(60)).sock_read, 10)
+        with self.assertRaises(DeadlineExceeded):
+            self.loop.run_until_complete(run(-1))
+
+    def test_open_circuit_is_probed(self):
+        """ Tests that a provider whose circuit is open is probed in the background and closed once it recovers. """
+
+        session = FakeSession(503)
+        lookup = Lookup(session, self.parsers, self.cache)
+        lookup.failure_threshold, lookup.reset_timeout = 1, 0
+        url = "https://cooljugator.com/sv/vara"
+        with self.assertRaises(UpstreamError):
+            self.loop.run_until_complete(lookup.fetch(url, parse_page, headers={"User-Agent": "test"}, params={"w": "vara"}))
+        self.assertEqual(lookup.breaker("cooljugator.com").state, "half-open")
+
+        # Still failing, so it stays open
+        self.assertEqual(self.loop.run_until_complete(lookup.probe()), 1)
+        self.assertEqual(session.sent[-1], {"User-Agent": "test"})
+        self.assertEqual(session.params[-1], {"w": "vara"})
+        self.assertEqual(lookup.breaker("cooljugator.com").get_metrics()["opened"], 2)
+
+        session.status = 200
+        self.assertEqual(self.loop.run_until_complete(lookup.probe()), 1)
+        self.assertEqual(lookup.breaker("cooljugator.com").state, "closed")
+        self.assertEqual(self.loop.run_until_complete(lookup.probe()), 0)
+
+    def test_read_stops_after_section(self):
+        """ Tests that a page is only downloaded up to the end of the section its parser needs. """
+
+        page = b'<html><body><div class="word-wrap"><div>falar</div></div>' + b'<p>footer</p>' * 100000 + b'</body></html>'
+        closed = []
+
+        async def iter_chunked(size):
+            for start in range(0, len(page), size):
+                yield page[start:start + size]
+
+        response = SimpleNamespace(content=SimpleNamespace(iter_chunked=iter_chunked), close=lambda: closed.append(True))
+        lookup = Lookup(FakeSession(200), self.parsers, self.cache)
+        body = self.loop.run_until_complete(lookup._read(response, '.word-wrap'))
+        self.assertLess(len(body), len(page))
+        self.assertIn(b'falar</div></div>', body)
+        self.assertEqual((closed, lookup.truncated_reads), ([True], 1))
+
+        # Without the section the whole page is read
+        body = self.loop.run_until_complete(lookup._read(response, '#examples-content'))
+        self.assertEqual(body, page)
+
+        # The section's end is found even when its tags are split between chunks
+        page = b'<div data-class="word-wrap"></div><DIV class="a word-wrap"><div class="word-wrapper"></div></Div><p>footer</p>'
+        watcher = scrapers.SectionWatcher('.word-wrap')
+        read = next(end for end in range(1, len(page) + 1) if watcher.feed(page[end - 1:end]))
+        self.assertEqual(page[:read], page[:page.index(b'</Div>') + 6])
+
+    def test_popular_lookups_are_prefetched(self):
+        """ Tests that the logged lookups are fetched into the cache on warm-up. """
+
+        log = QueryLog(os.path.join(self.tmp.name, "queries.db"))
+        session = FakeSession(200)
+        lookup = Lookup(session, self.parsers, self.cache, log)
+        url = "https://cooljugator.com/sv/vara"
+        # Lookups sent with credentials aren't logged
+        self.loop.run_until_complete(lookup.fetch("https://cooljugator.com/sv/äta", parse_page, cache=True, headers={"Authorization": "secret"}))
+        self.assertEqual(self.loop.run_until_complete(log.top(5)), [])
+        self.loop.run_until_complete(lookup.fetch(url, parse_page, cache=True, headers={"User-Agent": "test"}))
+        self.assertEqual(self.loop.run_until_complete(log.top(5))[0][1]["headers"], {"User-Agent": "test"})
+
+        # A restart with a cold cache
+        cache = ResultCache(os.path.join(self.tmp.name, "cold.db"))
+        lookup = Lookup(session, self.parsers, cache, log)
+        self.assertEqual(self.loop.run_until_complete(lookup.warm_up(10)), 1)
+        self.assertEqual(self.loop.run_until_complete(lookup.warm_up(10)), 0)
+        self.assertEqual(session.requests, 3)
+        self.assertEqual(self.loop.run_until_complete(lookup.fetch(url, parse_page, cache=True)), {"page": "<html></html>"})
+        self.assertEqual(session.requests, 3)
+        cache.close()
+        log.close()
@@ -0,0 +1,29 @@
+import unittest
+
+from others.normalization import make_query, normalize
+
+
+class TestNormalization(unittest.TestCase):
+    """Test cases for the canonical form of searches."""
+
+    def test_equivalent_searches_share_a_key(self):
+        """ Tests that case, composition and whitespace don't change the cache key. """
+
+        keys = {make_query('reverso', 'french', text).key for text in ("Être", "être", "être", "  être ")}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(normalize("to   be\tor"), "to be or")
+
+    def test_language_rules(self):
+        """ Tests the languages with their own rules. """
+
+        self.assertEqual(normalize("Haus", 'german_nouns'), "Haus")
+        self.assertEqual(normalize("Heißen", 'german'), "heißen")
+        self.assertEqual(normalize("IRMAK", 'turkish'), "ırmak")
+        self.assertEqual(normalize("dom ek", 'polish_declension'), "domek")
+
+    def test_url_is_percent_encoded(self):
+        """ Tests that the term is encoded once, reserved characters included. """
+
+        query = make_query('lyrics', None, "100% AC/DC & more")
+        self.assertEqual(query.url("https://www.lyrics.com/lyrics/{term}"), "https://www.lyrics.com/lyrics/100%25%20ac%2Fdc%20%26%20more")
+        self.assertEqual(make_query('reverso', 'french', "être").url("{code}/{term}", code="fr"), "fr/%C3%AAtre")
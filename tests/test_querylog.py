@@ -0,0 +1,48 @@
+import unittest
+import asyncio
+import os
+import tempfile
+
+from others.querylog import QueryLog
+
+
+class TestQueryLog(unittest.TestCase):
+    """Test cases for the popular lookups log."""
+
+    def setUp(self):
+        """Set up a log on a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queries.db")
+        self.log = QueryLog(self.path, max_entries=2)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Clean up the temporary file."""
+        self.loop.close()
+        self.log.close()
+        self.tmp.cleanup()
+
+    def test_most_popular_lookups_are_kept(self):
+        """ Tests that the counts add up across flushes and only the most popular lookups are kept. """
+
+        for key, hits in (("être", 3), ("haben", 2), ("xyz", 1)):
+            for _ in range(hits):
+                self.log.record(key, {"url": f"https://example.com/{key}"})
+        self.loop.run_until_complete(self.log.flush())
+
+        self.log.record("haben", {"url": "https://example.com/haben"})
+        self.log.record("haben", {"url": "https://example.com/haben"})
+        self.assertEqual([key for key, _ in self.loop.run_until_complete(self.log.top(5))], ["haben", "être"])
+
+        # The counts survive a restart
+        self.log.close()
+        self.log = QueryLog(self.path, max_entries=2)
+        self.assertEqual(self.loop.run_until_complete(self.log.top(1)), [("haben", {"url": "https://example.com/haben"})])
+
+    def test_stale_lookups_are_dropped(self):
+        """ Tests that lookups not made for too long are forgotten. """
+
+        self.log.max_age = -1
+        self.log.record("ser", {"url": "https://example.com/ser"})
+        self.assertEqual(self.loop.run_until_complete(self.log.top(5)), [])
+
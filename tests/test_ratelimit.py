@@ -0,0 +1,79 @@
+import unittest
+import asyncio
+import os
+import tempfile
+import time
+from unittest import mock
+
+from others.ratelimit import SQLiteCommandLimitStore
+
+
+class TestCommandLimitStore(unittest.TestCase):
+    """Test cases for the daily command limit store."""
+
+    def setUp(self):
+        """Set up a store on a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "limits.db")
+        self.store = SQLiteCommandLimitStore(self.path, window=60, max_entries=2)
+        self.loop = asyncio.new_event_loop()
+        # Windows are aligned, so the tests start at the beginning of one to not cross into the next
+        self.now = time.time() // 60 * 60
+        self.clock = mock.patch("others.ratelimit.time.time", return_value=self.now)
+        self.clock.start()
+
+    def tearDown(self):
+        """Clean up the temporary file."""
+        self.clock.stop()
+        self.loop.close()
+        self.store.close()
+        self.tmp.cleanup()
+
+    def hit(self, store, user_id, limit=2):
+        return self.loop.run_until_complete(store.hit(user_id, limit))
+
+    def test_limit_is_enforced_and_refunded(self):
+        """ Tests that hits stop at the limit and refunds give one back. """
+
+        self.assertTrue(self.hit(self.store, 1))
+        self.assertTrue(self.hit(self.store, 1))
+        self.assertFalse(self.hit(self.store, 1))
+        self.loop.run_until_complete(self.store.refund(1))
+        self.assertTrue(self.hit(self.store, 1))
+
+    def test_window_expires(self):
+        """ Tests that a new window starts once the current one is over. """
+
+        self.assertTrue(self.hit(self.store, 1))
+        self.assertTrue(self.hit(self.store, 1))
+        with mock.patch("others.ratelimit.time.time", return_value=self.now + 61):
+            self.assertTrue(self.hit(self.store, 1))
+
+    def test_counters_survive_restart(self):
+        """ Tests that flushed and evicted counters are loaded back. """
+
+        for user_id in (1, 2, 3):
+            self.hit(self.store, user_id)
+            self.hit(self.store, user_id)
+        self.assertLessEqual(len(self.store.counters), 2)
+        self.store.close()
+
+        self.store = SQLiteCommandLimitStore(self.path, window=60)
+        for user_id in (1, 2, 3):
+            self.assertFalse(self.hit(self.store, user_id))
+
+    def test_processes_add_up(self):
+        """ Tests that two stores sharing the file add their hits instead of overwriting each other's. """
+
+        other = SQLiteCommandLimitStore(self.path, window=60)
+        try:
+            self.assertTrue(self.hit(self.store, 1, limit=3))
+            self.assertTrue(self.hit(other, 1, limit=3))
+            self.assertTrue(self.hit(other, 1, limit=3))
+            self.loop.run_until_complete(self.store.flush())
+            self.loop.run_until_complete(other.flush())
+
+            self.assertFalse(self.hit(self.store, 1, limit=3))
+            self.assertFalse(self.hit(other, 1, limit=3))
+        finally:
+            other.close()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from others.wordlist import WordList, build
+
+
+class TestWordList(unittest.TestCase):
+    """Test cases for the memory-mapped, front-coded word lists."""
+
+    def setUp(self):
+        """Set up a word list spanning several blocks."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "words.words")
+        self.words = sorted({"être", "étudier", "parler", "partir", "parcourir", "aimer", "finir", "ça"} | {f"mot{i}" for i in range(100)})
+        build(self.words + ["parler", ""], self.path, block_size=4)
+        self.wordlist = WordList(self.path)
+
+    def tearDown(self):
+        """Unmap and remove the word list."""
+        self.wordlist.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """ Tests that every word is read back once, in order. """
+
+        self.assertEqual(list(self.wordlist), self.words)
+        self.assertEqual(len(self.wordlist), len(self.words))
+
+    def test_contains(self):
+        """ Tests membership, including the first and last words and words between blocks. """
+
+        for word in self.words:
+            self.assertIn(word, self.wordlist)
+        for word in ("", "a", "mot100", "parl", "zzz", "étudiera"):
+            self.assertNotIn(word, self.wordlist)
+
+    def test_complete_across_blocks(self):
+        """ Tests that prefix searches continue into the following blocks and stop at the limit. """
+
+        self.assertEqual(self.wordlist.complete("par"), ["parcourir", "parler", "partir"])
+        self.assertEqual(self.wordlist.complete("mot1", limit=3), ["mot1", "mot10", "mot11"])
+        self.assertEqual(len(self.wordlist.complete("mot", limit=50)), 50)
+        self.assertEqual(self.wordlist.complete("é"), ["étudier"])
+        self.assertEqual(self.wordlist.complete("q"), [])
+
+    def test_smaller_than_the_text_file(self):
+        """ Tests that shared prefixes are only stored once per block, offsetting the header and offset table. """
+
+        self.assertLess(os.path.getsize(self.path), sum(len(word.encode()) + 1 for word in self.words))
+
+    def test_rejects_other_files(self):
+        """ Tests that a file in another format isn't read as a word list. """
+
+        path = os.path.join(self.directory.name, "other.words")
+        with open(path, "wb") as f:
+            f.write(b"not a word list at all")
+        with self.assertRaises(ValueError):
+            WordList(path)